@@ -0,0 +1,190 @@
+"""Scrape company information from Spyur.am
+
+The package can be driven from the command line (``python -m spyur`` or
+``python CompanyScraper.py``) or from code::
+
+    import spyur
+
+    for record in spyur.crawl(["real_estate"], max_pages=2, delay=1.0):
+        print(record["name"], record["phones"])
+
+Every public name is loaded from its submodule on first access, so
+importing the package is cheap and requests and BeautifulSoup are only
+imported once something is fetched or parsed.
+"""
+import importlib
+
+_EXPORTS = {
+    # config
+    "BASE_URL": "config",
+    "CATEGORIES": "config",
+    "HEADERS": "config",
+    "MAX_BODY_BYTES": "config",
+    "MAX_RETRIES": "config",
+    "RETRY_BACKOFF": "config",
+    "MAX_RETRY_AFTER": "config",
+    "LINK_CACHE_TTL": "config",
+    "TAXONOMY_CACHE_PATH": "config",
+    "TAXONOMY_TTL": "config",
+    "TUNING_STATE_PATH": "config",
+    # profiles
+    "ExtractionProfile": "profiles",
+    "CompiledProfile": "profiles",
+    "first_match": "profiles",
+    "first_non_empty": "profiles",
+    "DEFAULT_PROFILE": "profiles",
+    "FAST_PROFILE": "profiles",
+    "PROFILES": "profiles",
+    "CATEGORY_PROFILES": "profiles",
+    "default_compiled_profile": "profiles",
+    "load_profile": "profiles",
+    # mockserver
+    "MockSite": "mockserver",
+    "FaultProfile": "mockserver",
+    "MockSpyurServer": "mockserver",
+    "serve_mock_site": "mockserver",
+    # cdc
+    "load_records_csv": "cdc",
+    "RecordDiff": "cdc",
+    # progress
+    "CrawlProgress": "progress",
+    # tuning
+    "ConcurrencyTuner": "tuning",
+    # hedging
+    "RequestHedger": "hedging",
+    # memo
+    "MEMO_SIZE": "memo",
+    "MEMO_MAX_LENGTH": "memo",
+    "register_memo": "memo",
+    "memoized": "memo",
+    "memo_stats": "memo",
+    "merge_memo_stats": "memo",
+    "clear_memo_caches": "memo",
+    "print_memo_summary": "memo",
+    # phones
+    "PhoneExtractor": "phones",
+    "PHONE_EXTRACTOR": "phones",
+    "extract_phones": "phones",
+    "benchmark_phone_extractor": "phones",
+    # output
+    "StreamingCsvWriter": "output",
+    "PartitionedCsvWriter": "output",
+    "save_to_csv": "output",
+    "CompanyStore": "output",
+    "print_store_lookup": "output",
+    # listing
+    "PagingInfo": "listing",
+    "ListingPage": "listing",
+    "extract_paging_info": "listing",
+    "find_next_indicator_href": "listing",
+    "ListingPageParser": "listing",
+    "LISTING_CHUNK_SIZE": "listing",
+    "parse_listing": "listing",
+    "PaginationScheme": "listing",
+    "find_next_page_url": "listing",
+    # cleaning
+    "clean_director_name": "cleaning",
+    "clean_address": "cleaning",
+    "strip_agency_label": "cleaning",
+    # fetching
+    "RateLimiter": "fetching",
+    "PageCache": "fetching",
+    "imap_bounded": "fetching",
+    "HTML_CONTENT_TYPES": "fetching",
+    "DOWNLOAD_CHUNK_SIZE": "fetching",
+    "PageRejected": "fetching",
+    "HTTPStatusError": "fetching",
+    "parse_retry_after": "fetching",
+    "site_host": "fetching",
+    # scheduler
+    "HISTORY_ERROR_PENALTY": "scheduler",
+    "CrawlHistory": "scheduler",
+    "CrawlScheduler": "scheduler",
+    # links
+    "DNS_CACHE_TTL": "links",
+    "LINK_FAILURE_TTL": "links",
+    "LinkValidator": "links",
+    # records
+    "empty_company_info": "records",
+    "is_empty_record": "records",
+    "is_spyur_own_page": "records",
+    "LANGUAGES": "records",
+    "COMPANY_PATH_PATTERN": "records",
+    "company_id": "records",
+    "language_variant_url": "records",
+    "merge_language_variants": "records",
+    "is_company_url": "records",
+    # addresses
+    "CITIES": "addresses",
+    "DISTRICTS": "addresses",
+    "STREETS": "addresses",
+    "STREET_TYPES": "addresses",
+    "ADDRESS_FIELDS": "addresses",
+    "FLOOR_RE": "addresses",
+    "BUILDING_RE": "addresses",
+    "STREET_RE": "addresses",
+    "HOUSE_RE": "addresses",
+    "NAME_HOUSE_RE": "addresses",
+    "COUNTRY_RE": "addresses",
+    "DISTRICT_SUFFIX_RE": "addresses",
+    "fold": "addresses",
+    "GazetteerTrie": "addresses",
+    "Gazetteer": "addresses",
+    "AddressNormalizer": "addresses",
+    "normalize_addresses_csv": "addresses",
+    # archive
+    "PageArchive": "archive",
+    "decode_body": "archive",
+    # reextraction
+    "iter_archive_tasks": "reextraction",
+    "iter_cache_tasks": "reextraction",
+    "reextract": "reextraction",
+    # engine
+    "CompanyScraper": "engine",
+    "get_default_engine": "engine",
+    "iter_company_links": "engine",
+    "get_company_links": "engine",
+    "extract_company_info": "engine",
+    "parse_company_info": "engine",
+    # dedup
+    "LEGAL_FORM_RE": "dedup",
+    "normalize_company_name": "dedup",
+    "website_domain": "dedup",
+    "DedupIndex": "dedup",
+    "merge_company_records": "dedup",
+    "dedup_records": "dedup",
+    # taxonomy
+    "list_categories": "taxonomy",
+    "resolve_category": "taxonomy",
+    "YELLOW_PAGES_URL": "taxonomy",
+    "CATEGORY_PATH_TEMPLATE": "taxonomy",
+    "discover_categories": "taxonomy",
+    "PAGE_NUMBER_RE": "taxonomy",
+    "estimate_category": "taxonomy",
+    "load_taxonomy": "taxonomy",
+    "save_taxonomy": "taxonomy",
+    "get_taxonomy": "taxonomy",
+    "category_cost": "taxonomy",
+    "plan_shards": "taxonomy",
+    "parse_shard_spec": "taxonomy",
+    "print_shard_plan": "taxonomy",
+    # api
+    "iter_all_categories": "api",
+    "scrape_all_categories": "api",
+    "main": "api",
+    "crawl": "api",
+    "open_delta": "api",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
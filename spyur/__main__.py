@@ -0,0 +1,4 @@
+"""Run the command line with ``python -m spyur``"""
+from .cli import run
+
+run()
@@ -0,0 +1,368 @@
+"""Address parsing against a local gazetteer of Armenian cities, districts and streets"""
+import re
+import csv
+import json
+import time
+from functools import lru_cache
+
+from .memo import register_memo
+
+# Cities and towns, with the other spellings seen on Spyur.am
+CITIES = {
+    "Երևան": ["Երեւան", "Yerevan", "Ереван"],
+    "Գյումրի": ["Gyumri", "Гюмри"],
+    "Վանաձոր": ["Vanadzor", "Ванадзор"],
+    "Վաղարշապատ": ["Էջմիածին", "Vagharshapat", "Etchmiadzin", "Вагаршапат", "Эчмиадзин"],
+    "Աբովյան": ["Abovyan", "Абовян"],
+    "Կապան": ["Kapan", "Капан"],
+    "Հրազդան": ["Hrazdan", "Раздан"],
+    "Արմավիր": ["Armavir", "Армавир"],
+    "Արտաշատ": ["Artashat", "Арташат"],
+    "Իջևան": ["Իջեւան", "Ijevan", "Иджеван"],
+    "Գավառ": ["Gavar", "Гавар"],
+    "Գորիս": ["Goris", "Горис"],
+    "Չարենցավան": ["Charentsavan", "Чаренцаван"],
+    "Արարատ": ["Ararat", "Арарат"],
+    "Մասիս": ["Masis", "Масис"],
+    "Սևան": ["Սեւան", "Sevan", "Севан"],
+    "Աշտարակ": ["Ashtarak", "Аштарак"],
+    "Դիլիջան": ["Dilijan", "Дилижан"],
+    "Սիսիան": ["Sisian", "Сисиан"],
+    "Ալավերդի": ["Alaverdi", "Алаверди"],
+    "Ստեփանավան": ["Stepanavan", "Степанаван"],
+    "Մարտունի": ["Martuni", "Мартуни"],
+    "Սպիտակ": ["Spitak", "Спитак"],
+    "Վարդենիս": ["Vardenis", "Варденис"],
+    "Եղվարդ": ["Yeghvard", "Егвард"],
+    "Մեղրի": ["Meghri", "Мегри"],
+    "Բերդ": ["Berd", "Берд"],
+    "Եղեգնաձոր": ["Yeghegnadzor", "Ехегнадзор"],
+    "Ջերմուկ": ["Jermuk", "Джермук"],
+    "Վեդի": ["Vedi", "Веди"],
+    "Նոր Հաճն": ["Nor Hachn", "Нор Ачин"],
+    "Ծաղկաձոր": ["Tsaghkadzor", "Цахкадзор"],
+    "Թալին": ["Talin", "Талин"],
+    "Ապարան": ["Aparan", "Апаран"],
+    "Քաջարան": ["Kajaran", "Каджаран"],
+    "Ագարակ": ["Agarak", "Агарак"],
+    "Մեծամոր": ["Metsamor", "Мецамор"],
+    "Տաշիր": ["Tashir", "Ташир"],
+    "Նոյեմբերյան": ["Noyemberyan", "Ноемберян"],
+    "Արթիկ": ["Artik", "Артик"],
+    "Մարալիկ": ["Maralik", "Маралик"],
+    "Ախթալա": ["Akhtala", "Ахтала"],
+    "Թումանյան": ["Tumanyan", "Туманян"],
+    "Բյուրեղավան": ["Byureghavan", "Бюрегаван"],
+    "Վայք": ["Vayk", "Вайк"],
+    "Ճամբարակ": ["Chambarak", "Чамбарак"],
+    "Ստեփանակերտ": ["Stepanakert", "Степанакерт"],
+}
+
+# Administrative districts of Yerevan
+DISTRICTS = {
+    "Աջափնյակ": ["Ajapnyak"],
+    "Ավան": ["Avan"],
+    "Արաբկիր": ["Arabkir"],
+    "Դավթաշեն": ["Davtashen"],
+    "Էրեբունի": ["Erebuni"],
+    "Կենտրոն": ["Kentron"],
+    "Մալաթիա-Սեբաստիա": ["Մալաթիա Սեբաստիա", "Malatia-Sebastia"],
+    "Նոր Նորք": ["Nor Nork"],
+    "Նորք-Մարաշ": ["Նորք Մարաշ", "Nork-Marash"],
+    "Նուբարաշեն": ["Nubarashen"],
+    "Շենգավիթ": ["Shengavit"],
+    "Քանաքեռ-Զեյթուն": ["Քանաքեռ Զեյթուն", "Kanaker-Zeytun"],
+}
+
+# Major streets, keyed by their official name with the genitive forms addresses use
+STREETS = {
+    "Աբովյան": ["Աբովյանի"],
+    "Ազատության": [],
+    "Ամիրյան": ["Ամիրյանի"],
+    "Արշակունյաց": [],
+    "Բաբաջանյան": ["Բաբաջանյանի"],
+    "Բաղրամյան": ["Բաղրամյանի", "Մարշալ Բաղրամյան", "Մարշալ Բաղրամյանի"],
+    "Գարեգին Նժդեհի": ["Նժդեհի", "Գ. Նժդեհի"],
+    "Դավիթ Անհաղթի": ["Դ. Անհաղթի"],
+    "Եզնիկ Կողբացու": ["Ե. Կողբացու", "Կողբացու"],
+    "Թբիլիսյան": [],
+    "Թումանյան": ["Թումանյանի"],
+    "Իսահակյան": ["Իսահակյանի"],
+    "Լենինգրադյան": [],
+    "Խանջյան": ["Խանջյանի"],
+    "Խորենացու": ["Մովսես Խորենացու", "Մ. Խորենացու"],
+    "Ծովակալ Իսակովի": ["Իսակովի"],
+    "Կոմիտասի": ["Կոմիտաս"],
+    "Կորյունի": ["Կորյուն"],
+    "Հալաբյան": ["Հալաբյանի"],
+    "Հանրապետության": [],
+    "Մաշտոցի": ["Մաշտոց", "Մեսրոպ Մաշտոցի", "Մ. Մաշտոցի"],
+    "Մոսկովյան": [],
+    "Նալբանդյան": ["Նալբանդյանի"],
+    "Չարենցի": ["Չարենց"],
+    "Պուշկինի": ["Պուշկին"],
+    "Ռաֆֆու": ["Րաֆֆու"],
+    "Սայաթ-Նովայի": ["Սայաթ-Նովա", "Սայաթ Նովայի"],
+    "Սարյան": ["Սարյանի"],
+    "Վազգեն Սարգսյանի": ["Վ. Սարգսյանի"],
+    "Վարդանանց": [],
+    "Տերյան": ["Տերյանի"],
+    "Տիգրան Մեծի": ["Տ. Մեծի"],
+    "Բուզանդի": ["Բուզանդ"],
+    "Արամի": [],
+    "Պարոնյան": ["Պարոնյանի"],
+    "Շիրազի": [],
+    "Արգիշտիի": [],
+    "Սեբաստիայի": [],
+}
+
+# Street type markers, abbreviated or not, mapped to their full form
+STREET_TYPES = {
+    "փողոց": "փողոց", "փող": "փողոց", "փ": "փողոց",
+    "պողոտա": "պողոտա", "պող": "պողոտա",
+    "նրբանցք": "նրբանցք", "նրբ": "նրբանցք",
+    "խճուղի": "խճուղի", "խճ": "խճուղի",
+    "հրապարակ": "հրապարակ", "հրապ": "հրապարակ",
+    "թաղամաս": "թաղամաս", "թաղ": "թաղամաս",
+    "փակուղի": "փակուղի",
+    "մայրուղի": "մայրուղի",
+}
+
+ADDRESS_FIELDS = ["address_city", "address_district", "address_street", "address_house", "address_building", "address_floor", "address_normalized"]
+
+FLOOR_RE = re.compile(r'(\d+)\s*-?\s*(?:րդ|ին|ն)?\s*հարկ')
+BUILDING_RE = re.compile(r'(\d+[\w/]*)\s*շենք|շենք\s*(\d+[\w/]*)')
+STREET_RE = re.compile(r'^(?P<name>.*?)\s*\b(?P<type>' + "|".join(sorted(STREET_TYPES, key=len, reverse=True)) + r')\b\.?\s*(?P<house>\d+[\w/]*)?\s*$')
+HOUSE_RE = re.compile(r'^(?:տուն\s*)?(\d+[\w/]*)$')
+NAME_HOUSE_RE = re.compile(r'^(?P<name>\D.*?)\s+(?P<house>\d+[\w/]*)$')
+COUNTRY_RE = re.compile(r'^(?:Հայաստան|ՀՀ|Armenia|Армения)$', re.IGNORECASE)
+DISTRICT_SUFFIX_RE = re.compile(r'\s*(?:վարչական\s+)?(?:շրջան|վ/շ|թաղամաս)\.?$')
+
+def fold(text):
+    """Fold text for gazetteer lookups: lowercase, one spelling of "և" and single spaces"""
+    return re.sub(r'\s+', ' ', text.lower().replace("եւ", "և")).strip()
+
+class GazetteerTrie:
+    """Prefix tree over folded place names
+    
+    Each name is stored character by character, so finding the longest
+    place name at a position of an address costs one walk down the tree
+    instead of a comparison against every known name.
+    """
+    
+    END = "\0"
+
+    def __init__(self):
+        self.root = {}
+        self.size = 0
+
+    def add(self, name, entry):
+        node = self.root
+        for char in fold(name):
+            node = node.setdefault(char, {})
+        if self.END not in node:
+            self.size += 1
+        node[self.END] = entry
+
+    def longest_match(self, text, start=0):
+        """Return (entry, end) for the longest name starting at text[start:], or (None, start)
+        
+        The text must already be folded. A name only matches when it ends at a
+        word boundary, so "Արամի" is not found inside "Արամիկյան".
+        """
+        node = self.root
+        best = (None, start)
+        for position in range(start, len(text)):
+            node = node.get(text[position])
+            if node is None:
+                break
+            end = position + 1
+            if self.END in node and (end == len(text) or not text[end].isalnum()):
+                best = (node[self.END], end)
+        return best
+
+class Gazetteer:
+    """In-memory index of Armenian cities, Yerevan districts and streets
+    
+    Args:
+        path (str, optional): JSON file with extra places, shaped like
+            {"cities": {name: [aliases]}, "districts": {...}, "streets": {...}},
+            merged over the built-in lists. Defaults to the built-in lists only.
+    """
+    
+    KINDS = ("cities", "districts", "streets")
+
+    def __init__(self, path=None):
+        places = {"cities": dict(CITIES), "districts": dict(DISTRICTS), "streets": dict(STREETS)}
+        if path:
+            with open(path, "r", encoding="utf-8") as f:
+                extra = json.load(f)
+            for kind in self.KINDS:
+                entries = extra.get(kind, {})
+                if isinstance(entries, list):
+                    entries = {name: [] for name in entries}
+                places[kind].update(entries)
+        self.tries = {kind: GazetteerTrie() for kind in self.KINDS}
+        for kind, entries in places.items():
+            for name, aliases in entries.items():
+                for spelling in [name] + list(aliases):
+                    self.tries[kind].add(spelling, name)
+
+    def find(self, kind, text):
+        """Return the canonical name of the first place of a kind found in folded text, or None"""
+        trie = self.tries[kind]
+        for start in range(len(text)):
+            if start and text[start - 1].isalnum():
+                continue
+            entry, _ = trie.longest_match(text, start)
+            if entry:
+                return entry
+        return None
+
+    def match(self, kind, text):
+        """Return the canonical name when the whole text (folded) is a place of this kind, or None"""
+        entry, end = self.tries[kind].longest_match(text)
+        return entry if entry and end == len(text) else None
+
+class AddressNormalizer:
+    """Parse cleaned addresses into components checked against a Gazetteer
+    
+    Addresses are split into city, Yerevan district, street (with its full
+    type, e.g. "Աբովյան փողոց"), house number, building (շենք) and floor
+    (հարկ), plus a normalized one-line form. Parsing is memoized, and
+    iter_normalized() works through records in batches so every distinct
+    address in a batch is parsed once.
+    
+    Args:
+        gazetteer (Gazetteer, optional): Place index. Defaults to the built-in gazetteer.
+        cache_size (int, optional): Parsed addresses kept in the LRU cache. Defaults to 100000.
+        batch_size (int, optional): Records per batch in iter_normalized(). Defaults to 500.
+    """
+
+    def __init__(self, gazetteer=None, cache_size=100000, batch_size=500):
+        self.gazetteer = gazetteer or Gazetteer()
+        self.batch_size = batch_size
+        self.parse = register_memo("address_parse", lru_cache(maxsize=cache_size)(self._parse))
+
+    def _parse(self, address):
+        components = dict.fromkeys(ADDRESS_FIELDS, "")
+        if not address:
+            return components
+        
+        text = re.sub(r'\s+', ' ', address).strip()
+        floor = FLOOR_RE.search(text)
+        if floor:
+            components["address_floor"] = floor.group(1)
+            text = text[:floor.start()] + text[floor.end():]
+        building = BUILDING_RE.search(text)
+        if building:
+            components["address_building"] = building.group(1) or building.group(2)
+            text = text[:building.start()] + text[building.end():]
+        
+        for part in (p.strip(" .;") for p in text.split(",")):
+            if not part or COUNTRY_RE.match(part):
+                continue
+            folded = fold(part)
+            
+            if not components["address_city"]:
+                city = self.gazetteer.match("cities", folded)
+                if city:
+                    components["address_city"] = city
+                    continue
+            if not components["address_district"]:
+                district = self.gazetteer.match("districts", fold(DISTRICT_SUFFIX_RE.sub("", part)))
+                if district:
+                    components["address_district"] = district
+                    continue
+            
+            street = STREET_RE.match(part)
+            if street and not components["address_street"]:
+                name = street.group("name").strip()
+                canonical = self.gazetteer.match("streets", fold(name)) or name
+                components["address_street"] = f"{canonical} {STREET_TYPES[fold(street.group('type'))]}".strip()
+                components["address_house"] = street.group("house") or ""
+                continue
+            house = HOUSE_RE.match(part)
+            if house and components["address_street"] and not components["address_house"]:
+                components["address_house"] = house.group(1)
+                continue
+            if not components["address_street"]:
+                # A known street written without its type, with or without a house number
+                name_house = NAME_HOUSE_RE.match(part)
+                canonical = self.gazetteer.match("streets", fold(name_house.group("name")) if name_house else folded)
+                if canonical:
+                    components["address_street"] = canonical
+                    components["address_house"] = name_house.group("house") if name_house else ""
+                    continue
+            if not components["address_city"]:
+                # A city mentioned inside a longer part, e.g. "ք. Գյումրի"
+                components["address_city"] = self.gazetteer.find("cities", folded) or ""
+        
+        if not components["address_city"] and components["address_district"]:
+            components["address_city"] = "Երևան"
+        components["address_normalized"] = self.format(components)
+        return components
+
+    @staticmethod
+    def format(components):
+        """Join parsed components into one normalized address line
+        
+        Floors take the Armenian ordinal suffix: "1-ին հարկ", "3-րդ հարկ".
+        """
+        street = " ".join(filter(None, [components["address_street"], components["address_house"]]))
+        parts = [
+            components["address_city"],
+            components["address_district"],
+            street,
+            f"{components['address_building']} շենք" if components["address_building"] else "",
+            f"{components['address_floor']}-{'ին' if components['address_floor'] == '1' else 'րդ'} հարկ" if components["address_floor"] else "",
+        ]
+        return ", ".join(part for part in parts if part)
+
+    def normalize(self, record):
+        """Add the parsed address components to a record"""
+        record.update(self.parse(record.get("address", "")))
+        return record
+
+    def normalize_batch(self, records):
+        """Normalize a list of records, parsing each distinct address once"""
+        parsed = {address: self.parse(address) for address in {record.get("address", "") for record in records}}
+        for record in records:
+            record.update(parsed[record.get("address", "")])
+        return records
+
+    def iter_normalized(self, records):
+        """Normalize a stream of records in batches of batch_size"""
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                yield from self.normalize_batch(batch)
+                batch = []
+        if batch:
+            yield from self.normalize_batch(batch)
+
+def normalize_addresses_csv(input_path, output_path, gazetteer_path=None):
+    """Add parsed address components to every record of a CSV file
+    
+    Args:
+        input_path (str): CSV written by a crawl
+        output_path (str): Path of the CSV with the address_* columns added
+        gazetteer_path (str, optional): Extra gazetteer JSON (see Gazetteer)
+    
+    Returns:
+        int: Number of records written
+    """
+    from .output import StreamingCsvWriter
+    
+    normalizer = AddressNormalizer(Gazetteer(gazetteer_path))
+    start = time.perf_counter()
+    with open(input_path, "r", newline="", encoding="utf-8") as f:
+        with StreamingCsvWriter(output_path) as writer:
+            for record in normalizer.iter_normalized(csv.DictReader(f)):
+                writer.write(record)
+    elapsed = time.perf_counter() - start
+    cache = normalizer.parse.cache_info()
+    print(f"🏠 Normalized {writer.count} addresses ({cache.currsize} distinct) in {elapsed:.2f}s")
+    print(f"CSV file saved at: {output_path}")
+    return writer.count
@@ -0,0 +1,272 @@
+"""Crawl entry points: one category, every category, and the crawl() API"""
+import os
+import traceback
+
+from .cdc import RecordDiff, load_records_csv
+from .config import CATEGORIES
+from .dedup import DedupIndex, dedup_records
+from .memo import print_memo_summary
+from .output import PartitionedCsvWriter, StreamingCsvWriter
+from .taxonomy import resolve_category
+
+def iter_all_categories(engine, max_pages=5, max_companies=1000, categories=None):
+    """Yield the records of every category, one category after another
+    
+    Args:
+        engine (CompanyScraper): Engine to scrape with
+        max_pages (int, optional): Maximum number of pages to scrape per category. Defaults to 5.
+        max_companies (int, optional): Maximum number of companies to scrape per category. Defaults to 1000.
+        categories (dict, optional): Category names mapped to list URLs. Defaults to CATEGORIES.
+        
+    Yields:
+        dict: Company information
+    """
+    categories = CATEGORIES if categories is None else categories
+    if engine.progress is not None:
+        engine.progress.plan(categories)
+    for category_name, category_url in categories.items():
+        if engine.scheduler and engine.scheduler.expired():
+            engine.log(f"⏱️ Skipping category '{category_name}': time budget used up", always=True)
+            continue
+        engine.log(f"\n{'=' * 80}\n📂 Processing category: {category_name.upper()}\n{'=' * 80}", always=True)
+        
+        added = 0
+        for company_info in engine.scrape_category(category_url, max_pages=max_pages, max_companies=max_companies, category_name=category_name):
+            added += 1
+            yield company_info
+        
+        if added:
+            engine.log(f"✅ Added {added} companies from category '{category_name}'", always=True)
+        else:
+            engine.log(f"❌ No companies found in category '{category_name}'", always=True)
+
+def open_delta(previous_path, delta_path=None, output_path=None):
+    """Start a change-data-capture delta against a previous CSV snapshot
+    
+    Args:
+        previous_path (str): CSV output of an earlier run
+        delta_path (str, optional): Path of the JSONL delta. Defaults to the output path
+            with a .delta.jsonl suffix, or spyur.delta.jsonl without one.
+        output_path (str, optional): CSV output of this run
+        
+    Returns:
+        RecordDiff: Diff to compare each fresh record with
+    """
+    if not delta_path:
+        delta_path = os.path.splitext(output_path)[0] + ".delta.jsonl" if output_path else "spyur.delta.jsonl"
+    return RecordDiff(load_records_csv(previous_path), delta_path)
+
+def _finish_delta(diff, engine):
+    """Finish a crawl's delta, leaving out the companies and categories the engine failed to crawl"""
+    for source_url in engine.failed_urls:
+        diff.skip(source_url)
+    for category_name in engine.incomplete_categories:
+        diff.skip_category(category_name)
+    diff.finish(crawled_categories_only=True)
+
+def scrape_all_categories(max_pages=5, max_companies=1000, output_path=None, engine=None, dedup=None, categories=None,
+                          previous_path=None, delta_path=None, partition_by=None, max_rows=None, compression=None):
+    """Scrape all categories defined in the CATEGORIES dictionary
+    
+    Records from every category are streamed into a single CSV file as they
+    are scraped, or into a directory of CSV parts with a manifest.json when
+    partition_by, max_rows or compression is given (see PartitionedCsvWriter).
+    
+    Args:
+        max_pages (int, optional): Maximum number of pages to scrape per category. Defaults to 5.
+        max_companies (int, optional): Maximum number of companies to scrape per category. Defaults to 1000.
+        output_path (str, optional): Path to save the CSV file. Defaults to user's Documents folder.
+        engine (CompanyScraper, optional): Engine to scrape with. Defaults to the shared engine.
+        dedup (str, optional): Remove companies listed in several categories or branches,
+            "drop" or "merge" (see dedup_records). Defaults to no deduplication.
+        categories (dict, optional): Category names mapped to list URLs, e.g. one shard
+            of a plan_shards() plan. Defaults to CATEGORIES.
+        previous_path (str, optional): CSV snapshot of an earlier run; added, updated and
+            removed fields are written to a JSONL delta (see open_delta)
+        delta_path (str, optional): Path of the JSONL delta
+        partition_by (str, optional): "category" to write one part per category
+        max_rows (int, optional): Rows per part before rolling over to a new one
+        compression (str, optional): Compress finished parts in the background, "gzip" or "zstd"
+    """
+    from .engine import get_default_engine
+    
+    engine = engine or get_default_engine()
+    
+    # Determine output path
+    if not output_path:
+        output_path = os.path.expanduser("~/Documents/spyur_all_categories.csv")
+    
+    records = iter_all_categories(engine, max_pages=max_pages, max_companies=max_companies, categories=categories)
+    index = DedupIndex()
+    if dedup:
+        records = dedup_records(records, index=index, mode=dedup)
+    
+    if partition_by or max_rows or compression:
+        output_path = os.path.splitext(output_path)[0]
+        writer = PartitionedCsvWriter(output_path, partition_by=partition_by, max_rows=max_rows, compression=compression)
+    else:
+        writer = StreamingCsvWriter(output_path)
+    
+    diff = open_delta(previous_path, delta_path, output_path) if previous_path else None
+    try:
+        with writer:
+            for company_info in records:
+                writer.write(company_info)
+                if diff:
+                    diff.compare(company_info)
+    finally:
+        if diff:
+            _finish_delta(diff, engine)
+    
+    if dedup:
+        print(f"\n🔁 Removed {index.duplicates} duplicate companies out of {index.records}")
+    if writer.count:
+        print(f"\n✅ Scraped {writer.count} companies from all categories and saved to {output_path}")
+        print(f"CSV file saved at: {output_path}")
+        if isinstance(writer, PartitionedCsvWriter):
+            print(f"🗜️ {len(writer.partitions)} parts listed in {writer.manifest_path}")
+        print_memo_summary()
+    else:
+        print("\n❌ No company data was scraped from any category.")
+    if diff:
+        diff.print_summary()
+
+def main(category=None, max_pages=10, max_companies=1000, output_path=None, return_data=False, engine=None, dedup=None,
+         previous_path=None, delta_path=None):
+    """Main function to scrape company information
+    
+    Records are streamed to the CSV file as they are scraped. They are only
+    collected in memory when return_data is True.
+    
+    Args:
+        category (str, optional): Category to scrape. Defaults to real_estate.
+        max_pages (int, optional): Maximum number of pages to scrape. Defaults to 10.
+        max_companies (int, optional): Maximum number of companies to scrape. Defaults to 1000.
+        output_path (str, optional): Path to save the CSV file. Defaults to user's Documents folder.
+        return_data (bool, optional): Whether to return the scraped data. Defaults to False.
+        engine (CompanyScraper, optional): Engine to scrape with. Defaults to the shared engine.
+        dedup (str, optional): Remove duplicate branch listings, "drop" or "merge"
+            (see dedup_records). Defaults to no deduplication.
+        previous_path (str, optional): CSV snapshot of an earlier run; added, updated and
+            removed fields are written to a JSONL delta (see open_delta)
+        delta_path (str, optional): Path of the JSONL delta
+        
+    Returns:
+        list: List of company data dictionaries if return_data is True, otherwise None
+    """
+    from .engine import get_default_engine
+    
+    try:
+        engine = engine or get_default_engine()
+        _, category_name = resolve_category(category)
+        
+        print(f"🔍 Fetching company links from category '{category_name}', scanning up to {max_pages} pages and {max_companies} companies...")
+        
+        companies_data = [] if return_data else None
+        samples = []
+        count = 0
+        writer = StreamingCsvWriter(output_path) if output_path else None
+        diff = open_delta(previous_path, delta_path, output_path) if previous_path else None
+        records = engine.scrape_category(category, max_pages=max_pages, max_companies=max_companies)
+        if dedup:
+            records = dedup_records(records, mode=dedup)
+        try:
+            for company_info in records:
+                count += 1
+                if writer:
+                    writer.write(company_info)
+                if diff:
+                    diff.compare(company_info)
+                if companies_data is not None:
+                    companies_data.append(company_info)
+                if len(samples) < 3:
+                    samples.append(company_info)
+        finally:
+            if writer:
+                writer.close()
+            if diff:
+                _finish_delta(diff, engine)
+        
+        if count:
+            if output_path:
+                print(f"\n✅ Scraped {count} companies from category '{category_name}' and saved to {output_path}")
+                print(f"CSV file saved at: {output_path}")
+                
+                # Print sample of the data
+                print("\nSample of scraped data:\n")
+                for i, company in enumerate(samples, 1):
+                    print(f"Company {i}: {company['name']}")
+                    print(f"Director: {company['director']}")
+                    print(f"Address: {company['address']}")
+                    print(f"Phones: {company['phones']}")
+                    print(f"Website: {company['website']}")
+                    print(f"Social Media: {company['social_media'][:100]}{'...' if len(company['social_media']) > 100 else ''}\n")
+            else:
+                print(f"\n✅ Scraped {count} companies from category '{category_name}'")
+            print_memo_summary()
+        else:
+            print(f"\n❌ No company data was scraped from category '{category_name}'")
+        if diff:
+            diff.print_summary()
+            
+        # Return the data if requested
+        if return_data:
+            return companies_data
+        return None
+    except Exception as e:
+        print(f"An error occurred during scraping: {str(e)}")
+        traceback.print_exc()
+        if return_data:
+            return []
+
+def crawl(categories=None, max_pages=5, max_companies=1000, dedup=None, engine=None, **options):
+    """Crawl categories and return an iterator over the company records
+    
+    This is the programmatic entry point: nothing is written to disk unless
+    the engine is given a sink, and records are produced lazily as the
+    iterator is consumed. An engine created here is closed once the iterator
+    is exhausted or closed.
+    
+    Args:
+        categories (str, list or dict, optional): A category key or URL, a list of them,
+            or category names mapped to list URLs. Defaults to CATEGORIES.
+        max_pages (int, optional): Maximum number of pages to scrape per category. Defaults to 5.
+        max_companies (int, optional): Maximum number of companies to scrape per category. Defaults to 1000.
+        dedup (str, optional): Remove duplicate companies, "drop" or "merge" (see dedup_records).
+            Defaults to no deduplication.
+        engine (CompanyScraper, optional): Engine to scrape with. Defaults to a new engine
+            built from options.
+        **options: CompanyScraper arguments for the new engine, e.g. delay, workers or cache_dir.
+            verbose defaults to False.
+        
+    Returns:
+        iterator: Company information dictionaries
+    """
+    if isinstance(categories, str):
+        categories = [categories]
+    if categories is not None and not isinstance(categories, dict):
+        resolved = {}
+        for category in categories:
+            list_url, category_name = resolve_category(category)
+            name, suffix = category_name, 2
+            while name in resolved:
+                name, suffix = f"{category_name}_{suffix}", suffix + 1
+            resolved[name] = list_url
+        categories = resolved
+    return _iter_crawl(categories, max_pages, max_companies, dedup, engine, options)
+
+def _iter_crawl(categories, max_pages, max_companies, dedup, engine, options):
+    own_engine = engine is None
+    if own_engine:
+        from .engine import CompanyScraper
+        
+        options.setdefault("verbose", False)
+        engine = CompanyScraper(**options)
+    try:
+        records = iter_all_categories(engine, max_pages=max_pages, max_companies=max_companies, categories=categories)
+        if dedup:
+            records = dedup_records(records, mode=dedup)
+        yield from records
+    finally:
+        if own_engine:
+            engine.close()
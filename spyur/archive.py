@@ -0,0 +1,162 @@
+"""Append-only compressed archive of raw responses"""
+import re
+import os
+import time
+import json
+import mmap
+import zlib
+import threading
+
+def _import_zstandard():
+    """Return the zstandard module, or None when it is not installed"""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+class PageArchive:
+    """Append-only archive of raw fetched pages in compressed segment files
+    
+    Every page is stored as one independently compressed frame holding a JSON
+    header (URL, status, headers, fetch time) and the raw response bytes.
+    Frames are appended to ``segment-NNNNNN.zst`` files (``.zlib`` when the
+    optional zstandard package is not installed), and ``index.jsonl`` records
+    the segment, offset and length of every frame, so a single page can be
+    read back without decompressing anything else.
+    
+    Args:
+        archive_dir (str): Directory holding the segments and the index
+        max_segment_bytes (int, optional): Size at which a new segment is started. Defaults to 256 MB.
+        compression (str, optional): "zstd" or "zlib". Defaults to zstd when available.
+    """
+
+    INDEX_NAME = "index.jsonl"
+
+    def __init__(self, archive_dir, max_segment_bytes=256 * 1024 * 1024, compression=None):
+        self.archive_dir = archive_dir
+        self.max_segment_bytes = max_segment_bytes
+        zstandard = _import_zstandard()
+        if compression is None:
+            compression = "zstd" if zstandard else "zlib"
+        if compression == "zstd" and zstandard is None:
+            raise ImportError("zstandard is required for zstd archives (pip install zstandard)")
+        if compression not in ("zstd", "zlib"):
+            raise ValueError(f"Unknown archive compression: {compression}")
+        self.compression = compression
+        self._compressor = zstandard.ZstdCompressor(level=3) if compression == "zstd" else None
+        self._lock = threading.Lock()
+        self._segment_file = None
+        self._segment_name = None
+        self._index_file = None
+        self._mmaps = {}
+        os.makedirs(archive_dir, exist_ok=True)
+
+    def _compress(self, data):
+        if self._compressor is not None:
+            return self._compressor.compress(data)
+        return zlib.compress(data, 6)
+
+    @staticmethod
+    def _decompress(segment_name, data):
+        if segment_name.endswith(".zst"):
+            zstandard = _import_zstandard()
+            if zstandard is None:
+                raise ImportError("zstandard is required to read zstd archives (pip install zstandard)")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
+
+    def _open_segment(self):
+        """Open a fresh segment for appending, after the highest existing one"""
+        if self._segment_file is not None:
+            self._segment_file.close()
+        numbers = [int(name[8:14]) for name in os.listdir(self.archive_dir) if name.startswith("segment-")]
+        extension = "zst" if self.compression == "zstd" else "zlib"
+        self._segment_name = f"segment-{max(numbers, default=0) + 1:06d}.{extension}"
+        self._segment_file = open(os.path.join(self.archive_dir, self._segment_name), "ab")
+
+    def append(self, url, status, headers, body):
+        """Store one fetched page
+        
+        Args:
+            url (str): Page URL
+            status (int): HTTP status code
+            headers (dict): Response headers
+            body (bytes): Raw response body
+        """
+        header = json.dumps({"url": url, "status": status, "headers": dict(headers), "fetched_at": time.time()}, ensure_ascii=False)
+        frame = self._compress(header.encode("utf-8") + b"\n" + body)
+        
+        with self._lock:
+            if self._segment_file is None or self._segment_file.tell() + len(frame) > self.max_segment_bytes:
+                self._open_segment()
+            if self._index_file is None:
+                self._index_file = open(os.path.join(self.archive_dir, self.INDEX_NAME), "a", encoding="utf-8")
+            offset = self._segment_file.tell()
+            self._segment_file.write(frame)
+            self._segment_file.flush()
+            # The index line is written after the frame, so every indexed frame is complete
+            entry = {"url": url, "status": status, "segment": self._segment_name, "offset": offset, "length": len(frame)}
+            self._index_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._index_file.flush()
+
+    def iter_index(self):
+        """Yield the index entries of every archived page, in fetch order"""
+        path = os.path.join(self.archive_dir, self.INDEX_NAME)
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def read(self, entry):
+        """Read one archived page back
+        
+        Args:
+            entry (dict): Index entry (see iter_index)
+            
+        Returns:
+            tuple: (header dict, body bytes)
+        """
+        segment = self._mmaps.get(entry["segment"])
+        if segment is None:
+            with open(os.path.join(self.archive_dir, entry["segment"]), "rb") as f:
+                segment = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mmaps[entry["segment"]] = segment
+        data = self._decompress(entry["segment"], segment[entry["offset"]:entry["offset"] + entry["length"]])
+        header, _, body = data.partition(b"\n")
+        return json.loads(header), body
+
+    def __iter__(self):
+        """Yield (header, body) for every archived page"""
+        for entry in self.iter_index():
+            yield self.read(entry)
+
+    def close(self):
+        with self._lock:
+            if self._segment_file is not None:
+                self._segment_file.close()
+                self._segment_file = None
+            if self._index_file is not None:
+                self._index_file.close()
+                self._index_file = None
+        for segment in self._mmaps.values():
+            segment.close()
+        self._mmaps.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def decode_body(body, headers=None, default_encoding="utf-8"):
+    """Decode a raw response body using the charset from its Content-Type header"""
+    content_type = (headers or {}).get("Content-Type") or (headers or {}).get("content-type") or ""
+    match = re.search(r'charset=([\w\-]+)', content_type, re.IGNORECASE)
+    encoding = match.group(1) if match else default_encoding
+    try:
+        return body.decode(encoding, errors="replace")
+    except LookupError:
+        return body.decode(default_encoding, errors="replace")
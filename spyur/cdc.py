@@ -0,0 +1,140 @@
+"""Change data capture: field-level deltas between a run and the previous snapshot"""
+import csv
+import json
+
+from .records import is_empty_record
+
+def load_records_csv(filepath):
+    """Load a CSV written by save_to_csv into a dict keyed by source_url
+    
+    Args:
+        filepath (str): Path of the CSV file
+        
+    Returns:
+        dict: Records keyed by source_url, in file order
+    """
+    with open(filepath, "r", newline="", encoding="utf-8") as f:
+        return {row["source_url"]: row for row in csv.DictReader(f) if row.get("source_url")}
+
+class RecordDiff:
+    """Field-level comparison of fresh records against a previous output
+    
+    Each compared record is looked up by source_url in the previous records,
+    and the fields present in both are compared. Records that are new or
+    have changed fields are written to a JSONL file as {"op": "added" |
+    "updated" | "removed", "source_url": ..., "changes": {field: {"old":
+    ..., "new": ...}}}. finish() writes the records of the
+    previous output that were not seen again as "removed". Companies whose
+    fetch failed, and records without company data, are left out: they are
+    neither compared nor reported as removed.
+    
+    The object is also a crawl sink: write() compares a record and close()
+    finishes the diff, so it can follow a live crawl as well as reextract().
+    
+    Args:
+        previous (dict): Previous records keyed by source_url
+        diff_path (str): Path of the JSONL diff file
+        ignore_fields (iterable, optional): Fields left out of the comparison
+    """
+
+    def __init__(self, previous, diff_path, ignore_fields=()):
+        self.previous = previous
+        self.diff_path = diff_path
+        self.ignore_fields = set(ignore_fields)
+        self.seen = set()
+        self.skipped = set()
+        self.skipped_categories = set()
+        self.categories = set()
+        self.added = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.removed = 0
+        self.field_changes = {}
+        self._file = open(diff_path, "w", encoding="utf-8")
+
+    def _emit(self, op, source_url, changes):
+        self._file.write(json.dumps({"op": op, "source_url": source_url, "changes": changes}, ensure_ascii=False) + "\n")
+
+    def compare(self, record):
+        """Compare one fresh record with its previous version and log the differences
+        
+        Returns:
+            dict: The changed fields as {field: {"old": ..., "new": ...}}
+        """
+        source_url = record["source_url"]
+        if record.get("category"):
+            self.categories.add(record["category"])
+        if is_empty_record(record):
+            self.skip(source_url)
+            return {}
+        self.seen.add(source_url)
+        old = self.previous.get(source_url)
+        if old is None:
+            self.added += 1
+            changes = {key: {"old": None, "new": value} for key, value in record.items()
+                       if key not in self.ignore_fields and value}
+            self._emit("added", source_url, changes)
+            return changes
+        
+        # Only fields both runs produced are compared: a column that exists on one side only,
+        # e.g. from --normalize-addresses or --validate-links, is not a change
+        changes = {}
+        for key in record:
+            if key in self.ignore_fields or key == "source_url" or key not in old:
+                continue
+            old_value = old.get(key) or ""
+            new_value = record.get(key) or ""
+            if str(old_value) != str(new_value):
+                changes[key] = {"old": old_value, "new": new_value}
+                self.field_changes[key] = self.field_changes.get(key, 0) + 1
+        if changes:
+            self.updated += 1
+            self._emit("updated", source_url, changes)
+        else:
+            self.unchanged += 1
+        return changes
+
+    def skip(self, source_url):
+        """Leave out a company whose fetch failed, so it is not reported as removed"""
+        self.skipped.add(source_url)
+
+    def skip_category(self, category):
+        """Leave out a category whose listing could not be crawled to the end"""
+        self.skipped_categories.add(category)
+
+    def write(self, record):
+        """Sink interface: compare a record"""
+        self.compare(record)
+
+    def finish(self, crawled_categories_only=False):
+        """Log the previous records that were not seen again as removed, and close the file
+        
+        Args:
+            crawled_categories_only (bool, optional): Only report previous records of the
+                categories compared in this run, for crawls covering part of the snapshot.
+                Defaults to False.
+        """
+        if self._file.closed:
+            return
+        for source_url, old in self.previous.items():
+            if crawled_categories_only and old.get("category") not in self.categories:
+                continue
+            if old.get("category") in self.skipped_categories or source_url in self.skipped:
+                continue
+            if source_url not in self.seen:
+                self.removed += 1
+                self._emit("removed", source_url, {key: {"old": value, "new": None} for key, value in old.items()
+                                                   if key not in self.ignore_fields and value})
+        self._file.close()
+
+    def close(self):
+        """Sink interface: finish the diff"""
+        self.finish()
+
+    def print_summary(self):
+        print(f"🔍 Diff: {self.added} added, {self.updated} updated, {self.unchanged} unchanged, {self.removed} removed")
+        if self.skipped or self.skipped_categories:
+            print(f"   {len(self.skipped)} failed companies and {len(self.skipped_categories)} incomplete categories left out")
+        for key, count in sorted(self.field_changes.items(), key=lambda item: -item[1]):
+            print(f"   {key}: {count} changed")
+        print(f"Diff file saved at: {self.diff_path}")
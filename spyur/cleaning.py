@@ -0,0 +1,160 @@
+"""Clean-up of scraped director and address text"""
+import re
+
+from .memo import memoized
+
+@memoized("director")
+def clean_director_name(director_text):
+    """Clean up director name by removing titles, labels, and extra information"""
+    if not director_text:
+        return ""
+        
+    # Remove Armenian label "Ղեկավար" (Manager/Director)
+    director_text = re.sub(r'\u0542\u0565\u056f\u0561\u057e\u0561\u0580\s*', '', director_text)
+    
+    # Remove common titles and positions (both English and Armenian)
+    titles_pattern = r'(?i)(director|manager|head|\u057f\u0576\u0585\u0580\u0565\u0576|ceo|president|owner|founder|\u0576\u0561\u056d\u0561\u0563\u0561\u0570|\u0570\u056b\u0574\u0576\u0561\u0564\u056b\u0580|\u057f\u0576\u0585\u0580\u0565\u0576|\u0572\u0565\u056f\u0561\u057e\u0561\u0580|\u0574\u0565\u0576\u0565\u057b\u0565\u0580|\u0562\u0561\u056a\u0576\u056b \u0572\u0565\u056f\u0561\u057e\u0561\u0580).*$'
+    director_text = re.sub(titles_pattern, '', director_text)
+    
+    # Remove position descriptions that appear after a comma
+    director_text = re.sub(r',.*$', '', director_text)
+    
+    # Remove company type labels that might appear in director field (more comprehensive)
+    company_type_patterns = [
+        # "ԱՆՇԱՐԺ ԳՈՒՅՔԻ ԳՈՐԾԱԿԱԼՈՒԹՅՈՒՆ" (REAL ESTATE AGENCY)
+        r'\u0531\u0546\u0547\u0531\u0550\u0541 \u0533\u0548\u0552\u0554\u053b \u0533\u0548\u0550\u053e\u0531\u053f\u0531\u053c\u0548\u0552\u0539\u0545\u0548\u0552\u0546\s*',
+        # "սահմանափակ պատասխանատվությամբ ընկերություն" (LLC)
+        r'\u057d\u0561\u0570\u0574\u0561\u0576\u0561\u0583\u0561\u056f \u057a\u0561\u057f\u0561\u057d\u056d\u0561\u0576\u0561\u057f\u057e\u0578\u0582\u0569\u0575\u0561\u0574\u0562 \u0568\u0576\u056f\u0565\u0580\u0578\u0582\u0569\u0575\u0578\u0582\u0576\s*',
+        # "ՍՊԸ" (LLC abbreviation)
+        r'\u054d\u054a\u0538\s*',
+        # "ՓԲԸ" (CJSC abbreviation)
+        r'\u0553\u0532\u0538\s*',
+        # Any other company type labels in Armenian
+        r'\u0563\u0578\u0580\u056e\u0561\u056f\u0561\u056c\u0578\u0582\u0569\u0575\u0578\u0582\u0576\s*',  # agency/representation
+        r'\u0568\u0576\u056f\u0565\u0580\u0578\u0582\u0569\u0575\u0578\u0582\u0576\s*',  # company
+    ]
+    
+    for pattern in company_type_patterns:
+        director_text = re.sub(pattern, '', director_text)
+    
+    # If the text is very long (likely contains mission statements or descriptions)
+    # and contains Armenian names (typically have "յան", "յանց", or "ունի" endings)
+    if len(director_text) > 40 and re.search(r'(\u0575\u0561\u0576|\u0578\u0582\u0576\u056b|\u0575\u0561\u0576\u0581)\b', director_text):
+        # Try to extract just the name - typically Armenian names are 2-3 words and end with surname
+        # Look for patterns like "Name Surname" or "Name MiddleName Surname" at the end of the text
+        name_match = re.search(r'\b([\u0531-\u0587]+\s+[\u0531-\u0587]+\s+[\u0531-\u0587]+\s*[\u0531-\u0587]*|[\u0531-\u0587]+\s+[\u0531-\u0587]+)\s*$', director_text)
+        if name_match:
+            director_text = name_match.group(1).strip()
+    
+    # Remove common location words that might appear before the name
+    location_words = [
+        r'\u056f\u0565\u0576\u057f\u0580\u0578\u0576\s+',  # "կենտրոն" (center)
+        r'\u0563\u056c\u056d\u0561\u0574\u0561\u057d\s+',  # "գլխամաս" (headquarters)
+        r'\u0563\u0580\u0561\u057d\u0565\u0576\u0575\u0561\u056f\s+',  # "գրասենյակ" (office)
+    ]
+    
+    for word in location_words:
+        director_text = re.sub(word, '', director_text)
+    
+    # Remove trailing punctuation and spaces
+    director_text = re.sub(r'[,\-:;]\s*$', '', director_text)
+    
+    # Remove extra whitespace and newlines
+    director_text = re.sub(r'\s+', ' ', director_text)
+    director_text = re.sub(r'\n+', ' ', director_text)
+    
+    return director_text.strip()
+
+@memoized("address")
+def clean_address(address_text):
+    """Clean up address text by removing phone numbers, working hours, and other non-address information"""
+    if not address_text:
+        return ""
+    
+    # Remove working days list followed by hours ("Երկ Երք Չրք Հնգ Ուրբ Շբթ Կիր 09:00-18:00")
+    address_text = re.sub(r'\u0535\u0580\u056f\s+\u0535\u0580\u0584\s+\u0549\u0580\u0584\s+\u0540\u0576\u0563\s+\u0548\u0582\u0580\u0562\s+\u0547\u0562\u0569\s+\u053f\u056b\u0580\s+\d{1,2}:\d{2}-\d{1,2}:\d{2}', '', address_text)
+    
+    # Remove labels like "գրասենյակ`" (office), "(բջջ.)" (mobile) and "Գործունեության հասցե" (Business Address)
+    address_text = re.sub(r'\u0563\u0580\u0561\u057d\u0565\u0576\u0575\u0561\u056f`', '', address_text)
+    address_text = re.sub(r'\(\u0562\u057b\u057b\.\)', '', address_text)
+    address_text = re.sub(r'\u0533\u0578\u0580\u056e\u0578\u0582\u0576\u0565\u0578\u0582\u0569\u0575\u0561\u0576 \u0570\u0561\u057d\u0581\u0565', '', address_text)
+    
+    # Remove phone numbers
+    address_text = re.sub(r'[\+\d\(\)\-\s]{7,}', '', address_text)
+    
+    # Remove working hours (handle both colon and period separators)
+    address_text = re.sub(r'\b\d{1,2}[:\.]\d{2}\s*-\s*\d{1,2}[:\.]\d{2}\b', '', address_text)
+    
+    # Remove email addresses
+    address_text = re.sub(r'\S+@\S+\.\S+', '', address_text)
+    
+    # Remove URLs
+    address_text = re.sub(r'https?://\S+', '', address_text)
+    address_text = re.sub(r'www\.\S+', '', address_text)
+    
+    # Remove common non-address text
+    non_address_patterns = [
+        r'աշխատանքային ժամեր.*$',  # Working hours
+        r'հեռ\..*$',  # Phone abbreviation
+        r'հեռախոս.*$',  # Phone
+        r'տել\..*$',  # Tel abbreviation
+        r'բջջ\..*$',  # Mobile abbreviation
+        r'էլ\..*$',  # Email abbreviation
+        r'կայք.*$',  # Website
+    ]
+    
+    for pattern in non_address_patterns:
+        address_text = re.sub(pattern, '', address_text, flags=re.IGNORECASE)
+    
+    # Fix building number formats
+    # Handle building numbers with slashes like "8/3 շենք"
+    address_text = re.sub(r'(\d+)/(\d+)\s*շենք', r'\1/\2 շենք', address_text)
+    # Replace /շենք with just շենք
+    address_text = re.sub(r'/շենք', ' շենք', address_text)
+    # Ensure there's a space before շենք if there's a number
+    address_text = re.sub(r'(\d+)շենք', r'\1 շենք', address_text)
+    # Fix missing building numbers (replace just շենք with appropriate format)
+    address_text = re.sub(r'(?<![\d\s])շենք', ' շենք', address_text)
+    # Fix floor information format
+    address_text = re.sub(r'(\d+)րդ հարկ', r'\1-րդ հարկ', address_text)
+    address_text = re.sub(r'(\d+)ին հարկ', r'\1-ին հարկ', address_text)
+    # Don't add double hyphens
+    address_text = re.sub(r'--ին հարկ', '-ին հարկ', address_text)
+    address_text = re.sub(r'--րդ հարկ', '-րդ հարկ', address_text)
+    
+    # Clean up newlines and tabs first
+    address_text = re.sub(r'[\n\t\r]+', ' ', address_text)
+    
+    # Add space after city name if missing
+    address_text = re.sub(r'(Երևան)([^\s,])', r'\1 \2', address_text)
+    
+    # Clean up extra spaces, commas, etc.
+    address_text = re.sub(r'\s+', ' ', address_text)
+    address_text = re.sub(r'\s*,\s*', ', ', address_text)
+    address_text = re.sub(r'^\s*,\s*', '', address_text)
+    address_text = re.sub(r'\s*,\s*$', '', address_text)
+    
+    # Skip non-address content that appears in some pages
+    if "Ապրանք-ծառայություններ` Հայաստանում" in address_text:
+        return "Հայաստան, Երևան"  # Default to Armenia, Yerevan if specific address not found
+    
+    # If address doesn't contain Armenia or Yerevan, add it
+    if "Հայաստան" not in address_text and "Երևան" not in address_text:
+        address_text = "Հայաստան, Երևան, " + address_text
+    
+    # Remove trailing punctuation and spaces
+    address_text = re.sub(r'[,\-:;]\s*$', '', address_text)
+    
+    # Remove duplicate commas
+    address_text = re.sub(r',\s*,', ',', address_text)
+    
+    return address_text.strip()
+
+def strip_agency_label(raw_text):
+    """Keep only the part after the "ԱՆՇԱՐԺ ԳՈՒՅՔԻ ԳՈՐԾԱԿԱԼՈՒԹՅՈՒՆ" (REAL ESTATE AGENCY) label"""
+    agency_label = "ԱՆՇԱՐԺ ԳՈՒՅՔԻ ԳՈՐԾԱԿԱԼՈՒԹՅՈՒՆ"
+    if agency_label in raw_text:
+        parts = raw_text.split(agency_label)
+        if len(parts) > 1:
+            return parts[1].strip()
+    return raw_text
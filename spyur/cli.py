@@ -0,0 +1,235 @@
+"""Command line interface
+
+Only argparse and the light configuration modules are imported up front;
+each command imports what it needs when it runs, so listing categories or
+planning shards from a cached taxonomy does not load the HTTP and HTML
+parsing stack.
+"""
+import argparse
+
+from .config import CATEGORIES, LINK_CACHE_TTL, MAX_BODY_BYTES, MAX_RETRIES, TAXONOMY_CACHE_PATH, TAXONOMY_TTL, TUNING_STATE_PATH
+from .profiles import PROFILES
+
+def _positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def _shard_spec(value):
+    """argparse type for --shard: an I/N spec with 1 <= I <= N"""
+    from .taxonomy import parse_shard_spec
+    try:
+        return parse_shard_spec(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def build_parser():
+    """Build the argument parser for the command line"""
+    parser = argparse.ArgumentParser(description="Scrape company information from Spyur.am")
+    parser.add_argument("-c", "--category", choices=list(CATEGORIES.keys()), help="Category to scrape (default: real_estate)")
+    parser.add_argument("-p", "--pages", type=int, default=5, help="Maximum number of pages to scrape (default: 5)")
+    parser.add_argument("-m", "--max-companies", type=int, default=1000, help="Maximum number of companies to scrape per category (default: 1000)")
+    parser.add_argument("-o", "--output", type=str, help="Path to save the CSV file (default: user's Documents folder)")
+    parser.add_argument("-l", "--list", action="store_true", help="List available categories and exit")
+    parser.add_argument("-u", "--url", type=str, help="Custom URL to scrape (overrides category)")
+    parser.add_argument("-a", "--all", action="store_true", help="Scrape all categories")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="Number of company pages to fetch concurrently (default: 1)")
+    parser.add_argument("--auto-workers", action="store_true", help="Tune the number of concurrent fetches from latency and errors, starting from the last run's setting; "
+                        "with a --delay the rate limiter usually binds first, and workers stop at about latency/delay")
+    parser.add_argument("--max-workers", type=int, default=16, help="Upper bound for --auto-workers (default: 16)")
+    parser.add_argument("--target-p95", type=float, default=3.0, help="p95 fetch latency in seconds --auto-workers keeps under (default: 3)")
+    parser.add_argument("--tuning-state", type=str, default=TUNING_STATE_PATH, help=f"File the --auto-workers setting is kept in between runs (default: {TUNING_STATE_PATH})")
+    parser.add_argument("--hedge", action="store_true", help="Send a second request for company pages slower than the observed p95 latency; hedges count against --delay")
+    parser.add_argument("--delay", type=float, default=1.0, help="Minimum seconds between requests (default: 1.0)")
+    parser.add_argument("--time-budget", type=float, help="Stop the crawl after this many minutes, refreshing the most likely changed companies first")
+    parser.add_argument("--history", type=str, help="JSON file with per-URL crawl history used to order the refresh (default: in memory only)")
+    parser.add_argument("--timeout", type=float, default=30, help="Connect and read timeout in seconds (default: 30)")
+    parser.add_argument("--max-body-kb", type=int, default=MAX_BODY_BYTES // 1024, help="Largest page accepted, in KiB (default: 5120)")
+    parser.add_argument("--retries", type=int, default=MAX_RETRIES, help=f"Times a 429, 5xx, timed-out or cut-off response is retried, honoring Retry-After (default: {MAX_RETRIES})")
+    parser.add_argument("--encoding", type=str, default="utf-8", help="Encoding for pages that declare no charset (default: utf-8)")
+    parser.add_argument("--cache-dir", type=str, help="Directory to cache fetched pages in (default: no cache)")
+    parser.add_argument("--parser", type=str, default="html.parser", help="BeautifulSoup parser backend, e.g. html.parser or lxml (default: html.parser)")
+    parser.add_argument("--languages", type=str, help="Comma-separated languages to fetch each company in and merge, e.g. am,en,ru (default: the listing's language only)")
+    parser.add_argument("--listing-parser", choices=["fast", "soup"], default="fast", help="Read listing pages with the streaming tokenizer or a full BeautifulSoup tree (default: fast)")
+    parser.add_argument("--profile", type=str, default="default", help=f"Extraction profile: one of {', '.join(PROFILES)} or a JSON/YAML file (default: default)")
+    parser.add_argument("--dedup", choices=["drop", "merge"], help="Remove duplicate companies across categories and branches: drop later duplicates, or merge them into the first record")
+    parser.add_argument("--discover", action="store_true", help="Discover the yellow-pages category tree, estimate every category and exit")
+    parser.add_argument("--refresh-taxonomy", action="store_true", help="Ignore the cached taxonomy and crawl the category tree again")
+    parser.add_argument("--taxonomy-cache", type=str, default=TAXONOMY_CACHE_PATH, help=f"Taxonomy cache file (default: {TAXONOMY_CACHE_PATH})")
+    parser.add_argument("--taxonomy-ttl", type=float, default=TAXONOMY_TTL / 3600, help="Hours before the cached taxonomy is refreshed (default: 168)")
+    parser.add_argument("--plan-shards", type=_positive_int, metavar="N", help="Print a plan splitting the discovered taxonomy into N balanced shards and exit")
+    parser.add_argument("--shard", type=_shard_spec, metavar="I/N", help="With --all, scrape shard I of N of the discovered taxonomy; every node must share the same taxonomy cache")
+    parser.add_argument("--bench-phones", type=str, metavar="CACHE_DIR", help="Benchmark phone extraction over the pages in a page cache and exit")
+    parser.add_argument("--archive-dir", type=str, help="Keep every fetched response in a compressed page archive in this directory")
+    parser.add_argument("--validate-links", action="store_true", help="Check every website and social media link and add website_status and resolved URLs")
+    parser.add_argument("--link-cache", type=str, help="JSON file caching link check results between runs (default: in memory)")
+    parser.add_argument("--link-ttl", type=float, default=LINK_CACHE_TTL / 3600, help="Hours a link check result is reused (default: 168)")
+    parser.add_argument("--normalize-addresses", action="store_true", help="Parse every address into city, district, street, house, building and floor columns")
+    parser.add_argument("--gazetteer", type=str, help="JSON file of extra cities, districts and streets for address parsing")
+    parser.add_argument("--db", type=str, help="Also upsert every record into this SQLite company store")
+    parser.add_argument("--progress", action="store_true", help="Show a live status line with pages/sec, queue depths, errors and the category ETA instead of per-company output")
+    parser.add_argument("--status-port", type=int, help="Serve the live crawl status as JSON on this local port")
+    parser.add_argument("--cdc", type=str, metavar="PREVIOUS_CSV", help="Compare every record with this earlier output and write the added, updated and removed fields as JSONL")
+    parser.add_argument("--delta", type=str, help="Path of the --cdc delta (default: <output>.delta.jsonl)")
+    parser.add_argument("--partition-by", choices=["category"], help="With --all, write one CSV part per category into a directory named after --output, with a manifest.json")
+    parser.add_argument("--max-rows", type=int, help="With --all, roll over to a new CSV part every N rows")
+    parser.add_argument("--compress", choices=["gzip", "zstd"], help="With --all, compress finished CSV parts in background threads (zstd needs the zstandard package)")
+
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    reextract_parser = subparsers.add_parser("reextract", help="Re-run extraction over archived or cached pages without the network")
+    reextract_source = reextract_parser.add_mutually_exclusive_group(required=True)
+    reextract_source.add_argument("--archive", type=str, help="Page archive directory written with --archive-dir")
+    reextract_source.add_argument("--cache-dir", type=str, help="Page cache directory written with --cache-dir")
+    reextract_parser.add_argument("-o", "--output", type=str, required=True, help="Path to save the CSV file")
+    reextract_parser.add_argument("--previous", type=str, help="Previous CSV output to compare the new records with")
+    reextract_parser.add_argument("--diff", type=str, help="Path of the field-level JSONL diff (default: <output>.diff.jsonl)")
+    reextract_parser.add_argument("-w", "--workers", type=int, help="Number of processes (default: number of CPUs)")
+    reextract_parser.add_argument("--parser", type=str, default="html.parser", help="BeautifulSoup parser backend (default: html.parser)")
+    reextract_parser.add_argument("--profile", type=str, default="default", help="Extraction profile name or JSON/YAML file (default: default)")
+    addresses_parser = subparsers.add_parser("addresses", help="Parse the addresses of a crawl CSV into components, offline")
+    addresses_parser.add_argument("input", type=str, help="CSV written by a crawl")
+    addresses_parser.add_argument("-o", "--output", type=str, required=True, help="Path to save the CSV with address_* columns")
+    addresses_parser.add_argument("--gazetteer", type=str, help="JSON file of extra cities, districts and streets")
+    lookup_parser = subparsers.add_parser("lookup", help="Query a SQLite company store written with --db")
+    lookup_parser.add_argument("db", type=str, help="SQLite company store")
+    lookup_query = lookup_parser.add_mutually_exclusive_group(required=True)
+    lookup_query.add_argument("--phone", type=str, help="Companies listing this phone number")
+    lookup_query.add_argument("--name", type=str, help="Companies whose name starts with this text")
+    lookup_query.add_argument("--category", type=str, help="Companies in this category")
+    lookup_query.add_argument("--shared-phones", action="store_true", help="Phones listed by more than one company")
+    mock_parser = subparsers.add_parser("mock-server", help="Serve a synthetic spyur.am locally, with injected faults, for load testing")
+    mock_parser.add_argument("--host", type=str, default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    mock_parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    mock_parser.add_argument("--companies", type=int, default=1000, help="Number of companies (default: 1000)")
+    mock_parser.add_argument("--categories", type=int, default=1, help="Number of categories the companies are split across (default: 1)")
+    mock_parser.add_argument("--per-page", type=int, default=20, help="Companies per listing page (default: 20)")
+    mock_parser.add_argument("--latency", type=float, default=0, help="Milliseconds added to every response (default: 0)")
+    mock_parser.add_argument("--jitter", type=float, default=0, help="Extra random delay of up to this many milliseconds (default: 0)")
+    mock_parser.add_argument("--rate-429", type=float, default=0, help="Share of responses answered with 429 (default: 0)")
+    mock_parser.add_argument("--rate-5xx", type=float, default=0, help="Share of responses answered with 500/502/503 (default: 0)")
+    mock_parser.add_argument("--truncate", type=float, default=0, help="Share of bodies cut off halfway (default: 0)")
+    mock_parser.add_argument("--drip", type=float, default=0, help="Share of bodies sent slowly in small pieces (default: 0)")
+    mock_parser.add_argument("--drip-seconds", type=float, default=5, help="How long a dripped body takes (default: 5)")
+    mock_parser.add_argument("--seed", type=int, help="Seed making the injected faults reproducible")
+    return parser
+
+def make_engine(args):
+    """Build the engine described by the crawl options on the command line"""
+    from .addresses import AddressNormalizer, Gazetteer
+    from .engine import CompanyScraper
+    from .hedging import RequestHedger
+    from .links import LinkValidator
+    from .output import CompanyStore
+    from .progress import CrawlProgress
+    from .scheduler import CrawlHistory, CrawlScheduler
+    from .tuning import ConcurrencyTuner
+    
+    tuner = None
+    if args.auto_workers:
+        tuner = ConcurrencyTuner(max_workers=args.max_workers, target_p95=args.target_p95, state_path=args.tuning_state,
+                                 delay=args.delay)
+        print(f"🎛️ Starting with {tuner.workers} concurrent fetches (max {tuner.max_workers})")
+    progress = None
+    if args.progress or args.status_port:
+        progress = CrawlProgress()
+        if args.progress:
+            progress.start_status_line()
+        if args.status_port:
+            progress.serve(args.status_port)
+    scheduler = None
+    if args.time_budget or args.history:
+        scheduler = CrawlScheduler(CrawlHistory(args.history), args.time_budget * 60 if args.time_budget else None)
+    return CompanyScraper(parser=args.parser, delay=args.delay, cache_dir=args.cache_dir, workers=args.workers, profile=args.profile,
+                          archive_dir=args.archive_dir, listing_parser=args.listing_parser,
+                          timeout=args.timeout, max_body_bytes=args.max_body_kb * 1024, encoding=args.encoding,
+                          scheduler=scheduler, sink=CompanyStore(args.db) if args.db else None,
+                          languages=args.languages.split(",") if args.languages else None,
+                          link_validator=LinkValidator(cache_path=args.link_cache, ttl=args.link_ttl * 3600) if args.validate_links else None,
+                          address_normalizer=AddressNormalizer(Gazetteer(args.gazetteer), batch_size=50) if args.normalize_addresses else None,
+                          progress=progress, tuner=tuner, verbose=not args.progress,
+                          hedger=RequestHedger() if args.hedge else None, max_retries=args.retries)
+
+def run(argv=None):
+    """Run the command line
+    
+    Args:
+        argv (list, optional): Arguments without the program name. Defaults to sys.argv[1:].
+    """
+    args = build_parser().parse_args(argv)
+    
+    if args.command == "reextract":
+        from .reextraction import reextract
+        
+        reextract(args.output, archive_dir=args.archive, cache_dir=args.cache_dir, workers=args.workers, parser=args.parser,
+                  profile=args.profile, previous_path=args.previous, diff_path=args.diff)
+    elif args.command == "addresses":
+        from .addresses import normalize_addresses_csv
+        
+        normalize_addresses_csv(args.input, args.output, gazetteer_path=args.gazetteer)
+    elif args.command == "lookup":
+        from .output import CompanyStore, print_store_lookup
+        
+        with CompanyStore(args.db) as store:
+            print_store_lookup(store, phone=args.phone, name=args.name, category=args.category, shared_phones=args.shared_phones)
+    elif args.command == "mock-server":
+        from .mockserver import FaultProfile, MockSite, serve_mock_site
+        
+        faults = FaultProfile(latency=args.latency / 1000, jitter=args.jitter / 1000, rate_429=args.rate_429, rate_5xx=args.rate_5xx,
+                              truncate=args.truncate, drip=args.drip, drip_seconds=args.drip_seconds, seed=args.seed)
+        serve_mock_site(MockSite(args.companies, args.categories, args.per_page), faults, args.host, args.port)
+    elif args.list:
+        from .taxonomy import list_categories
+        
+        list_categories()
+    elif args.bench_phones:
+        from .phones import benchmark_phone_extractor
+        
+        benchmark_phone_extractor(args.bench_phones)
+    elif args.discover or args.plan_shards:
+        from .taxonomy import get_taxonomy, plan_shards, print_shard_plan
+        
+        engine = None
+        def lazy_engine():
+            nonlocal engine
+            engine = make_engine(args)
+            return engine
+        try:
+            taxonomy = get_taxonomy(lazy_engine, cache_path=args.taxonomy_cache, ttl=args.taxonomy_ttl * 3600, refresh=args.refresh_taxonomy)
+            if args.discover:
+                for name, estimate in taxonomy["categories"].items():
+                    print(f"{name}: ~{estimate['companies']} companies on {estimate['pages']} pages - {estimate['url']}")
+            else:
+                print_shard_plan(plan_shards(taxonomy["categories"], args.plan_shards))
+        finally:
+            if engine is not None:
+                engine.close()
+    else:
+        from .api import main, scrape_all_categories
+        from .taxonomy import get_taxonomy, plan_shards
+        
+        engine = make_engine(args)
+        try:
+            if args.all:
+                categories = None
+                if args.shard:
+                    index, count = args.shard
+                    taxonomy = get_taxonomy(engine, cache_path=args.taxonomy_cache, ttl=args.taxonomy_ttl * 3600, refresh=args.refresh_taxonomy)
+                    categories = plan_shards(taxonomy["categories"], count)[index - 1]["categories"]
+                    print(f"\n🗂️  Shard {index}/{count}: {len(categories)} categories")
+                print(f"\n📊 Scraping all categories with max {args.pages} pages and max {args.max_companies} companies per category...")
+                scrape_all_categories(max_pages=args.pages, output_path=args.output, max_companies=args.max_companies, engine=engine, dedup=args.dedup, categories=categories,
+                                      previous_path=args.cdc, delta_path=args.delta, partition_by=args.partition_by, max_rows=args.max_rows,
+                                      compression=args.compress)
+            else:
+                # Use URL if provided, otherwise use category
+                category_arg = args.url if args.url else args.category
+                print(f"\n📊 Scraping with max {args.pages} pages and max {args.max_companies} companies...")
+                main(category=category_arg, max_pages=args.pages, output_path=args.output, max_companies=args.max_companies, engine=engine, dedup=args.dedup,
+                     previous_path=args.cdc, delta_path=args.delta)
+        finally:
+            engine.close()
@@ -0,0 +1,26 @@
+"""Site constants and crawl defaults shared by every module"""
+import os
+
+BASE_URL = "https://www.spyur.am"
+
+# Default categories
+CATEGORIES = {
+    "real_estate": "https://www.spyur.am/am/yellow_pages/?type=bd&yp_cat1=&yp_cat2=l2.3.5&yp_cat3=&search=Search",
+    "ԱՌԵՎՏՐԱՅԻՆ ԳՈՐԾԱՐՔՆԵՐ, ՅՈՒՐԱՀԱՏՈՒԿ ԱՌԵՎՏՐԱՅԻՆ ՀԱՐԹԱԿՆԵՐ, ՕԲՅԵԿՏՆԵՐ": "https://www.spyur.am/am/yellow_pages/?type=bd&yp_cat1=&yp_cat2=l2.3.6&yp_cat3=&search=Search",
+    # "it": "https://www.spyur.am/am/yellow_pages/?type=bd&yp_cat1=&yp_cat2=l2.2.1&yp_cat3=&search=Search",
+    # "finance": "https://www.spyur.am/am/yellow_pages/?type=bd&yp_cat1=&yp_cat2=l2.1.1&yp_cat3=&search=Search",
+    # "tourism": "https://www.spyur.am/am/yellow_pages/?type=bd&yp_cat1=&yp_cat2=l2.5.1&yp_cat3=&search=Search"
+}
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+MAX_BODY_BYTES = 5 * 1024 * 1024
+MAX_RETRIES = 3  # retries of a 429, 5xx, timed-out or cut-off response
+RETRY_BACKOFF = 1.0  # seconds before the first retry without a Retry-After, doubled per retry
+MAX_RETRY_AFTER = 60
+LINK_CACHE_TTL = 7 * 24 * 3600
+TAXONOMY_CACHE_PATH = os.path.expanduser("~/.cache/spyur/taxonomy.json")
+TAXONOMY_TTL = 7 * 24 * 3600  # one week
+TUNING_STATE_PATH = os.path.expanduser("~/.cache/spyur/concurrency.json")
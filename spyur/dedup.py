@@ -0,0 +1,173 @@
+"""Duplicate detection across categories and branch listings"""
+import re
+from urllib.parse import urlparse
+
+from .memo import memoized
+from .phones import PHONE_EXTRACTOR
+
+LEGAL_FORM_RE = re.compile(r'\b(?:ՍՊԸ|ՓԲԸ|ԲԲԸ|ԱՁ|ՀԿ|LLC|CJSC|OJSC|LTD)\b|[«»"\'“”„.,()]', re.IGNORECASE)
+
+@memoized("company_name")
+def normalize_company_name(name):
+    """Normalize a company name for duplicate detection
+    
+    Legal-form abbreviations (ՍՊԸ, ՓԲԸ, LLC, ...), quotes and punctuation are
+    removed, and the result is lowercased with whitespace collapsed.
+    """
+    if not name:
+        return ""
+    name = LEGAL_FORM_RE.sub(" ", name)
+    return " ".join(name.lower().split())
+
+@memoized("link_domain")
+def website_domain(url):
+    """Return the host of a website URL without "www.", or "" if there is none"""
+    if not url:
+        return ""
+    host = urlparse(url if "://" in url else "http://" + url).netloc.lower()
+    host = host.rsplit("@", 1)[-1].split(":", 1)[0]
+    return host[4:] if host.startswith("www.") else host
+
+class DedupIndex:
+    """Hash index that recognises the same company across listings and branches
+    
+    Every record is reduced to lookup keys: its normalized name, its website
+    domain and each of its phones in E.164 form. Each key maps to the
+    source_url of the first record it was seen on, so checking a record costs
+    one dict lookup per key, however many records have been indexed.
+    
+    A record is a duplicate when its source_url was already seen, or when keys
+    of at least ``min_signals`` different kinds (name, phone, domain) point at
+    the same earlier record. Requiring two
+    kinds keeps unrelated companies that happen to share a business centre
+    switchboard, or a common name, apart.
+    
+    Args:
+        min_signals (int, optional): Number of matching key kinds needed. Defaults to 2.
+    """
+
+    def __init__(self, min_signals=2):
+        self.min_signals = min_signals
+        self.records = 0
+        self.duplicates = 0
+        self._owner = {}
+
+    @staticmethod
+    def keys(record):
+        """Return the (kind, value) lookup keys of a record"""
+        keys = []
+        name = normalize_company_name(record.get("name", ""))
+        if name:
+            keys.append(("name", name))
+        domain = website_domain(record.get("website", ""))
+        if domain:
+            keys.append(("domain", domain))
+        for phone in (record.get("phones") or "").split(","):
+            phone = PHONE_EXTRACTOR.normalize(phone) or phone.strip()
+            if phone:
+                keys.append(("phone", phone))
+        return keys
+
+    def add(self, record):
+        """Index a record and report which earlier record it duplicates
+        
+        Args:
+            record (dict): Company information
+            
+        Returns:
+            str or None: source_url of the earlier record, or None if the record is new
+        """
+        self.records += 1
+        keys = self.keys(record)
+        
+        # The same company page listed under several categories
+        url_key = ("url", record.get("source_url"))
+        owner = self._owner.get(url_key)
+        if owner is not None:
+            self.duplicates += 1
+            return owner
+        self._owner[url_key] = record.get("source_url")
+        
+        signals = {}
+        for kind, value in keys:
+            owner = self._owner.get((kind, value))
+            if owner is not None:
+                signals.setdefault(owner, set()).add(kind)
+        
+        canonical = None
+        for owner, kinds in signals.items():
+            if len(kinds) >= self.min_signals:
+                canonical = owner
+                break
+        
+        if canonical is None:
+            owner = record.get("source_url")
+        else:
+            owner = canonical
+            self.duplicates += 1
+        
+        # Keys first seen on a duplicate still point at the canonical record,
+        # so later branches can match through them
+        for key in keys:
+            self._owner.setdefault(key, owner)
+        return canonical
+
+def merge_company_records(target, duplicate):
+    """Merge a duplicate record into the record it duplicates
+    
+    Empty fields are filled in, phones, social media links and categories
+    are combined, and the duplicate's source_url is added to duplicate_urls.
+    """
+    for key, value in duplicate.items():
+        if key in ("source_url", "duplicate_urls") or not value:
+            continue
+        if not target.get(key):
+            target[key] = value
+        elif key in ("phones", "social_media", "category"):
+            separator = "; " if key == "category" else ", "
+            values = [v for v in target[key].split(separator) if v]
+            for item in str(value).split(separator):
+                if item and item not in values:
+                    values.append(item)
+            target[key] = separator.join(values)
+    urls = [u for u in target.get("duplicate_urls", "").split(", ") if u]
+    urls.append(duplicate["source_url"])
+    target["duplicate_urls"] = ", ".join(urls)
+
+def dedup_records(records, index=None, mode="drop"):
+    """Remove duplicate companies from a stream of records
+    
+    In "drop" mode the first record of each company is yielded straight
+    away and later duplicates are skipped, so only the key index is held in
+    memory. In "merge" mode duplicates are folded into the first record
+    (see merge_company_records) and the merged records are yielded once the
+    input is exhausted, which keeps one record per distinct company in memory.
+    
+    Args:
+        records (iterable): Company records
+        index (DedupIndex, optional): Index to use, e.g. to read its counters afterwards
+        mode (str, optional): "drop" or "merge". Defaults to "drop".
+        
+    Yields:
+        dict: Deduplicated company records
+    """
+    if mode not in ("drop", "merge"):
+        raise ValueError(f"Unknown dedup mode: {mode}")
+    index = index if index is not None else DedupIndex()
+    merged = {}
+    
+    for record in records:
+        canonical = index.add(record)
+        if mode == "drop":
+            if canonical is None:
+                yield record
+            else:
+                print(f"Skipping duplicate of {canonical}: {record.get('source_url')}")
+        elif canonical is None:
+            record.setdefault("duplicate_urls", "")
+            merged[record["source_url"]] = record
+        else:
+            merge_company_records(merged[canonical], record)
+    
+    if mode == "merge":
+        yield from merged.values()
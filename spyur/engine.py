@@ -0,0 +1,861 @@
+"""The CompanyScraper engine and the module-level helpers built on it"""
+import time
+from urllib.parse import urljoin
+
+import requests
+from bs4 import BeautifulSoup
+
+from .archive import PageArchive, decode_body
+from .cleaning import clean_address, clean_director_name, strip_agency_label
+from .config import HEADERS, MAX_BODY_BYTES, MAX_RETRIES, MAX_RETRY_AFTER, RETRY_BACKOFF
+from .fetching import (DOWNLOAD_CHUNK_SIZE, HTML_CONTENT_TYPES, HTTPStatusError, PageCache, PageRejected, RateLimiter,
+                       imap_bounded, parse_retry_after, site_host)
+from .listing import PaginationScheme, extract_paging_info, find_next_page_url, parse_listing
+from .phones import PHONE_EXTRACTOR
+from .profiles import CATEGORY_PROFILES, DEFAULT_PROFILE, first_match, first_non_empty, load_profile
+from .records import LANGUAGES, company_id, empty_company_info, is_spyur_own_page, language_variant_url, merge_language_variants
+from .taxonomy import resolve_category
+
+# Request failures that may not happen again: timeouts, dropped connections and cut-off bodies
+TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
+
+class CompanyScraper:
+    """Scraper engine for Spyur.am
+    
+    The engine owns everything a crawl needs: the HTTP session, the rate
+    limiter, the optional page cache, the HTML parser backend and the output
+    sink. ``main()``, ``scrape_all_categories()`` and the module-level helper
+    functions are thin wrappers around it.
+    
+    Args:
+        parser (str, optional): BeautifulSoup parser backend. Defaults to "html.parser".
+        delay (float, optional): Minimum seconds between requests. Defaults to 1.0.
+        cache_dir (str, optional): Directory for the page cache. Defaults to no cache.
+        sink (object, optional): Output sink with write(record) and close(). Defaults to None.
+        workers (int, optional): Number of concurrent company page fetches. Defaults to 1.
+        verbose (bool, optional): Print extracted fields for every company. Defaults to True.
+        profile (ExtractionProfile or str, optional): Extraction profile, or the name or
+            path of one (see load_profile). Defaults to DEFAULT_PROFILE.
+        category_profiles (dict, optional): Per-category profile overrides. Defaults to CATEGORY_PROFILES.
+        archive_dir (str, optional): Directory of a PageArchive that keeps every fetched
+            response. Defaults to no archive.
+        listing_parser (str, optional): "fast" reads listing pages with the streaming
+            ListingPageParser, "soup" builds a full BeautifulSoup tree. Defaults to "fast".
+        timeout (float, optional): Connect and read timeout in seconds. Defaults to 30.
+        max_body_bytes (int, optional): Largest response body accepted. Defaults to MAX_BODY_BYTES.
+        encoding (str, optional): Encoding used when a response declares no charset. Defaults to "utf-8".
+        max_redirects (int, optional): Redirects followed per fetch. Defaults to 5.
+        scheduler (CrawlScheduler, optional): Orders company pages freshest-first and
+            enforces a time budget. Defaults to listing order without a budget.
+        languages (sequence, optional): Languages to fetch every company page in, e.g.
+            ("am", "en", "ru"), merged into one record. Defaults to the listed page only.
+        link_validator (LinkValidator, optional): Checks every record's website and social
+            media links. Defaults to no checks.
+        address_normalizer (AddressNormalizer, optional): Adds parsed address components
+            to every record. Defaults to none.
+        progress (CrawlProgress, optional): Receives page, company and error counts for
+            a live status line or endpoint. Defaults to none.
+        tuner (ConcurrencyTuner, optional): Adjusts the number of concurrent company
+            fetches from latency and errors, up to its max_workers; workers is then
+            ignored. Defaults to the fixed workers count.
+        hedger (RequestHedger, optional): Races a second copy of company page fetches
+            that run past the observed p95 latency. Defaults to no hedging.
+        max_retries (int, optional): Times a 429, 5xx, timed-out or cut-off response is retried.
+            Defaults to MAX_RETRIES.
+        retry_backoff (float, optional): Seconds before the first retry when the response has no
+            Retry-After header, doubled for every further retry. Defaults to RETRY_BACKOFF.
+    """
+
+    def __init__(self, parser="html.parser", delay=1.0, cache_dir=None, sink=None, workers=1, verbose=True,
+                 profile=None, category_profiles=None, archive_dir=None, listing_parser="fast",
+                 timeout=30, max_body_bytes=MAX_BODY_BYTES, encoding="utf-8", max_redirects=5, scheduler=None, languages=None,
+                 link_validator=None, address_normalizer=None, progress=None, tuner=None,
+                 hedger=None, max_retries=MAX_RETRIES, retry_backoff=RETRY_BACKOFF):
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        self.limiter = RateLimiter(delay)
+        self.cache = PageCache(cache_dir) if cache_dir else None
+        self.archive = PageArchive(archive_dir) if archive_dir else None
+        self.parser = parser
+        self.sink = sink
+        self.workers = max(1, workers)
+        self.verbose = verbose
+        self.listing_parser = listing_parser
+        self.timeout = timeout
+        self.max_body_bytes = max_body_bytes
+        self.encoding = encoding
+        self.max_redirects = max_redirects
+        self.scheduler = scheduler
+        self.languages = tuple(languages) if languages else None
+        self.link_validator = link_validator
+        self.address_normalizer = address_normalizer
+        self.tuner = tuner
+        self.hedger = hedger
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        # Company URLs that could not be fetched and categories whose listing broke off or
+        # ran out of time budget, for the CDC delta
+        self.failed_urls = set()
+        self.incomplete_categories = set()
+        self._failed_listings = set()
+        self.progress = progress
+        if progress is not None:
+            progress.attach(self)
+        unknown_languages = set(self.languages or ()) - set(LANGUAGES)
+        if unknown_languages:
+            raise ValueError(f"Unknown languages: {', '.join(sorted(unknown_languages))} (expected some of {', '.join(LANGUAGES)})")
+        self.category_profiles = dict(CATEGORY_PROFILES if category_profiles is None else category_profiles)
+        self._compiled_profiles = {}
+        # PaginationScheme per category list URL, learned on the first crawl of it
+        self._pagination_schemes = {}
+        self.set_profile(profile or DEFAULT_PROFILE)
+
+    def set_profile(self, profile):
+        """Swap the default extraction profile, compiling it once
+        
+        Args:
+            profile (ExtractionProfile or str): Profile, or the name or path of one
+        """
+        if isinstance(profile, str):
+            profile = load_profile(profile)
+        self.compiled_profile = self._compile(profile)
+
+    def set_category_profile(self, category_name, profile):
+        """Use a different extraction profile for one category
+        
+        Args:
+            category_name (str): Category name, as stored in each record
+            profile (ExtractionProfile or str): Profile, or the name or path of one
+        """
+        if isinstance(profile, str):
+            profile = load_profile(profile)
+        self.category_profiles[category_name] = profile
+
+    def profile_for(self, category_name):
+        """Return the compiled extraction profile to use for a category"""
+        profile = self.category_profiles.get(category_name)
+        if profile is None:
+            return self.compiled_profile
+        return self._compile(profile)
+
+    def _compile(self, profile):
+        compiled = self._compiled_profiles.get(id(profile))
+        if compiled is None or compiled.profile is not profile:
+            compiled = profile.compile()
+            self._compiled_profiles[id(profile)] = compiled
+        return compiled
+
+    def clean_director_name(self, director_text):
+        """Clean up director name by removing titles, labels, and extra information"""
+        return clean_director_name(director_text)
+
+    def clean_address(self, address_text):
+        """Clean up address text by removing phone numbers, working hours, and other non-address information"""
+        return clean_address(address_text)
+
+    def log(self, message, always=False):
+        """Print crawl output: per-page messages only when verbose, errors always
+        
+        With a live status line (see CrawlProgress) the message is printed above it.
+        
+        Args:
+            message (str): Text to print
+            always (bool, optional): Print even when not verbose. Defaults to False.
+        """
+        if not (always or self.verbose):
+            return
+        if self.progress is not None:
+            self.progress.message(message)
+        else:
+            print(message)
+
+    def fetch(self, url, hedge=False):
+        """Fetch a page, going through the cache and the rate limiter
+        
+        429 and 5xx responses, timeouts, dropped connections and cut-off
+        bodies are retried up to max_retries times, after the Retry-After
+        delay or an exponential backoff. Only successful responses are
+        archived, cached and returned.
+        
+        Args:
+            url (str): URL to fetch
+            hedge (bool, optional): Race a second request if this one is slow and the
+                engine has a hedger. Defaults to False.
+            
+        Returns:
+            str: Page HTML
+            
+        Raises:
+            PageRejected: The response redirected off the site, was not HTML or was too large
+            HTTPStatusError: The response status was not 2xx, after any retries
+            requests.RequestException: The request failed, after any retries
+        """
+        if self.cache:
+            html = self.cache.get(url)
+            if html is not None:
+                if self.progress is not None:
+                    self.progress.page_fetched(len(html))
+                return html
+        for attempt in range(self.max_retries + 1):
+            try:
+                if hedge and self.hedger is not None:
+                    # Queue for the rate limiter before the race so the hedge delay only times the server
+                    self.limiter.wait()
+                    status, headers, body = self.hedger.run(self.download, url, primary=lambda url: self.download(url, wait=False))
+                else:
+                    status, headers, body = self.download(url)
+                break
+            except (HTTPStatusError, *TRANSIENT_ERRORS) as e:
+                if attempt >= self.max_retries or (isinstance(e, HTTPStatusError) and not e.retryable):
+                    raise
+                delay = getattr(e, "retry_after", None)
+                delay = min(delay if delay is not None else self.retry_backoff * 2 ** attempt, MAX_RETRY_AFTER)
+                reason = f"HTTP {e.status}" if isinstance(e, HTTPStatusError) else type(e).__name__
+                self.log(f"⏳ {reason} from {url}, retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+                time.sleep(delay)
+        if self.progress is not None:
+            self.progress.page_fetched(len(body))
+        if self.archive:
+            self.archive.append(url, status, headers, body)
+        # Decode with the declared charset or the configured encoding, never by sniffing the body
+        html = decode_body(body, headers, self.encoding)
+        del body
+        if self.cache:
+            self.cache.put(url, html, status)
+        return html
+
+    def download(self, url, wait=True):
+        """Stream a response body, refusing anything that should not be parsed
+        
+        Redirects are followed by hand so a hop off the requested site is refused
+        before it is requested. The Content-Type and Content-Length headers are
+        checked before the body is read, and the download is cut off as soon as
+        it grows past max_body_bytes. A status other than 2xx raises
+        HTTPStatusError before the body is read.
+        
+        Args:
+            url (str): URL to fetch
+            wait (bool, optional): Wait for the rate limiter before the first request; False
+                when the caller already has. Redirects always wait. Defaults to True.
+            
+        Returns:
+            tuple: (status code, headers dict, body bytes)
+        """
+        site = site_host(url)
+        for hop in range(self.max_redirects + 1):
+            if wait or hop:
+                self.limiter.wait()
+            started = time.monotonic()
+            try:
+                with self.session.get(url, stream=True, timeout=self.timeout, allow_redirects=False) as response:
+                    if response.is_redirect:
+                        url = urljoin(url, response.headers["Location"])
+                        if site_host(url) != site:
+                            raise PageRejected(f"redirect off {site} to {url}")
+                        continue
+                    if not 200 <= response.status_code < 300:
+                        error = HTTPStatusError(url, response.status_code, parse_retry_after(response.headers.get("Retry-After")))
+                        if self.tuner is not None:
+                            self.tuner.observe(time.monotonic() - started, ok=not error.retryable)
+                        raise error
+                    
+                    content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+                    if content_type and content_type not in HTML_CONTENT_TYPES:
+                        raise PageRejected(f"non-HTML response ({content_type}) from {url}")
+                    length = response.headers.get("Content-Length")
+                    if length and length.isdigit() and int(length) > self.max_body_bytes:
+                        raise PageRejected(f"response of {length} bytes from {url} exceeds {self.max_body_bytes}")
+                    
+                    chunks = []
+                    size = 0
+                    for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                        size += len(chunk)
+                        if size > self.max_body_bytes:
+                            raise PageRejected(f"response from {url} exceeds {self.max_body_bytes} bytes")
+                        chunks.append(chunk)
+                    latency = time.monotonic() - started
+                    if self.tuner is not None:
+                        self.tuner.observe(latency)
+                    if self.hedger is not None:
+                        self.hedger.observe(latency)
+                    return response.status_code, dict(response.headers), b"".join(chunks)
+            except requests.RequestException:
+                # Timeouts, refused connections and cut-off bodies count against the concurrency
+                if self.tuner is not None:
+                    self.tuner.observe(time.monotonic() - started, ok=False)
+                raise
+        raise PageRejected(f"more than {self.max_redirects} redirects from {url}")
+
+    def parse(self, html):
+        """Parse HTML with the configured parser backend"""
+        return BeautifulSoup(html, self.parser)
+
+    def iter_company_links(self, list_url, max_pages=5, max_companies=1000, profile=None):
+        """Yield company links from the list pages using proper pagination
+        
+        Links are yielded as soon as a listing page has been parsed, and the page
+        is released before the next one is fetched. Once a category's pagination
+        scheme is known, next pages are generated from it and the paging block is
+        only used as a marker check; the HTML is searched for a next link only
+        when that check fails.
+        
+        Args:
+            list_url (str): URL of the category list page
+            max_pages (int): Maximum number of pages to scrape
+            max_companies (int): Maximum number of companies to collect (for testing)
+            profile (CompiledProfile, optional): Extraction profile. Defaults to the engine's profile.
+            
+        Yields:
+            str: Company URL
+        """
+        profile = profile or self.compiled_profile
+        seen_links = set()
+        current_url = list_url
+        page_count = 0
+        scheme = self._pagination_schemes.get(list_url) or PaginationScheme.detect(list_url)
+        
+        while page_count < max_pages and len(seen_links) < max_companies:
+            try:
+                page_count += 1
+                self.log(f"Fetching list page {page_count}: {current_url}")
+                
+                html = self.fetch(current_url)
+                
+                # Extract company links, without building a tree when the page allows it
+                listing = parse_listing(html, profile) if self.listing_parser == "fast" else None
+                if listing and listing.company_links:
+                    soup = None
+                    hrefs = listing.company_links
+                else:
+                    listing = None
+                    soup = self.parse(html)
+                    hrefs = [element.get("href") for element in first_non_empty(profile.listing_links, soup)]
+                del html
+                
+                page_links = []
+                for href in hrefs:
+                    if len(seen_links) >= max_companies:
+                        break
+                        
+                    if href and "/companies/" in href:
+                        # Make sure we have the full URL
+                        if not href.startswith("http"):
+                            href = urljoin(current_url, href)
+                        if href not in seen_links:
+                            seen_links.add(href)
+                            page_links.append(href)
+                del hrefs
+                
+                self.log(f"Found {len(seen_links)} company links so far (limit: {max_companies})")
+                last_page = None
+                
+                # Resolve the next page before the tree is thrown away
+                next_url = None
+                if len(seen_links) < max_companies:
+                    paging = listing.paging if listing else extract_paging_info(soup, profile)
+                    if scheme and scheme.confirms(current_url, paging):
+                        next_url = scheme.next_url(current_url, paging)
+                    else:
+                        # The page does not look like the scheme predicted: discover the next link from the HTML
+                        next_url = find_next_page_url(listing or soup, current_url, profile=profile, log=self.log)
+                        scheme = PaginationScheme.detect(next_url) if next_url else None
+                    if scheme:
+                        self._pagination_schemes[list_url] = scheme
+                        last_page = max((scheme.page_number(urljoin(current_url, href)) for _, href in paging.links), default=None)
+                    del paging
+                if soup is not None:
+                    soup.decompose()
+                del soup, listing
+                if self.progress is not None:
+                    self.progress.listing_page(len(page_links), last_page)
+                
+                yield from page_links
+                
+                # If we've reached our limit, stop
+                if len(seen_links) >= max_companies:
+                    self.log(f"Reached maximum number of companies ({max_companies})")
+                    break
+                    
+                if not next_url or next_url == current_url:
+                    self.log(f"No more pages found after page {page_count}")
+                    break
+                    
+                current_url = next_url
+                
+            except Exception as e:
+                self.log(f"Error fetching page {page_count}: {e}", always=True)
+                self._failed_listings.add(list_url)
+                if self.progress is not None:
+                    self.progress.error("listing")
+                break
+        if self.progress is not None:
+            self.progress.listing_done()
+
+    def get_company_links(self, list_url, max_pages=5, max_companies=1000):
+        """Get company links from the list page using proper pagination
+        
+        Args:
+            list_url (str): URL of the category list page
+            max_pages (int): Maximum number of pages to scrape
+            max_companies (int): Maximum number of companies to collect (for testing)
+            
+        Returns:
+            list: List of company URLs
+        """
+        return list(self.iter_company_links(list_url, max_pages=max_pages, max_companies=max_companies))
+
+    def extract_company_info(self, company_url, profile=None):
+        """Extract company information from a company page
+        
+        Args:
+            company_url (str): URL of the company page
+            profile (CompiledProfile, optional): Extraction profile. Defaults to the engine's profile.
+            
+        Returns:
+            dict: Dictionary containing company information, or None for Spyur's own pages
+            and for pages that could not be fetched
+        """
+        try:
+            # Skip Spyur's own company page
+            if is_spyur_own_page(company_url):
+                self.log(f"Skipping Spyur's own company page: {company_url}")
+                return None
+            
+            return self.extract_from_html(self.fetch(company_url, hedge=True), company_url, profile=profile)
+        except Exception as e:
+            self.log(f"Error visiting {company_url}: {e}", always=True)
+            self.failed_urls.add(company_url)
+            if self.progress is not None:
+                self.progress.error("company")
+            if self.scheduler:
+                self.scheduler.history.record_error(company_url, e)
+            return None
+
+    def extract_from_html(self, html, company_url, profile=None):
+        """Extract company information from the HTML of a company page
+        
+        Args:
+            html (str): Page HTML, fetched or read from a cache or archive
+            company_url (str): URL of the company page
+            profile (CompiledProfile, optional): Extraction profile. Defaults to the engine's profile.
+            
+        Returns:
+            dict: Dictionary containing company information
+        """
+        soup = self.parse(html)
+        try:
+            return self.parse_company_info(soup, company_url, profile=profile)
+        finally:
+            # Release the parse tree as soon as the record has been built
+            soup.decompose()
+
+    def parse_company_info(self, soup, company_url, profile=None):
+        """Extract company information from an already parsed company page
+        
+        Args:
+            soup (BeautifulSoup): Parsed company page
+            company_url (str): URL of the company page
+            profile (CompiledProfile, optional): Extraction profile. Defaults to the engine's profile.
+            
+        Returns:
+            dict: Dictionary containing company information
+        """
+        p = profile or self.compiled_profile
+        company_info = empty_company_info(company_url)
+        company_text = None
+        
+        # Extract company name
+        name_elem = first_match(p.company_name, soup)
+        if name_elem:
+            company_info["name"] = name_elem.text.strip()
+        
+        # Extract director name - try structured data first
+        director_found = False
+        structured_data = p.info_rows.select(soup)
+        for item in structured_data:
+            label = p.info_label.select_one(item)
+            value = p.info_value.select_one(item)
+            
+            if label and value and p.director_label_re and p.director_label_re.search(label.text):
+                company_info["director"] = clean_director_name(strip_agency_label(value.text.strip()))
+                director_found = True
+                break
+        
+        # If director not found in structured data, try regex approach
+        if not director_found and p.use_text_fallbacks:
+            company_text = soup.get_text()
+            for pattern in p.director_text_patterns:
+                director_match = pattern.search(company_text)
+                if director_match:
+                    company_info["director"] = clean_director_name(strip_agency_label(director_match.group(1).strip()))
+                    break
+        
+        # Extract Armenian address - look specifically for "Գործունեության հասցե" (Business Address)
+        address_found = False
+        
+        # First, try to find the address_block element which contains the full address
+        # This is the most reliable method based on our analysis
+        address_block = first_match(p.address_blocks, soup)
+        if address_block:
+            address_text = address_block.text.strip()
+            if address_text and len(address_text) < 200:
+                company_info["address"] = clean_address(address_text)
+                address_found = True
+        
+        # If no address_block found, try the contacts_info container
+        if not address_found:
+            contacts_info = p.contacts.select_one(soup)
+            if contacts_info:
+                # Look for text containing "Հայաստան" (Armenia) or "Երևան" (Yerevan)
+                for elem in contacts_info.find_all(["div", "p", "span"]):
+                    text = elem.text.strip()
+                    if any(marker in text for marker in p.address_markers) and len(text) < 200:
+                        company_info["address"] = clean_address(text)
+                        address_found = True
+                        break
+        
+        # Try multiple selectors for company info sections
+        if not address_found and p.address_keyword_re:
+            # Check each info section for address
+            for section in p.address_sections:
+                if address_found:
+                    break
+                    
+                for item in section.select(soup):
+                    # Different ways to identify label and value
+                    label = first_match(p.section_labels, item)
+                    value = first_match(p.section_values, item)
+                    
+                    if not label or not value:
+                        # Try to find label and value in the text content
+                        item_text = item.text.strip()
+                        parts = item_text.split(":", 1)
+                        if len(parts) == 2:
+                            label = parts[0].strip()
+                            value = parts[1].strip()
+                        else:
+                            continue
+                    else:
+                        label = label.text.strip()
+                        value = value.text.strip()
+                    
+                    # Check if this is an address field
+                    if p.address_keyword_re.search(label):
+                        company_info["address"] = clean_address(value)
+                        address_found = True
+                        break
+        
+        # If address not found in structured data, try regex approach with multiple patterns
+        if not address_found and p.use_text_fallbacks:
+            if company_text is None:
+                company_text = soup.get_text()
+            for pattern in p.address_text_patterns:
+                address_match = pattern.search(company_text)
+                if address_match:
+                    company_info["address"] = clean_address(address_match.group(1).strip())
+                    address_found = True
+                    break
+        
+        # If still no address, look for specific address blocks
+        if not address_found:
+            # Look for elements that are likely to contain address information
+            for selector in p.address_fallbacks:
+                for block in selector.select(soup):
+                    text = block.text.strip()
+                    if text and len(text) < 200:
+                        company_info["address"] = clean_address(text)
+                        address_found = True
+                        break
+                if address_found:
+                    break
+        
+        # If still no address, use a more targeted approach for elements with address-like content
+        if not address_found:
+            # Only consider elements that are likely to contain actual address information
+            # and avoid navigation or general content areas
+            for elem in p.address_containers.select(soup):
+                text = elem.text.strip()
+                if any(marker in text for marker in p.address_markers) and len(text) < 200:
+                    # Avoid elements that are clearly not addresses
+                    if not (p.address_excluded_re and p.address_excluded_re.search(text)):
+                        company_info["address"] = clean_address(text)
+                        address_found = True
+                        break
+        
+        # Try table rows and definition lists that might contain address info
+        if not address_found and p.use_text_fallbacks:
+            for row in p.address_rows.select(soup):
+                row_text = row.text.strip()
+                # Check for common Armenian address patterns
+                if any(marker in row_text for marker in p.address_row_markers) and len(row_text) < 200:
+                    if any(word in row_text for word in p.address_row_words):
+                        company_info["address"] = clean_address(row_text)
+                        address_found = True
+                        break
+        
+        # If we still don't have an address, use the profile's default ("Հայաստան, Երևան", Armenia, Yerevan)
+        if not address_found or not company_info["address"]:
+            company_info["address"] = p.default_address
+        
+        # Extract phone numbers, normalized to E.164 and deduplicated
+        phones = []
+        
+        # Try structured phone elements first
+        for phone in p.phone_items.select(soup):
+            PHONE_EXTRACTOR.extract(phone.text, max_phones=p.max_phones, seen=phones)
+        
+        # If no phones found, try info-lines with phone labels
+        if not phones and p.phone_label_re:
+            for item in structured_data:
+                label = p.info_label.select_one(item)
+                value = p.info_value.select_one(item)
+                
+                if label and value and p.phone_label_re.search(label.text):
+                    PHONE_EXTRACTOR.extract(value.text, max_phones=p.max_phones, seen=phones)
+        
+        # If still no phones, scan the whole page text
+        if not phones and p.use_text_fallbacks:
+            if company_text is None:
+                company_text = soup.get_text()
+            PHONE_EXTRACTOR.extract(company_text, max_phones=p.max_phones, seen=phones)
+        
+        if phones:
+            company_info["phones"] = ", ".join(phones)
+        
+        # Extract website
+        for link in p.website_links.select(soup):
+            website_url = link.get("href", "").strip()
+            if not website_url or "spyur.am" in website_url:
+                continue
+            if p.social_domain_re and p.social_domain_re.search(website_url):
+                continue
+            company_info["website"] = website_url
+            break
+        
+        # Extract social media links
+        social_media_links = []
+        if p.social_links:
+            for social in p.social_links.select(soup):
+                social_url = social.get("href", "").strip()
+                # Skip Spyur's own social media
+                if p.excluded_link_re and p.excluded_link_re.search(social_url):
+                    continue
+                if social_url and social_url not in social_media_links:
+                    social_media_links.append(social_url)
+        
+        if social_media_links:
+            company_info["social_media"] = ", ".join(social_media_links)
+        
+        return company_info
+
+    def extract_multilingual(self, company_url, profile=None):
+        """Extract a company from each of its language variants and merge them
+        
+        The variants are fetched one after another by the same worker, over the
+        engine's pooled session connection, so a company takes one scheduling
+        slot however many languages are crawled. A variant that cannot be
+        fetched leaves its language's fields empty and is listed in the
+        record's missing_languages; the company only fails when every variant
+        does.
+        
+        Args:
+            company_url (str): URL of the company page in any language
+            profile (CompiledProfile, optional): Extraction profile. Defaults to the engine's profile.
+            
+        Returns:
+            dict: Merged company information (see merge_language_variants), or None
+            for Spyur's own pages and companies none of whose variants could be fetched
+        """
+        if is_spyur_own_page(company_url):
+            return None
+        company_url = language_variant_url(company_url, self.languages[0])
+        variants = {}
+        for language in self.languages:
+            record = self.extract_company_info(language_variant_url(company_url, language), profile=profile)
+            if record is not None:
+                variants[language] = record
+        if not variants:
+            self.failed_urls.add(company_url)
+            return None
+        missing = [language for language in self.languages if language not in variants]
+        if missing:
+            self.log(f"⚠️ Keeping {company_url} without its {', '.join(missing)} variant", always=True)
+        merged = merge_language_variants(variants, self.languages)
+        merged["source_url"] = company_url
+        merged["missing_languages"] = ", ".join(missing)
+        return merged
+
+    def _scrape_link(self, link, profile=None):
+        """Fetch and extract one company page, returning None for skipped and failed pages"""
+        if self.languages:
+            return self.extract_multilingual(link, profile=profile)
+        return self.extract_company_info(link, profile=profile)
+
+    def _iter_distinct_companies(self, links):
+        """Drop links to a company already queued in another language"""
+        seen_ids = set()
+        for link in links:
+            key = company_id(link)
+            if key not in seen_ids:
+                seen_ids.add(key)
+                yield language_variant_url(link, self.languages[0])
+
+    def iter_companies(self, list_url, category_name, max_pages=10, max_companies=1000):
+        """Yield company records for one category as they are scraped
+        
+        Links, pages and records flow through one at a time, so memory use does
+        not grow with the number of companies crawled. With more than one
+        worker, company pages are fetched concurrently while the rate limiter
+        keeps the overall request rate unchanged. With a scheduler, the links are
+        visited in priority order and the crawl stops when its time budget is
+        used up.
+        
+        Args:
+            list_url (str): URL of the category list page
+            category_name (str): Category name stored in each record
+            max_pages (int, optional): Maximum number of pages to scrape. Defaults to 10.
+            max_companies (int, optional): Maximum number of companies to scrape. Defaults to 1000.
+            
+        Yields:
+            dict: Company information
+        """
+        profile = self.profile_for(category_name)
+        links = self.iter_company_links(list_url, max_pages=max_pages, max_companies=max_companies, profile=profile)
+        if self.languages:
+            links = self._iter_distinct_companies(links)
+        if self.scheduler:
+            links = self.scheduler.schedule(links)
+        scrape = lambda link: self._scrape_link(link, profile=profile)
+        if self.progress is not None:
+            self.progress.start_category(category_name, max_pages, max_companies)
+        try:
+            if self.tuner is not None:
+                results = imap_bounded(scrape, links, self.tuner.max_workers, limit=self.tuner.limit)
+            else:
+                results = imap_bounded(scrape, links, self.workers)
+            for i, company_info in enumerate(results, 1):
+                if self.progress is not None:
+                    self.progress.company_done()
+                if company_info is None:
+                    continue
+                if self.scheduler and company_info["name"]:
+                    self.scheduler.history.record_fetch(company_info["source_url"], company_info)
+                
+                # Add category information to the company data
+                company_info['category'] = category_name
+                
+                if self.verbose:
+                    print(f"\nProcessed company {i} (limit: {max_companies}): {company_info['source_url']}")
+                    print(f"Company name: {company_info['name']}")
+                    if company_info['director']:
+                        print(f"Director: {company_info['director']}")
+                    if company_info['address']:
+                        print(f"Address: {company_info['address']}")
+                    if company_info['phones']:
+                        print(f"Phones: {company_info['phones']}")
+                    if company_info['website']:
+                        print(f"Website: {company_info['website']}")
+                    if company_info['social_media']:
+                        print(f"Social media: {company_info['social_media']}")
+                    print(f"Category: {company_info['category']}")
+                
+                yield company_info
+        finally:
+            if list_url in self._failed_listings or (self.scheduler and self.scheduler.cut_short):
+                self.incomplete_categories.add(category_name)
+            if self.progress is not None:
+                self.progress.finish_category(category_name)
+
+    def scrape_category(self, category, max_pages=10, max_companies=1000, sink=None, category_name=None):
+        """Scrape one category and write its records to the sink
+        
+        Args:
+            category (str): Category key from CATEGORIES or a full URL
+            max_pages (int, optional): Maximum number of pages to scrape. Defaults to 10.
+            max_companies (int, optional): Maximum number of companies to scrape. Defaults to 1000.
+            sink (object, optional): Sink to write to instead of the engine's own sink
+            category_name (str, optional): Name stored in each record, for category URLs
+                that are not in CATEGORIES (e.g. discovered ones)
+            
+        Yields:
+            dict: Company information, after it has been written to the sink
+        """
+        sink = sink if sink is not None else self.sink
+        list_url, resolved_name = resolve_category(category)
+        category_name = category_name or resolved_name
+        records = self.iter_companies(list_url, category_name, max_pages=max_pages, max_companies=max_companies)
+        if self.link_validator:
+            records = self.link_validator.iter_validated(records)
+        if self.address_normalizer:
+            records = self.address_normalizer.iter_normalized(records)
+        for company_info in records:
+            if sink is not None:
+                sink.write(company_info)
+            yield company_info
+
+    def close(self):
+        """Close the output sink, the archive and the HTTP sessions, and save the crawl history"""
+        if self.sink is not None:
+            self.sink.close()
+        if self.link_validator is not None:
+            self.link_validator.close()
+        if self.scheduler is not None:
+            self.scheduler.history.save()
+        if self.archive is not None:
+            self.archive.close()
+        if self.tuner is not None:
+            self.tuner.print_summary()
+            self.tuner.save()
+        if self.hedger is not None:
+            self.hedger.print_summary()
+            self.hedger.close()
+        if self.progress is not None:
+            self.progress.close()
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+_default_engine = None
+
+def get_default_engine():
+    """Return the shared engine used by the module-level helper functions"""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = CompanyScraper()
+    return _default_engine
+
+def iter_company_links(list_url, max_pages=5, max_companies=1000):
+    """Yield company links from the list pages (see CompanyScraper.iter_company_links)"""
+    return get_default_engine().iter_company_links(list_url, max_pages=max_pages, max_companies=max_companies)
+
+def get_company_links(list_url, max_pages=5, max_companies=1000):
+    """Get company links from the list page using proper pagination
+    
+    Args:
+        list_url (str): URL of the category list page
+        max_pages (int): Maximum number of pages to scrape
+        max_companies (int): Maximum number of companies to collect (for testing)
+        
+    Returns:
+        list: List of company URLs
+    """
+    return get_default_engine().get_company_links(list_url, max_pages=max_pages, max_companies=max_companies)
+
+def extract_company_info(company_url):
+    """Extract company information from a company page
+    
+    Args:
+        company_url (str): URL of the company page
+        
+    Returns:
+        dict: Dictionary containing company information, or None if it was skipped or could not be fetched
+    """
+    return get_default_engine().extract_company_info(company_url)
+
+def parse_company_info(soup, company_url):
+    """Extract company information from an already parsed company page (see CompanyScraper.parse_company_info)"""
+    return get_default_engine().parse_company_info(soup, company_url)
@@ -0,0 +1,175 @@
+"""Fetch plumbing that needs no HTTP client: rate limiting, the page cache and bounded thread pools"""
+import os
+import time
+import hashlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+class RateLimiter:
+    """Enforce a minimum interval between requests, shared by all workers
+    
+    Args:
+        min_interval (float): Minimum number of seconds between two requests
+    """
+
+    def __init__(self, min_interval=1.0):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self):
+        """Block until the next request is allowed"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + self.min_interval
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+
+class PageCache:
+    """Store fetched pages on disk, one file per URL
+    
+    Each file holds the page URL and its HTTP status on its first line
+    followed by the raw HTML, so cached pages can later be re-extracted
+    without the network. Only 2xx pages are stored. Files from before the
+    status was recorded may hold error pages, so they are treated as misses
+    and rewritten on the next fetch.
+    
+    Args:
+        cache_dir (str): Directory where the pages are stored
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def path_for(self, url):
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.html")
+
+    @staticmethod
+    def parse_header(line):
+        """Return (url, status) from the first line of a cache file, status None if unrecorded"""
+        url, _, status = line.rstrip("\n").partition("\t")
+        return url, int(status) if status.isdigit() else None
+
+    @staticmethod
+    def is_usable(status):
+        """Whether a cached entry with this status holds a real page"""
+        return status is not None and 200 <= status < 300
+
+    def get(self, url):
+        """Return the cached HTML for a URL, or None if it is not cached or holds no usable page"""
+        try:
+            with open(self.path_for(url), "r", encoding="utf-8") as f:
+                _, status = self.parse_header(f.readline())
+                return f.read() if self.is_usable(status) else None
+        except FileNotFoundError:
+            return None
+
+    def put(self, url, html, status=200):
+        """Store a page; responses other than 2xx are never cached"""
+        if not self.is_usable(status):
+            return
+        path = self.path_for(url)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(f"{url}\t{status}\n")
+            f.write(html)
+        os.replace(tmp_path, path)
+
+    def __iter__(self):
+        """Yield (url, html) pairs for every usable cached page"""
+        for entry in sorted(os.listdir(self.cache_dir)):
+            if not entry.endswith(".html"):
+                continue
+            with open(os.path.join(self.cache_dir, entry), "r", encoding="utf-8") as f:
+                url, status = self.parse_header(f.readline())
+                if self.is_usable(status):
+                    yield url, f.read()
+
+def imap_bounded(func, iterable, workers=1, limit=None):
+    """Map func over iterable with a thread pool, yielding results in order
+    
+    At most ``workers * 2`` items are in flight at any time, so the input can
+    be an unbounded iterator.
+    
+    Args:
+        func (callable): Function applied to each item
+        iterable (iterable): Input items
+        workers (int): Number of worker threads; 1 runs inline
+        limit (callable, optional): Returns how many items may be in flight. It is read
+            before every submission, so the concurrency can change during the run.
+            Defaults to workers * 2.
+        
+    Yields:
+        Results of func, in input order
+    """
+    if workers <= 1 and limit is None:
+        for item in iterable:
+            yield func(item)
+        return
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for item in iterable:
+            pending.append(executor.submit(func, item))
+            while pending and len(pending) >= (limit() if limit else workers * 2):
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+class PageRejected(Exception):
+    """Raised when a response is refused before or while it is downloaded"""
+
+class HTTPStatusError(Exception):
+    """Raised for a response whose status is not 2xx
+    
+    Args:
+        url (str): URL that was requested
+        status (int): HTTP status code
+        retry_after (float, optional): Seconds the server asked to wait (see parse_retry_after)
+    """
+
+    def __init__(self, url, status, retry_after=None):
+        super().__init__(f"HTTP {status} from {url}")
+        self.url = url
+        self.status = status
+        self.retry_after = retry_after
+
+    @property
+    def retryable(self):
+        """Whether the request may succeed when sent again (429 and 5xx)"""
+        return self.status == 429 or self.status >= 500
+
+def parse_retry_after(value):
+    """Return the seconds a Retry-After header asks to wait, or None if it cannot be read
+    
+    Args:
+        value (str): Header value, a number of seconds or an HTTP date
+        
+    Returns:
+        float: Seconds to wait, never negative
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+def site_host(url):
+    """Return the host of a URL without a leading "www." for same-site checks"""
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
@@ -0,0 +1,106 @@
+"""Hedged requests: race a second copy of a slow company page fetch"""
+import math
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+class RequestHedger:
+    """Issue a duplicate of a fetch that runs past the observed p95 latency
+    
+    The first copy to succeed wins; a copy that raises, as download() does
+    for a 429 or 5xx status, never wins, and the race waits for the other.
+    The loser is left to finish in the background and its response is
+    dropped. The caller queues for the rate limiter before the race and
+    passes a primary that sends at once, so the hedge delay times the server
+    and not the queue, matching the latencies fed to observe(). The hedge
+    goes through the engine's download() and waits for the rate limiter like
+    any other request, on another connection from the session's pool. Hedging
+    starts once min_samples latencies have been seen, and at most
+    max_hedge_ratio of the fetches are hedged.
+    
+    Args:
+        quantile (float, optional): Latency quantile after which a fetch is hedged. Defaults to 0.95.
+        min_samples (int, optional): Fetches observed before hedging starts. Defaults to 20.
+        window (int, optional): Recent latencies the quantile is taken over. Defaults to 500.
+        max_hedge_ratio (float, optional): Largest share of fetches that may be hedged. Defaults to 0.1.
+        workers (int, optional): Threads racing the copies. Defaults to 32.
+    """
+
+    def __init__(self, quantile=0.95, min_samples=20, window=500, max_hedge_ratio=0.1, workers=32):
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.fetches = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hedge")
+
+    def observe(self, latency):
+        """Record the latency of a successful fetch"""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def delay(self):
+        """Seconds after which a fetch is hedged, or None while there are too few samples"""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        return latencies[max(0, math.ceil(self.quantile * len(latencies)) - 1)]
+
+    def run(self, download, url, primary=None):
+        """Call download(url), racing a second call if the first is slower than delay()
+        
+        Args:
+            download (callable): Function fetching a URL and returning its result
+            url (str): URL to fetch
+            primary (callable, optional): Function sending the first copy, e.g. download
+                without its rate-limiter wait once the caller has waited. Defaults to download.
+            
+        Returns:
+            The result of whichever call succeeded first
+        """
+        delay = self.delay()
+        with self._lock:
+            self.fetches += 1
+            allowed = self.hedged < self.max_hedge_ratio * self.fetches
+        send = primary or download
+        if delay is None or not allowed:
+            return send(url)
+        
+        primary = self._executor.submit(send, url)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+        with self._lock:
+            self.hedged += 1
+        hedge = self._executor.submit(download, url)
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def stats(self):
+        """Return the fetch, hedge and hedge-win counts"""
+        with self._lock:
+            return {"fetches": self.fetches, "hedged": self.hedged, "hedge_wins": self.hedge_wins}
+
+    def print_summary(self):
+        if not self.fetches:
+            return
+        print(f"🪃 Hedged {self.hedged} of {self.fetches} company fetches ({self.hedged / self.fetches:.1%}); "
+              f"the hedge won {self.hedge_wins} times")
+
+    def close(self):
+        """Stop the racing threads once the copies still running have finished"""
+        self._executor.shutdown(wait=False)
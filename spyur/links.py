@@ -0,0 +1,176 @@
+"""Liveness checks for companies' external links"""
+import os
+import time
+import json
+import socket
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+
+from .config import HEADERS, LINK_CACHE_TTL
+
+DNS_CACHE_TTL = 3600
+LINK_FAILURE_TTL = 600  # timeouts and connection errors may be a blip: recheck them soon
+
+class LinkValidator:
+    """Checks that companies' external links are alive, politely
+    
+    Websites and social media links point at arbitrary hosts, so they are
+    checked on a separate session and thread pool from the spyur.am crawl:
+    at most per_host requests run against one host at a time, host names
+    are resolved once and cached (a host that does not resolve is never
+    requested), and each URL's result is cached for ttl seconds, optionally
+    in a JSON file shared between runs. Timeouts, connection and DNS errors
+    are only kept for failure_ttl seconds and never saved to the file. A HEAD
+    request is tried first and a streamed GET, whose body is never read, only
+    when HEAD is refused.
+    
+    Args:
+        workers (int, optional): Concurrent checks. Defaults to 16.
+        per_host (int, optional): Concurrent checks against one host. Defaults to 2.
+        timeout (float, optional): Connect and read timeout in seconds. Defaults to 5.
+        cache_path (str, optional): JSON file for the result cache. Defaults to in memory.
+        ttl (float, optional): Seconds a result stays valid. Defaults to one week.
+        failure_ttl (float, optional): Seconds a timeout, connection or DNS error stays
+            valid. Defaults to LINK_FAILURE_TTL.
+        max_pending (int, optional): Records waiting for their checks before the crawl
+            feeding iter_validated() is held back. Defaults to 10000.
+    """
+
+    FAILURES = ("dns_error", "timeout", "connection_error")
+
+    def __init__(self, workers=16, per_host=2, timeout=5, cache_path=None, ttl=LINK_CACHE_TTL,
+                 failure_ttl=LINK_FAILURE_TTL, max_pending=10000):
+        self.workers = workers
+        self.per_host = per_host
+        self.timeout = timeout
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self.max_pending = max_pending
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=workers, pool_maxsize=per_host)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._lock = threading.Lock()
+        self._host_slots = {}
+        self._dns = {}
+        self.results = {}
+        if cache_path:
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    self.results = json.load(f)
+            except (FileNotFoundError, ValueError):
+                self.results = {}
+            # Files written before failures were kept out of them may still hold some
+            self.results = {url: result for url, result in self.results.items() if result["status"] not in self.FAILURES}
+
+    def _host_slot(self, host):
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return slot
+
+    def resolves(self, host):
+        """Return True if a host name resolves, caching the answer for DNS_CACHE_TTL"""
+        now = time.time()
+        cached = self._dns.get(host)
+        if cached and now - cached[1] < DNS_CACHE_TTL:
+            return cached[0]
+        try:
+            socket.getaddrinfo(host, None)
+            ok = True
+        except (socket.gaierror, UnicodeError):
+            ok = False
+        self._dns[host] = (ok, now)
+        return ok
+
+    def check(self, url):
+        """Check one URL
+        
+        Returns:
+            dict: {"status": HTTP status code as text, or "invalid_url", "dns_error",
+            "timeout" or "connection_error", "url": the URL after redirects, "checked_at": timestamp}
+        """
+        cached = self.results.get(url)
+        if cached:
+            ttl = self.failure_ttl if cached["status"] in self.FAILURES else self.ttl
+            if time.time() - cached["checked_at"] < ttl:
+                return cached
+        
+        try:
+            host = (urlparse(url).hostname or "").lower()
+        except ValueError:
+            # A malformed scraped href, e.g. "http://[abc/x"
+            host = None
+        result = {"status": "dns_error" if host is not None else "invalid_url", "url": url, "checked_at": time.time()}
+        if host and self.resolves(host):
+            with self._host_slot(host):
+                try:
+                    response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+                    if response.status_code in (403, 405, 501):
+                        # Some servers refuse HEAD; the GET body is never downloaded
+                        response.close()
+                        response = self.session.get(url, timeout=self.timeout, allow_redirects=True, stream=True)
+                    response.close()
+                    result = {"status": str(response.status_code), "url": response.url, "checked_at": time.time()}
+                except requests.Timeout:
+                    result["status"] = "timeout"
+                except requests.RequestException:
+                    result["status"] = "connection_error"
+        
+        with self._lock:
+            self.results[url] = result
+        return result
+
+    def validate(self, record):
+        """Add website_status, website_resolved and social_media_resolved to a record"""
+        website = record.get("website", "")
+        if website:
+            result = self.check(website)
+            record["website_status"] = result["status"]
+            record["website_resolved"] = result["url"]
+        else:
+            record["website_status"] = ""
+            record["website_resolved"] = ""
+        social_links = [link for link in record.get("social_media", "").split(", ") if link]
+        record["social_media_resolved"] = ", ".join(self.check(link)["url"] for link in social_links)
+        return record
+
+    def iter_validated(self, records):
+        """Validate a stream of records in the background, yielding them in order
+        
+        Every record is queued for checking as soon as it arrives and handed on
+        once its checks are done. The crawl producing the records is only held
+        back when max_pending of them are waiting, so slow third-party hosts do
+        not slow down the spyur.am crawl.
+        """
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="links") as executor:
+            pending = deque()
+            for record in records:
+                pending.append(executor.submit(self.validate, record))
+                while pending and (pending[0].done() or len(pending) >= self.max_pending):
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def save(self):
+        """Write the result cache to its file, if it has one"""
+        if not self.cache_path:
+            return
+        directory = os.path.dirname(self.cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            results = {url: result for url, result in self.results.items() if result["status"] not in self.FAILURES}
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump(results, f, ensure_ascii=False)
+
+    def close(self):
+        self.save()
+        self.session.close()
@@ -0,0 +1,472 @@
+"""Listing pages: company links, the paging block and pagination schemes"""
+import re
+import traceback
+from collections import namedtuple
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+from .config import CATEGORIES
+from .profiles import default_compiled_profile
+
+PagingInfo = namedtuple("PagingInfo", ["found", "links", "after_active_href", "active_page"])
+PagingInfo.__doc__ = """What a listing page's paging block offers: whether it exists, its (text, href) links in order, the href of the link right after the active page and the active page number (None when not marked)"""
+
+ListingPage = namedtuple("ListingPage", ["company_links", "paging", "indicator_href"])
+ListingPage.__doc__ = """Result of parse_listing(): company hrefs, PagingInfo and the first next-page indicator href"""
+
+def extract_paging_info(soup, profile):
+    """Read the paging block of a parsed listing page into a PagingInfo"""
+    paging_element = profile.paging.select_one(soup)
+    if not paging_element:
+        return PagingInfo(False, [], None, None)
+    
+    anchors = paging_element.find_all('a', href=True)
+    links = [(a.text.strip(), a.get('href')) for a in anchors]
+    after_active_href = None
+    active_page = None
+    active = paging_element.find(class_='active')
+    if active:
+        active_text = active.get_text(strip=True)
+        active_page = int(active_text) if active_text.isdigit() else None
+        # The active element might be an <a> or a separate element
+        if active.name == 'a':
+            if active in anchors:
+                index = anchors.index(active)
+                if index < len(anchors) - 1:
+                    after_active_href = anchors[index + 1].get('href')
+        else:
+            next_link = active.find_next_sibling('a')
+            if next_link and next_link.get('href'):
+                after_active_href = next_link.get('href')
+    return PagingInfo(True, links, after_active_href, active_page)
+
+def find_next_indicator_href(anchors, profile):
+    """Return the href of the first non-company link marked as "next", honouring the indicator order
+    
+    Args:
+        anchors (list): <a> tags with an href
+        profile (CompiledProfile): Profile supplying next_indicators
+        
+    Returns:
+        str or None: The href, or None if no link matches
+    """
+    for indicator in profile.next_indicators:
+        for a in anchors:
+            href = a.get('href')
+            if '/companies/' in href:
+                continue
+            if (indicator in a.text.strip().lower() or
+                    indicator in a.get('title', '').lower() or
+                    indicator in a.get('class', [])):
+                return href
+    return None
+
+class ListingPageParser(HTMLParser):
+    """Streaming tokenizer that collects only what a listing page is needed for
+    
+    No tree is built: the parser keeps a stack of open tags with two flags
+    (inside a company container, inside the paging block) and records
+    company hrefs, paging links, the link after the active page and the
+    first next-page indicator. Everything else on the page is skipped as it
+    streams past.
+    
+    Args:
+        container_class (str or None): Class of the element wrapping each company link
+            ("company-title"), or None to accept every /companies/ link
+        paging_class (str): Class of the paging block ("paging")
+        next_indicators (list): Lowercased next-page indicator strings
+    """
+
+    VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+    def __init__(self, container_class, paging_class, next_indicators):
+        super().__init__(convert_charrefs=True)
+        self.container_class = container_class
+        self.paging_class = paging_class
+        self.next_indicators = next_indicators
+        self.container_links = []
+        self.company_links = []
+        self.paging_found = False
+        self.paging_links = []
+        self.after_active_href = None
+        self.indicator_href = None
+        self.done = False
+        self._indicator_rank = len(next_indicators)
+        self.active_text = []
+        self._active_seen = False
+        self._active_depth = None
+        self._waiting_after_active = False
+        self._stack = []
+        self._anchor = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+        in_container, in_paging = self._stack[-1][1:3] if self._stack else (False, False)
+        is_paging_root = not in_paging and self.paging_class in classes
+        in_container = in_container or (self.container_class in classes if self.container_class else False)
+        in_paging = in_paging or is_paging_root
+        if is_paging_root:
+            self.paging_found = True
+        
+        is_active = in_paging and "active" in classes and not self._active_seen
+        if is_active:
+            self._active_seen = True
+        
+        if tag == "a":
+            href = attrs.get("href")
+            if href and in_paging and self._waiting_after_active and not is_active:
+                self.after_active_href = href
+                self._waiting_after_active = False
+            self._anchor = {"href": href, "title": attrs.get("title") or "", "classes": classes,
+                            "text": [], "in_container": in_container, "in_paging": in_paging}
+        
+        if is_active:
+            # The next link in the paging block is the next page
+            self._waiting_after_active = True
+            if tag not in self.VOID_TAGS:
+                self._active_depth = len(self._stack)
+        
+        if tag not in self.VOID_TAGS:
+            self._stack.append((tag, in_container, in_paging, is_paging_root))
+
+    def handle_endtag(self, tag):
+        if tag in self.VOID_TAGS:
+            return
+        if tag == "a" and self._anchor is not None:
+            self._finish_anchor()
+        # Pop up to the matching open tag; stray end tags are ignored
+        for depth in range(len(self._stack) - 1, -1, -1):
+            if self._stack[depth][0] == tag:
+                for closed in self._stack[depth:]:
+                    if closed[3] and self.company_links:
+                        # A paging block that ends after the company list closes the useful part of the page
+                        self.done = True
+                del self._stack[depth:]
+                if self._active_depth is not None and depth <= self._active_depth:
+                    self._active_depth = None
+                break
+
+    def handle_data(self, data):
+        if self._anchor is not None:
+            self._anchor["text"].append(data)
+        if self._active_depth is not None:
+            self.active_text.append(data)
+
+    def _finish_anchor(self):
+        anchor, self._anchor = self._anchor, None
+        href = anchor["href"]
+        if not href:
+            return
+        if "/companies/" in href:
+            self.company_links.append(href)
+            if anchor["in_container"]:
+                self.container_links.append(href)
+            return
+        text = "".join(anchor["text"]).strip()
+        if anchor["in_paging"]:
+            self.paging_links.append((text, href))
+        if self._indicator_rank:
+            lowered_text = text.lower()
+            lowered_title = anchor["title"].lower()
+            for rank, indicator in enumerate(self.next_indicators[:self._indicator_rank]):
+                if indicator in lowered_text or indicator in lowered_title or indicator in anchor["classes"]:
+                    self._indicator_rank = rank
+                    self.indicator_href = href
+                    break
+
+LISTING_CHUNK_SIZE = 32 * 1024
+
+def parse_listing(html, profile):
+    """Extract company links and paging from a listing page without building a tree
+    
+    The HTML is fed to a ListingPageParser in chunks, and parsing stops once
+    the paging block that follows the company list has been read.
+    
+    Args:
+        html (str): Listing page HTML
+        profile (CompiledProfile): Profile supplying the container and paging classes
+        
+    Returns:
+        ListingPage or None: None when the profile's selectors are too complex for
+        the tokenizer and the page has to be parsed into a tree instead
+    """
+    if not profile.paging_class:
+        return None
+    parser = ListingPageParser(profile.listing_container_class, profile.paging_class, profile.next_indicators)
+    for start in range(0, len(html), LISTING_CHUNK_SIZE):
+        parser.feed(html[start:start + LISTING_CHUNK_SIZE])
+        if parser.done:
+            break
+    else:
+        parser.close()
+    
+    company_links = parser.container_links or parser.company_links
+    active_text = "".join(parser.active_text).strip()
+    paging = PagingInfo(parser.paging_found, parser.paging_links, parser.after_active_href,
+                        int(active_text) if active_text.isdigit() else None)
+    return ListingPage(company_links, paging, parser.indicator_href)
+
+class PaginationScheme:
+    """How one category numbers its listing pages
+    
+    The scheme is detected from a listing URL once (``/yellow_pages-N/``, the
+    older ``/yellow_page-N`` or a ``page=N`` query parameter) and then turns
+    page numbers straight into URLs, so following a category's pages does
+    not need the paging HTML at all.
+    
+    Args:
+        kind (str): "yellow_pages", "yellow_page" or "page"
+        prefix (str): URL text before the page number
+        suffix (str): URL text after the page number
+    """
+
+    PATTERNS = {
+        "yellow_pages": re.compile(r'/yellow_pages(?:-([0-9]+))?(?=/)'),
+        "yellow_page": re.compile(r'/yellow_page(?:-([0-9]+))?(?![\w-])'),
+        "page": re.compile(r'[?&]page=([0-9]+)'),
+    }
+
+    def __init__(self, kind, prefix, suffix):
+        self.kind = kind
+        self.prefix = prefix
+        self.suffix = suffix
+
+    @classmethod
+    def detect(cls, url):
+        """Return the scheme a listing URL uses, or None if it has no recognisable page number"""
+        for kind, pattern in cls.PATTERNS.items():
+            match = pattern.search(url)
+            if not match:
+                continue
+            if kind == "page":
+                return cls(kind, url[:match.start(1)], url[match.end(1):])
+            # Dashed schemes put the number after the path segment and leave it out on page 1
+            stem_end = match.start(1) - 1 if match.group(1) else match.end()
+            return cls(kind, url[:stem_end], url[match.end():])
+        return None
+
+    def page_number(self, url):
+        """Return the page number of a URL following this scheme (1 when it carries none)"""
+        match = self.PATTERNS[self.kind].search(url)
+        return int(match.group(1)) if match and match.group(1) else 1
+
+    def url_for(self, page):
+        """Build the URL of a page number"""
+        if self.kind == "page":
+            return f"{self.prefix}{page}{self.suffix}"
+        if page == 1:
+            return f"{self.prefix}{self.suffix}"
+        return f"{self.prefix}-{page}{self.suffix}"
+
+    def confirms(self, url, paging):
+        """Cheap marker check: does the paging block agree with the page this URL should be?
+        
+        The block has to exist, show at least one numbered link, and mark the
+        expected page number as active when it marks one at all.
+        """
+        if not paging.found or not any(text.isdigit() for text, _ in paging.links):
+            return False
+        return paging.active_page is None or paging.active_page == self.page_number(url)
+
+    def next_url(self, url, paging):
+        """Return the URL of the page after this one, or None on the last page"""
+        page = self.page_number(url)
+        if any(text.isdigit() and int(text) > page for text, _ in paging.links):
+            return self.url_for(page + 1)
+        return None
+
+def _print_log(message, always=False):
+    print(message)
+
+def find_next_page_url(source, current_url, profile=None, log=None):
+    """Find the URL for the next page in pagination
+    
+    Args:
+        source (BeautifulSoup or ListingPage): Parsed current page, either a full
+            BeautifulSoup tree or the result of parse_listing()
+        current_url (str): Current page URL
+        profile (CompiledProfile, optional): Extraction profile supplying the paging
+            selector and next-page indicators. Defaults to DEFAULT_PROFILE.
+        log (callable, optional): Receives progress messages, and always=True for
+            errors, e.g. CompanyScraper.log. Defaults to print.
+        
+    Returns:
+        str or None: URL of the next page, or None if not found
+    """
+    log = log or _print_log
+    try:
+        # Check for the correct yellow_pages format
+        yellow_pages_match = re.search(r'/yellow_pages(?:-([0-9]+))?/', current_url)
+        # Also check for the old format just in case
+        yellow_page_match = re.search(r'/yellow_page(?:-([0-9]+))?', current_url)
+        page_match = re.search(r'[?&]page=([0-9]+)', current_url)
+        
+        # Determine current page number
+        current_page = 1
+        if yellow_pages_match:
+            # If it's yellow_pages-2, yellow_pages-3, etc.
+            if yellow_pages_match.group(1):
+                current_page = int(yellow_pages_match.group(1))
+            # If it's just yellow_pages (first page)
+            else:
+                current_page = 1
+        elif yellow_page_match:
+            # If it's yellow_page-2, yellow_page-3, etc.
+            if yellow_page_match.group(1):
+                current_page = int(yellow_page_match.group(1))
+            # If it's just yellow_page (first page)
+            else:
+                current_page = 1
+        elif page_match:
+            current_page = int(page_match.group(1))
+        
+        log(f"Current page detected as: {current_page}")
+        
+        profile = profile or default_compiled_profile()
+        if isinstance(source, ListingPage):
+            paging = source.paging
+            find_indicator_href = lambda: source.indicator_href
+        else:
+            paging = extract_paging_info(source, profile)
+            find_indicator_href = lambda: find_next_indicator_href(source.find_all('a', href=True), profile)
+        
+        # Look for the paging element specific to Spyur.am
+        if paging.found:
+            log(f"Found paging element with {len(paging.links)} links")
+            
+            # Find all page links that contain numeric text (likely page numbers)
+            page_links = []
+            for link_text, href in paging.links:
+                if link_text.isdigit():
+                    page_number = int(link_text)
+                    if page_number == current_page + 1:  # This is the next page
+                        return urljoin(current_url, href)
+                    page_links.append((page_number, href))
+            
+            # If we didn't find the exact next page number, look for the next highest page
+            if page_links:
+                # Sort by page number
+                page_links.sort(key=lambda x: x[0])
+                for page_number, href in page_links:
+                    if page_number > current_page:
+                        return urljoin(current_url, href)
+            
+            # Try the link that follows the active page
+            if paging.after_active_href:
+                return urljoin(current_url, paging.after_active_href)
+        
+        # If we couldn't find the next page using the paging element,
+        # look for any links that might be for pagination
+        # This includes links with text like "Next", "→", etc.
+        indicator_href = find_indicator_href()
+        if indicator_href:
+            return urljoin(current_url, indicator_href)
+        
+        # If we still haven't found a next page link, try to construct it from the current URL
+        # This is a fallback method that works for Spyur.am
+        next_page = current_page + 1
+        
+        # Handle yellow_pages format (the correct format)
+        if yellow_pages_match:
+            # Extract the query parameters
+            query_params = ''
+            if '?' in current_url:
+                query_params = current_url.split('?', 1)[1]
+            
+            # If we're on yellow_pages (first page), next should be yellow_pages-2
+            if current_page == 1:
+                # Make sure we're dealing with the first page format
+                if '/yellow_pages/' in current_url and '/yellow_pages-' not in current_url:
+                    # Get the base part of the URL (before query parameters)
+                    base_url_parts = current_url.split('?')[0]
+                    
+                    # Ensure we have a trailing slash before adding the page number
+                    if not base_url_parts.endswith('/'):
+                        base_url_parts += '/'
+                    
+                    # Replace /yellow_pages/ with /yellow_pages-2/
+                    base_url = re.sub(r'/yellow_pages/?', f'/yellow_pages-2/', base_url_parts)
+                    
+                    # Add query parameters if they exist
+                    if query_params:
+                        return f"{base_url}?{query_params}"
+                    return base_url
+            
+            # If we're on yellow_pages-N, next should be yellow_pages-(N+1)
+            elif current_page >= 2:
+                # Get the base part of the URL (before query parameters)
+                base_url_parts = current_url.split('?')[0]
+                
+                # Replace yellow_pages-N with yellow_pages-(N+1)
+                base_url = re.sub(r'/yellow_pages-[0-9]+/?', f'/yellow_pages-{next_page}/', base_url_parts)
+                
+                # Add query parameters if they exist
+                if query_params:
+                    return f"{base_url}?{query_params}"
+                return base_url
+        
+        # Handle old yellow_page format (for backward compatibility)
+        elif yellow_page_match:
+            # Extract the query parameters
+            query_params = ''
+            if '?' in current_url:
+                query_params = current_url.split('?', 1)[1]
+                base_url = current_url.split('?')[0]
+            else:
+                base_url = current_url
+            
+            # If we're on yellow_page (first page), next should be yellow_page-2
+            if current_page == 1 and '/yellow_page' in current_url and '/yellow_page-' not in current_url:
+                new_base_url = re.sub(r'/yellow_page', f'/yellow_page-2', base_url)
+                if query_params:
+                    return f"{new_base_url}?{query_params}"
+                return new_base_url
+            # If we're on yellow_page-N, next should be yellow_page-(N+1)
+            elif current_page >= 2:
+                new_base_url = re.sub(r'/yellow_page-[0-9]+', f'/yellow_page-{next_page}', base_url)
+                if query_params:
+                    return f"{new_base_url}?{query_params}"
+                return new_base_url
+        
+        # Handle standard page parameter format
+        elif page_match:
+            return re.sub(r'page=[0-9]+', f'page={next_page}', current_url)
+        elif '?' in current_url:
+            return f"{current_url}&page={next_page}"
+        else:
+            # If no pagination format detected, try to find a better fallback
+            
+            # Check if we're on a category page that should use yellow_pages format
+            if any(cat_url in current_url for cat_url in CATEGORIES.values()):
+                # If we're already on a yellow_pages URL but no match was found earlier
+                if '/yellow_pages' in current_url:
+                    # Try to construct the next page URL
+                    if '/yellow_pages/' in current_url and '/yellow_pages-' not in current_url:
+                        # We're on the first page, next should be page 2
+                        base_url = current_url.rstrip('/')
+                        if '?' in base_url:
+                            # Split URL into base part and query part
+                            base_part = base_url.split('?')[0]
+                            # Construct the next page URL with original query parameters
+                            return f"{base_part.replace('/yellow_pages', '/yellow_pages-2')}?{query_params}"
+                        else:
+                            # No query parameters
+                            return base_url.replace('/yellow_pages', '/yellow_pages-2')
+                else:
+                    # We're not on a yellow_pages URL yet, so add it
+                    if current_url.endswith('/'):
+                        return f"{current_url}yellow_pages/"
+                    else:
+                        return f"{current_url}/yellow_pages/"
+            
+            # Last resort: add a page parameter
+            if current_url.endswith('/'):
+                return f"{current_url}?page={next_page}"
+            else:
+                return f"{current_url}/?page={next_page}"
+            
+    except Exception as e:
+        log(f"Error finding next page: {e}", always=True)
+        log(traceback.format_exc().rstrip(), always=True)  # Print the full traceback for debugging
+        return None
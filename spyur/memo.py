@@ -0,0 +1,72 @@
+"""Bounded memoization of the text cleaners, with hit-rate reporting"""
+from functools import lru_cache, wraps
+
+MEMO_SIZE = 4096
+# Longer inputs (whole page texts) are computed directly so they never fill the caches
+MEMO_MAX_LENGTH = 1000
+
+_caches = {}
+
+def register_memo(name, cached):
+    """Report an lru_cache-wrapped function's hit rate under name in memo_stats()"""
+    _caches[name] = cached
+    return cached
+
+def memoized(name, maxsize=MEMO_SIZE, max_length=MEMO_MAX_LENGTH):
+    """Decorator memoizing a pure function of a string in a bounded LRU cache
+    
+    The cache is functools.lru_cache, which is safe to share between the
+    threads of a crawl's worker pool. Processes of a process pool each get
+    their own caches; their memo_stats() can be combined with
+    merge_memo_stats(). Cached results must be immutable (strings, tuples).
+    
+    Args:
+        name (str): Name the cache is reported under
+        maxsize (int, optional): Entries kept. Defaults to MEMO_SIZE.
+        max_length (int, optional): Strings longer than this bypass the cache.
+            Defaults to MEMO_MAX_LENGTH.
+    """
+    def decorate(func):
+        cached = lru_cache(maxsize=maxsize)(func)
+        
+        @wraps(func)
+        def wrapper(text, *args):
+            if isinstance(text, str) and len(text) > max_length:
+                return func(text, *args)
+            return cached(text, *args)
+        
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        register_memo(name, wrapper)
+        return wrapper
+    return decorate
+
+def memo_stats():
+    """Return {name: {"hits", "misses", "currsize", "maxsize"}} for every registered cache"""
+    return {name: cached.cache_info()._asdict() for name, cached in _caches.items()}
+
+def merge_memo_stats(*snapshots):
+    """Add up memo_stats() snapshots, e.g. one per worker process"""
+    merged = {}
+    for snapshot in snapshots:
+        for name, info in snapshot.items():
+            total = merged.setdefault(name, {"hits": 0, "misses": 0, "currsize": 0, "maxsize": info["maxsize"]})
+            for key in ("hits", "misses", "currsize"):
+                total[key] += info[key]
+    return merged
+
+def clear_memo_caches():
+    """Empty every registered cache"""
+    for cached in _caches.values():
+        cached.cache_clear()
+
+def print_memo_summary(stats=None):
+    """Print the hit rate of every cache that was used"""
+    stats = memo_stats() if stats is None else stats
+    parts = []
+    for name, info in stats.items():
+        calls = info["hits"] + info["misses"]
+        if calls:
+            parts.append(f"{name} {info['hits'] / calls:.0%} of {calls}")
+    if parts:
+        print(f"🧠 Cache hit rates: {', '.join(parts)}")
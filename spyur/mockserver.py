@@ -0,0 +1,311 @@
+"""Local stand-in for spyur.am with injectable faults, for load and resilience testing
+
+The server generates listing and company pages on the fly from company
+numbers, using the same markup the scraper reads on spyur.am (``.paging``,
+``.company-title``, ``.info-line``, ``.address_block``, ``.company-phones``),
+so a 100k-company crawl needs no memory for the site itself. Every response
+can be delayed, answered with 429 or 5xx, cut short or dripped out slowly,
+at configurable rates.
+"""
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+MOCK_DIRECTORS = ["Արամ Պետրոսյան", "Անի Սարգսյան", "Դավիթ Հակոբյան", "Լիլիթ Գրիգորյան", "Կարեն Մկրտչյան",
+                  "Նարինե Ավետիսյան", "Տիգրան Վարդանյան", "Մարինե Խաչատրյան"]
+MOCK_STREETS = ["Աբովյան փող.", "Մաշտոցի պող.", "Տիգրան Մեծի պող.", "Կոմիտասի պող.", "Բաղրամյան պող.", "Սայաթ-Նովայի պող."]
+LISTING_PATH_RE = re.compile(r'^/(am|en|ru)/yellow_pages(?:-([0-9]+))?/$')
+COMPANY_PATH_RE = re.compile(r'^/(am|en|ru)/companies/[\w-]+/([0-9]+)/$')
+
+class MockSite:
+    """Synthetic company directory served by MockSpyurServer
+    
+    Companies are numbered from 1 and split evenly across the categories.
+    Directors and addresses repeat every few companies, the way chain stores
+    and branches repeat them on spyur.am.
+    
+    Args:
+        companies (int, optional): Number of companies. Defaults to 1000.
+        categories (int, optional): Number of categories. Defaults to 1.
+        per_page (int, optional): Companies per listing page. Defaults to 20.
+    """
+
+    def __init__(self, companies=1000, categories=1, per_page=20):
+        self.companies = companies
+        self.categories = categories
+        self.per_page = per_page
+        self.per_category = math.ceil(companies / categories)
+
+    def category_query(self, category):
+        return f"?type=bd&yp_cat1=&yp_cat2=mock.{category}&yp_cat3=&search=Search"
+
+    def category_urls(self, base_url, language="am"):
+        """Return {category name: first listing page URL} for scrape_all_categories(categories=...)"""
+        return {f"mock_{category}": f"{base_url}/{language}/yellow_pages/{self.category_query(category)}"
+                for category in range(1, self.categories + 1)}
+
+    def category_range(self, category):
+        """Return the range of company numbers listed in a category"""
+        first = (category - 1) * self.per_category + 1
+        return range(first, min(first + self.per_category, self.companies + 1))
+
+    def listing_page(self, language, category, page):
+        """Return the HTML of a listing page, or None if the category or page does not exist"""
+        if not 1 <= category <= self.categories:
+            return None
+        companies = self.category_range(category)
+        last_page = max(1, math.ceil(len(companies) / self.per_page))
+        if not 1 <= page <= last_page:
+            return None
+        query = self.category_query(category)
+        
+        def page_url(number):
+            return f"/{language}/yellow_pages{'' if number == 1 else f'-{number}'}/{query}"
+        
+        parts = ["<html><body>"]
+        start = (page - 1) * self.per_page
+        for number in companies[start:start + self.per_page]:
+            parts.append(f'<div class="company-title"><a href="/{language}/companies/mock-company-{number}/{number}/">Mock Company {number}</a></div>')
+        # A window of page numbers around the active one, like the paging block on spyur.am
+        parts.append('<div class="paging">')
+        if page > 1:
+            parts.append(f'<a href="{page_url(1)}">First</a>')
+        for number in range(max(1, page - 4), min(last_page, page + 4) + 1):
+            if number == page:
+                parts.append(f'<span class="active">{number}</span>')
+            else:
+                parts.append(f'<a href="{page_url(number)}">{number}</a>')
+        if page < last_page:
+            parts.append(f'<a href="{page_url(last_page)}">Last</a>')
+        parts.append("</div></body></html>")
+        return "".join(parts)
+
+    def company_page(self, number):
+        """Return the HTML of a company page, or None if there is no such company"""
+        if not 1 <= number <= self.companies:
+            return None
+        director = MOCK_DIRECTORS[number % len(MOCK_DIRECTORS)]
+        street = MOCK_STREETS[number % len(MOCK_STREETS)]
+        house = number % 12 + 1
+        phone = f"{number % 1000000:06d}"
+        return (
+            f'<html><body><h1 class="company-title">Mock Company {number} ՍՊԸ</h1>'
+            f'<div class="company-info"><div class="info-line"><span class="info-label">Ղեկավար</span>'
+            f'<span class="info-value">{director}, տնօրեն</span></div></div>'
+            f'<div class="address_block">Երևան, {street} {house}</div>'
+            f'<div class="company-phones"><span class="phone-item">(010) {phone[:2]}-{phone[2:4]}-{phone[4:]}</span></div>'
+            f'<a href="https://mock-company-{number}.am">site</a><a href="https://facebook.com/mock.company.{number}">fb</a>'
+            f'</body></html>'
+        )
+
+    def render(self, path, query):
+        """Return the HTML for a request path, or None for a 404"""
+        match = COMPANY_PATH_RE.match(path)
+        if match:
+            return self.company_page(int(match.group(2)))
+        match = LISTING_PATH_RE.match(path)
+        category = re.search(r'yp_cat2=mock\.([0-9]+)', query)
+        if match and category:
+            return self.listing_page(match.group(1), int(category.group(1)), int(match.group(2) or 1))
+        return None
+
+class FaultProfile:
+    """Rates and sizes of the faults MockSpyurServer injects
+    
+    Each request draws at most one fault; the rates are probabilities
+    between 0 and 1 and must add up to at most 1.
+    
+    Args:
+        latency (float, optional): Seconds added before every response. Defaults to 0.
+        jitter (float, optional): Extra random delay of up to this many seconds. Defaults to 0.
+        rate_429 (float, optional): Share of responses answered with 429 Too Many Requests. Defaults to 0.
+        rate_5xx (float, optional): Share answered with 500, 502 or 503. Defaults to 0.
+        truncate (float, optional): Share whose body is cut off halfway, with the full
+            Content-Length announced. Defaults to 0.
+        drip (float, optional): Share whose body is sent in small pieces over drip_seconds. Defaults to 0.
+        drip_seconds (float, optional): How long a dripped body takes. Defaults to 5.
+        retry_after (int, optional): Retry-After seconds sent with a 429. Defaults to 1.
+        seed (int, optional): Seed making the fault sequence reproducible. Defaults to None.
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, rate_429=0.0, rate_5xx=0.0, truncate=0.0, drip=0.0,
+                 drip_seconds=5.0, retry_after=1, seed=None):
+        if rate_429 + rate_5xx + truncate + drip > 1:
+            raise ValueError("Fault rates add up to more than 1")
+        self.latency = latency
+        self.jitter = jitter
+        self.rates = [("429", rate_429), ("5xx", rate_5xx), ("truncated", truncate), ("dripped", drip)]
+        self.drip_seconds = drip_seconds
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw(self):
+        """Return (delay in seconds, fault) for the next request
+        
+        The fault is "429", a 5xx status code, "truncated", "dripped" or None.
+        """
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+            roll = self._random.random()
+            status = self._random.choice((500, 502, 503))
+        for fault, rate in self.rates:
+            if roll < rate:
+                return delay, fault if fault != "5xx" else status
+            roll -= rate
+        return delay, None
+
+class _MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        url = urlsplit(self.path)
+        delay, fault = server.faults.draw()
+        if delay:
+            time.sleep(delay)
+        
+        if fault == "429":
+            server.count("429")
+            self._send(429, b"<html><body>Too Many Requests</body></html>", {"Retry-After": str(server.faults.retry_after)})
+            return
+        if isinstance(fault, int):
+            server.count("5xx")
+            self._send(fault, b"<html><body>Server Error</body></html>")
+            return
+        
+        html = server.site.render(url.path, url.query)
+        if html is None:
+            server.count("404")
+            self._send(404, b"<html><body>Not Found</body></html>")
+            return
+        server.count("company" if COMPANY_PATH_RE.match(url.path) else "listing")
+        body = html.encode("utf-8")
+        if fault == "truncated":
+            server.count("truncated")
+            self._send(200, body, length=len(body), cut=len(body) // 2)
+        elif fault == "dripped":
+            server.count("dripped")
+            self._send(200, body, drip_seconds=server.faults.drip_seconds)
+        else:
+            self._send(200, body)
+
+    def _send(self, status, body, headers=None, length=None, cut=None, drip_seconds=0):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(length if length is not None else len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if cut is not None:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        try:
+            if cut is not None:
+                self.wfile.write(body[:cut])
+            elif drip_seconds:
+                pieces = 20
+                step = math.ceil(len(body) / pieces)
+                for start in range(0, len(body), step):
+                    self.wfile.write(body[start:start + step])
+                    self.wfile.flush()
+                    time.sleep(drip_seconds / pieces)
+            else:
+                self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+class MockSpyurServer(ThreadingHTTPServer):
+    """HTTP server for a MockSite, one thread per connection
+    
+    Use it as a context manager to run it in a background thread, e.g. from
+    a load test::
+        
+        with MockSpyurServer(MockSite(companies=100000, categories=50), FaultProfile(rate_429=0.01)) as server:
+            scrape_all_categories(categories=server.category_urls(), ...)
+    
+    Args:
+        site (MockSite, optional): Site to serve. Defaults to MockSite().
+        faults (FaultProfile, optional): Faults to inject. Defaults to none.
+        host (str, optional): Address to listen on. Defaults to "127.0.0.1".
+        port (int, optional): Port to listen on, 0 for any free port. Defaults to 0.
+    """
+    
+    daemon_threads = True
+
+    def __init__(self, site=None, faults=None, host="127.0.0.1", port=0):
+        super().__init__((host, port), _MockHandler)
+        self.site = site or MockSite()
+        self.faults = faults or FaultProfile()
+        self.counts = {}
+        self._counts_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def category_urls(self, language="am"):
+        """Return {category name: listing URL} on this server"""
+        return self.site.category_urls(self.base_url, language)
+
+    def count(self, key):
+        with self._counts_lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def start(self):
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, name="mock-spyur", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        """Stop serving and release the port"""
+        if self._thread:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def print_summary(self):
+        """Print how many pages and faults were served"""
+        counts = self.counts
+        print(f"📊 Served {counts.get('listing', 0)} listing and {counts.get('company', 0)} company pages; "
+              f"injected {counts.get('429', 0)} 429s, {counts.get('5xx', 0)} 5xx, "
+              f"{counts.get('truncated', 0)} truncated and {counts.get('dripped', 0)} dripped responses; "
+              f"{counts.get('404', 0)} not found")
+
+def serve_mock_site(site=None, faults=None, host="127.0.0.1", port=8765):
+    """Run a mock spyur.am in the foreground until interrupted
+    
+    Args:
+        site (MockSite, optional): Site to serve. Defaults to MockSite().
+        faults (FaultProfile, optional): Faults to inject. Defaults to none.
+        host (str, optional): Address to listen on. Defaults to "127.0.0.1".
+        port (int, optional): Port to listen on. Defaults to 8765.
+    """
+    server = MockSpyurServer(site, faults, host, port)
+    print(f"🧪 Mock spyur.am with {server.site.companies} companies serving at {server.base_url}")
+    for name, url in server.category_urls().items():
+        print(f"  {name}: {url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.print_summary()
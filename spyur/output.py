@@ -0,0 +1,345 @@
+"""Output sinks: streamed CSV files and the SQLite company store"""
+import re
+import csv
+import os
+import gzip
+import json
+import time
+import shutil
+import sqlite3
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from .archive import _import_zstandard
+from .phones import PHONE_EXTRACTOR
+from .records import is_empty_record
+
+class StreamingCsvWriter:
+    """Write company records to a CSV file one row at a time
+
+    The header is taken from the first record written, so records can be
+    streamed straight from the crawl without collecting them in a list first.
+
+    Args:
+        filepath (str): Path to save the CSV file
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.count = 0
+        self._file = None
+        self._writer = None
+
+    def write(self, record):
+        if self._writer is None:
+            self._file = open(self.filepath, "w", newline="", encoding="utf-8")
+            self._writer = csv.DictWriter(self._file, fieldnames=list(record.keys()), restval="", extrasaction="ignore")
+            self._writer.writeheader()
+        self._writer.writerow(record)
+        self.count += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+class PartitionedCsvWriter:
+    """Write company records to a directory of CSV parts, compressed in the background
+    
+    Records are split into one part per category (partition_by="category")
+    and/or rolled over to a new part every max_rows rows. Each finished part
+    is handed to a thread pool that compresses it (gzip and zstd both release
+    the GIL) while the crawl keeps writing. close() waits for the pool and
+    writes manifest.json listing every part with its partition, row count,
+    size and SHA-256, so downstream loads can read the parts in parallel.
+    
+    Args:
+        output_dir (str): Directory for the parts and the manifest
+        prefix (str, optional): File name prefix. Defaults to "spyur".
+        partition_by (str, optional): "category" for one part per category. Defaults to None.
+        max_rows (int, optional): Rows per part before rolling over. Defaults to no limit.
+        compression (str, optional): "gzip", "zstd" or None. Defaults to None.
+        workers (int, optional): Compression threads. Defaults to 4.
+    """
+    
+    EXTENSIONS = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+    def __init__(self, output_dir, prefix="spyur", partition_by=None, max_rows=None, compression=None, workers=4):
+        if partition_by not in (None, "category"):
+            raise ValueError(f"Unknown partition_by: {partition_by} (expected 'category')")
+        if compression not in self.EXTENSIONS:
+            raise ValueError(f"Unknown compression: {compression} (expected gzip or zstd)")
+        if compression == "zstd" and _import_zstandard() is None:
+            raise ImportError("zstandard is required for zstd compression (pip install zstandard)")
+        self.output_dir = output_dir
+        self.filepath = output_dir
+        self.prefix = prefix
+        self.partition_by = partition_by
+        self.max_rows = max_rows
+        self.compression = compression
+        self.count = 0
+        self.partitions = []
+        self.manifest_path = os.path.join(output_dir, "manifest.json")
+        self._fieldnames = None
+        self._open = {}
+        self._part_numbers = {}
+        self._futures = []
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="compress")
+        os.makedirs(output_dir, exist_ok=True)
+
+    def partition_key(self, record):
+        """Return the partition a record belongs to, usable in a file name"""
+        if self.partition_by == "category":
+            return re.sub(r'\W+', '_', record.get("category") or "uncategorized").strip("_")[:60] or "uncategorized"
+        return "all"
+
+    def write(self, record):
+        if self._fieldnames is None:
+            self._fieldnames = list(record.keys())
+        key = self.partition_key(record)
+        # Categories arrive one after another: finish the previous category's part as soon as the next one starts
+        for other in [other for other in self._open if other != key]:
+            self._finish(other)
+        part = self._open.get(key)
+        if part is None:
+            part = self._start(key)
+        part["writer"].writerow(record)
+        part["rows"] += 1
+        self.count += 1
+        if self.max_rows and part["rows"] >= self.max_rows:
+            self._finish(key)
+
+    def _start(self, key):
+        number = self._part_numbers.get(key, 0) + 1
+        self._part_numbers[key] = number
+        path = os.path.join(self.output_dir, f"{self.prefix}-{key}-{number:04d}.csv")
+        f = open(path, "w", newline="", encoding="utf-8")
+        writer = csv.DictWriter(f, fieldnames=self._fieldnames, restval="", extrasaction="ignore")
+        writer.writeheader()
+        part = {"key": key, "number": number, "path": path, "file": f, "writer": writer, "rows": 0}
+        self._open[key] = part
+        return part
+
+    def _finish(self, key):
+        part = self._open.pop(key)
+        part["file"].close()
+        self._futures.append(self._executor.submit(self._compress, part["path"], key, part["number"], part["rows"]))
+
+    def _compress(self, path, key, number, rows):
+        """Compress one finished part (runs on the pool) and return its manifest entry"""
+        if self.compression:
+            target = path + self.EXTENSIONS[self.compression]
+            with open(path, "rb") as source, open(target, "wb") as out:
+                if self.compression == "gzip":
+                    with gzip.GzipFile(fileobj=out, mode="wb", compresslevel=6, mtime=0) as compressed:
+                        shutil.copyfileobj(source, compressed, 1024 * 1024)
+                else:
+                    _import_zstandard().ZstdCompressor(level=3).copy_stream(source, out)
+            os.remove(path)
+            path = target
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return {"file": os.path.basename(path), "partition": key, "part": number, "rows": rows,
+                "bytes": os.path.getsize(path), "sha256": digest.hexdigest()}
+
+    def close(self):
+        """Finish the open parts, wait for their compression and write the manifest"""
+        if self._executor is None:
+            return
+        for key in list(self._open):
+            self._finish(key)
+        try:
+            self.partitions = sorted((future.result() for future in self._futures), key=lambda entry: entry["file"])
+        finally:
+            self._executor.shutdown()
+            self._executor = None
+        manifest = {
+            "created_at": time.time(),
+            "rows": self.count,
+            "fieldnames": self._fieldnames or [],
+            "partition_by": self.partition_by,
+            "max_rows": self.max_rows,
+            "compression": self.compression,
+            "partitions": self.partitions,
+        }
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def save_to_csv(data, filepath):
+    """Save scraped data to a CSV file
+    
+    Args:
+        data (iterable): List or iterator of dictionaries containing company information
+        filepath (str): Path to save the CSV file
+        
+    Returns:
+        int: Number of rows written
+    """
+    with StreamingCsvWriter(filepath) as writer:
+        for record in data:
+            writer.write(record)
+    if writer.count == 0:
+        # Keep the old behaviour of leaving an empty file behind
+        open(filepath, "w", encoding="utf-8").close()
+    return writer.count
+
+class CompanyStore:
+    """SQLite database of companies that doubles as a crawl sink
+    
+    Records are upserted by source_url: a company seen again keeps its
+    first_seen timestamp and gets a new last_seen. Writes are buffered and
+    committed in batches, one transaction per batch. Phones are also kept
+    one per row in company_phones so phone lookups use an index instead of
+    scanning every record. Fields the table does not know yet are added as
+    new columns. Records without company data, such as one built from an
+    error page, are skipped so they cannot overwrite a stored company.
+    
+    Args:
+        path (str): Database file
+        batch_size (int, optional): Records per transaction. Defaults to 500.
+    """
+
+    CORE_COLUMNS = ["name", "director", "address", "phones", "website", "social_media", "category"]
+
+    def __init__(self, path, batch_size=500):
+        self.path = path
+        self.batch_size = batch_size
+        self.count = 0
+        self.skipped = 0
+        self._pending = []
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.row_factory = sqlite3.Row
+        with self._db:
+            self._db.execute(f"""CREATE TABLE IF NOT EXISTS companies (
+                source_url TEXT PRIMARY KEY,
+                name TEXT COLLATE NOCASE,
+                {", ".join(f"{column} TEXT" for column in self.CORE_COLUMNS[1:])},
+                first_seen REAL,
+                last_seen REAL)""")
+            self._db.execute("CREATE TABLE IF NOT EXISTS company_phones (phone TEXT, source_url TEXT, PRIMARY KEY (phone, source_url))")
+            self._db.execute("CREATE INDEX IF NOT EXISTS companies_name ON companies (name)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS companies_category ON companies (category)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS company_phones_url ON company_phones (source_url)")
+        self.columns = [row["name"] for row in self._db.execute("PRAGMA table_info(companies)")]
+
+    def write(self, record):
+        """Queue a record, committing once a batch is full"""
+        if is_empty_record(record):
+            self.skipped += 1
+            return
+        self._pending.append(record)
+        self.count += 1
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Upsert the queued records in one transaction"""
+        if not self._pending:
+            return
+        records, self._pending = self._pending, []
+        now = time.time()
+        with self._db:
+            for key in {key for record in records for key in record}:
+                if key not in self.columns and re.fullmatch(r'[A-Za-z_]\w*', key):
+                    self._db.execute(f'ALTER TABLE companies ADD COLUMN "{key}" TEXT')
+                    self.columns.append(key)
+            columns = [column for column in self.columns if column not in ("source_url", "first_seen", "last_seen")]
+            names = ", ".join(f'"{column}"' for column in columns)
+            updates = ", ".join(f'"{column}" = excluded."{column}"' for column in columns)
+            self._db.executemany(
+                f"""INSERT INTO companies (source_url, {names}, first_seen, last_seen)
+                    VALUES (?, {", ".join("?" for _ in columns)}, ?, ?)
+                    ON CONFLICT (source_url) DO UPDATE SET {updates}, last_seen = excluded.last_seen""",
+                [[record["source_url"]] + [record.get(column, "") for column in columns] + [now, now] for record in records])
+            urls = [(record["source_url"],) for record in records]
+            self._db.executemany("DELETE FROM company_phones WHERE source_url = ?", urls)
+            self._db.executemany("INSERT OR IGNORE INTO company_phones (phone, source_url) VALUES (?, ?)",
+                                 [(phone, record["source_url"]) for record in records
+                                  for phone in PHONE_EXTRACTOR.extract(record.get("phones", ""), max_phones=100)])
+
+    def _rows(self, query, params=()):
+        self.flush()
+        return [dict(row) for row in self._db.execute(query, params)]
+
+    def get(self, source_url):
+        """Return the stored record of a company page, or None"""
+        rows = self._rows("SELECT * FROM companies WHERE source_url = ?", (source_url,))
+        return rows[0] if rows else None
+
+    def find_by_phone(self, phone):
+        """Return the companies listing a phone number, given in any format PhoneExtractor reads"""
+        phone = PHONE_EXTRACTOR.normalize(phone) or phone
+        return self._rows("""SELECT companies.* FROM company_phones JOIN companies USING (source_url)
+                             WHERE company_phones.phone = ? ORDER BY companies.name""", (phone,))
+
+    def find_by_name(self, prefix):
+        """Return the companies whose name starts with prefix (ASCII letters match case-insensitively)"""
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return self._rows("SELECT * FROM companies WHERE name LIKE ? ESCAPE '\\' ORDER BY name", (escaped + "%",))
+
+    def find_by_category(self, category):
+        """Return the companies stored under a category"""
+        return self._rows("SELECT * FROM companies WHERE category = ? ORDER BY name", (category,))
+
+    def shared_phones(self, min_companies=2):
+        """Return phones listed by several companies
+        
+        Returns:
+            dict: Phone mapped to the source URLs listing it, most shared first
+        """
+        rows = self._rows("""SELECT phone, group_concat(source_url, ' ') AS urls, count(*) AS companies
+                             FROM company_phones GROUP BY phone HAVING companies >= ?
+                             ORDER BY companies DESC, phone""", (min_companies,))
+        return {row["phone"]: row["urls"].split(" ") for row in rows}
+
+    def __len__(self):
+        return self._rows("SELECT count(*) AS n FROM companies")[0]["n"]
+
+    def close(self):
+        if self._db is not None:
+            self.flush()
+            self._db.close()
+            self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def print_store_lookup(store, phone=None, name=None, category=None, shared_phones=False):
+    """Print the result of one CompanyStore query for the lookup command"""
+    if shared_phones:
+        shared = store.shared_phones()
+        for shared_phone, urls in shared.items():
+            print(f"{shared_phone}: {len(urls)} companies")
+            for url in urls:
+                print(f"  {url}")
+        print(f"\n{len(shared)} phones are listed by more than one company")
+        return
+    if phone:
+        rows = store.find_by_phone(phone)
+    elif name:
+        rows = store.find_by_name(name)
+    else:
+        rows = store.find_by_category(category)
+    for row in rows:
+        print(f"{row['name']} | {row['phones']} | {row['category']} | {row['source_url']}")
+    print(f"\n{len(rows)} companies found in {store.path} ({len(store)} stored)")
@@ -0,0 +1,205 @@
+"""Extraction profiles: where company data lives in the markup"""
+import re
+import os
+import json
+from dataclasses import dataclass, field, fields, replace
+
+@dataclass
+class ExtractionProfile:
+    """Declarative description of where company data lives in Spyur.am markup
+    
+    A profile only holds plain strings and lists, so it can be written as JSON
+    or YAML and loaded with ``load_profile()``. Call ``compile()`` once to get a
+    ``CompiledProfile`` with precompiled selectors and regexes for the crawl.
+    """
+    name: str = "default"
+    # Listing pages
+    listing_link_selectors: list = field(default_factory=lambda: [".company-title a", ".result_item .title a", ".companies-list a.name", "a[href*='/companies/']"])
+    paging_selector: str = ".paging"
+    next_indicators: list = field(default_factory=lambda: ["Next", "Հաջորդը", "→", "»", "next", "հաջորդ", "հաջորդ էջ"])
+    # Company name
+    name_selectors: list = field(default_factory=lambda: [".company-title", ".company-name", "h1"])
+    # Label/value rows used for director and phone lookups
+    info_row_selector: str = ".company-info .info-line, .company-info-row"
+    info_label_selector: str = ".info-label"
+    info_value_selector: str = ".info-value"
+    director_labels: list = field(default_factory=lambda: ["Ղեկավար", "տնօրեն", "director", "manager", "head"])
+    director_text_patterns: list = field(default_factory=lambda: [
+        r'Ղեկավար[:\s]+(.*?)(?:\n|$)',
+        r'([A-Za-zԱ-և ]+)(?:,\s*|\s+-\s+|\s+)(?:director|manager|տնօրեն)',
+    ])
+    # Address
+    address_block_selectors: list = field(default_factory=lambda: [".address_block", ".branch_block .address_block"])
+    contacts_selector: str = ".contacts_info"
+    address_markers: list = field(default_factory=lambda: ["Հայաստան", "Երևան"])
+    address_section_selectors: list = field(default_factory=lambda: [".company-info .info-line", ".company-details .info-line", ".company-data tr", ".contact-info .info-item"])
+    section_label_selectors: list = field(default_factory=lambda: [".info-label", "th", "dt"])
+    section_value_selectors: list = field(default_factory=lambda: [".info-value", "td", "dd"])
+    address_keywords: list = field(default_factory=lambda: ["հասցե", "Հասցե", "գտնվելու վայր", "Գտնվելու վայր", "գրասենյակ", "Գրասենյակ"])
+    address_text_patterns: list = field(default_factory=lambda: [
+        r'Գրասենյակ[:\s]+(.*?)(?:\n|$)',  # Office
+        r'Գործունեության հասցե[:\s]+(.*?)(?:\n|$)',  # Business address
+        r'Հասցե[:\s]+(.*?)(?:\n|$)',  # Address
+        r'Գտնվելու վայրը[:\s]+(.*?)(?:\n|$)',  # Location
+    ])
+    address_fallback_selectors: list = field(default_factory=lambda: [".address-block, .contact-address, .company-address"])
+    address_container_selector: str = ".contact-info p, .company-info p, .address p, .location p, div.branch_block div"
+    address_excluded_words: list = field(default_factory=lambda: ["ավելացնել", "գործունեության տեսակներ", "ապրանք-ծառայություններ"])
+    address_row_selector: str = "tr, dt, dd"
+    address_row_markers: list = field(default_factory=lambda: ["Երևան", "ք․"])
+    address_row_words: list = field(default_factory=lambda: ["փող", "պող", "հասցե"])
+    default_address: str = "Հայաստան, Երևան"
+    # Phones
+    phone_item_selector: str = ".company-phones .phone-item"
+    phone_labels: list = field(default_factory=lambda: ["հեռ", "տել", "phone", "tel"])
+    max_phones: int = 3
+    # Website and social media
+    website_selector: str = "a[href*='http']"
+    social_domains: list = field(default_factory=lambda: ["facebook", "instagram", "linkedin", "twitter", "youtube"])
+    excluded_link_markers: list = field(default_factory=lambda: ["spyur"])
+    # Whole-page text scans are the slowest fallbacks; trimmed profiles turn them off
+    use_text_fallbacks: bool = True
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a profile from a dict, rejecting unknown keys
+        
+        Keys that are missing keep their default values.
+        """
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Unknown extraction profile keys: {', '.join(sorted(unknown))}")
+        return cls(**data)
+
+    def compile(self):
+        """Compile the profile's selectors and regexes
+        
+        Returns:
+            CompiledProfile: Profile ready to be used by the engine
+        """
+        return CompiledProfile(self)
+
+def _keyword_regex(keywords):
+    """Build one case-insensitive regex that matches any of the keywords"""
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+class CompiledProfile:
+    """An ExtractionProfile with every selector and regex compiled once
+    
+    Args:
+        profile (ExtractionProfile): Profile to compile
+    """
+
+    def __init__(self, profile):
+        import soupsieve as sv
+        
+        self.profile = profile
+        self.name = profile.name
+        self.listing_links = [sv.compile(s) for s in profile.listing_link_selectors]
+        self.paging = sv.compile(profile.paging_selector)
+        # Plain class selectors can also be matched by the streaming listing parser
+        container_match = re.fullmatch(r'\.([\w-]+) a', profile.listing_link_selectors[0]) if profile.listing_link_selectors else None
+        paging_match = re.fullmatch(r'\.([\w-]+)', profile.paging_selector)
+        self.listing_container_class = container_match.group(1) if container_match else None
+        self.paging_class = paging_match.group(1) if paging_match else None
+        self.next_indicators = [indicator.lower() for indicator in profile.next_indicators]
+        self.company_name = [sv.compile(s) for s in profile.name_selectors]
+        self.info_rows = sv.compile(profile.info_row_selector)
+        self.info_label = sv.compile(profile.info_label_selector)
+        self.info_value = sv.compile(profile.info_value_selector)
+        self.director_label_re = _keyword_regex(profile.director_labels)
+        self.director_text_patterns = [re.compile(p, re.IGNORECASE) for p in profile.director_text_patterns]
+        self.address_blocks = [sv.compile(s) for s in profile.address_block_selectors]
+        self.contacts = sv.compile(profile.contacts_selector)
+        self.address_markers = list(profile.address_markers)
+        self.address_sections = [sv.compile(s) for s in profile.address_section_selectors]
+        self.section_labels = [sv.compile(s) for s in profile.section_label_selectors]
+        self.section_values = [sv.compile(s) for s in profile.section_value_selectors]
+        self.address_keyword_re = _keyword_regex(profile.address_keywords)
+        self.address_text_patterns = [re.compile(p) for p in profile.address_text_patterns]
+        self.address_fallbacks = [sv.compile(s) for s in profile.address_fallback_selectors]
+        self.address_containers = sv.compile(profile.address_container_selector)
+        self.address_excluded_re = _keyword_regex(profile.address_excluded_words)
+        self.address_rows = sv.compile(profile.address_row_selector)
+        self.address_row_markers = list(profile.address_row_markers)
+        self.address_row_words = list(profile.address_row_words)
+        self.default_address = profile.default_address
+        self.phone_items = sv.compile(profile.phone_item_selector)
+        self.phone_label_re = _keyword_regex(profile.phone_labels)
+        self.max_phones = profile.max_phones
+        self.website_links = sv.compile(profile.website_selector)
+        self.social_domain_re = _keyword_regex(profile.social_domains)
+        self.social_links = sv.compile(", ".join(f"a[href*='{domain}']" for domain in profile.social_domains)) if profile.social_domains else None
+        self.excluded_link_re = _keyword_regex(profile.excluded_link_markers)
+        self.use_text_fallbacks = profile.use_text_fallbacks
+
+def first_match(selectors, soup):
+    """Return the first element matched by a list of compiled selectors, tried in order"""
+    for selector in selectors:
+        elem = selector.select_one(soup)
+        if elem is not None:
+            return elem
+    return None
+
+def first_non_empty(selectors, soup):
+    """Return the matches of the first compiled selector in the list that matches anything"""
+    for selector in selectors:
+        elems = selector.select(soup)
+        if elems:
+            return elems
+    return []
+
+DEFAULT_PROFILE = ExtractionProfile()
+
+# Trimmed profile: structured selectors only, no whole-page text scans
+FAST_PROFILE = replace(
+    DEFAULT_PROFILE,
+    name="fast",
+    listing_link_selectors=[".company-title a", "a[href*='/companies/']"],
+    address_section_selectors=[".company-info .info-line"],
+    use_text_fallbacks=False,
+)
+
+PROFILES = {
+    "default": DEFAULT_PROFILE,
+    "fast": FAST_PROFILE,
+}
+
+# Per-category profile overrides, keyed by category name
+CATEGORY_PROFILES = {}
+
+_default_compiled_profile = None
+
+def default_compiled_profile():
+    """Return DEFAULT_PROFILE compiled, compiling it on first use"""
+    global _default_compiled_profile
+    if _default_compiled_profile is None:
+        _default_compiled_profile = DEFAULT_PROFILE.compile()
+    return _default_compiled_profile
+
+def load_profile(source):
+    """Load an extraction profile by name or from a JSON/YAML file
+    
+    Args:
+        source (str): Name of a built-in profile (see PROFILES) or path to a
+            .json, .yaml or .yml file
+            
+    Returns:
+        ExtractionProfile: The loaded profile
+    """
+    if source in PROFILES:
+        return PROFILES[source]
+    with open(source, "r", encoding="utf-8") as f:
+        if source.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("PyYAML is required to load YAML extraction profiles (pip install pyyaml)")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    data.setdefault("name", os.path.splitext(os.path.basename(source))[0])
+    return ExtractionProfile.from_dict(data)
@@ -0,0 +1,254 @@
+"""Live crawl progress: throughput, queue depths, errors and per-category ETAs
+
+A CrawlProgress is handed to the engine, which reports every fetched page,
+listing page, finished company and error to it. The numbers can be watched
+as a status line on stderr and/or as JSON from a small local HTTP endpoint.
+"""
+import json
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class CrawlProgress:
+    """Thread-safe counters of a running crawl
+    
+    Args:
+        window (float, optional): Seconds of recent fetches the pages/sec rate is
+            measured over. Defaults to 30.
+    """
+
+    def __init__(self, window=30.0):
+        self.window = window
+        self.started = time.monotonic()
+        self.pages = 0
+        self.bytes = 0
+        self.errors = {}
+        self.categories = {}
+        self.pending = []
+        self.current = None
+        self.engine = None
+        self._fetch_times = deque()
+        self._lock = threading.Lock()
+        self._reporter = None
+        self._server = None
+        self._draw_lock = threading.Lock()
+
+    def attach(self, engine):
+        """Read the engine's rate limit and worker count into every snapshot"""
+        self.engine = engine
+
+    def plan(self, category_names):
+        """Record the categories a multi-category run will crawl, in order"""
+        with self._lock:
+            self.pending = [name for name in category_names if name not in self.categories]
+
+    def start_category(self, name, max_pages, max_companies):
+        with self._lock:
+            if name in self.pending:
+                self.pending.remove(name)
+            self.current = name
+            self.categories[name] = {
+                "started": time.monotonic(), "finished": None, "max_pages": max_pages, "max_companies": max_companies,
+                "listing_pages": 0, "last_page": None, "listing_done": False, "links": 0, "done": 0, "errors": 0,
+            }
+
+    def finish_category(self, name):
+        with self._lock:
+            category = self.categories.get(name)
+            if category and category["finished"] is None:
+                category["finished"] = time.monotonic()
+                category["listing_done"] = True
+            if self.current == name:
+                self.current = None
+
+    def listing_page(self, links, last_page=None):
+        """Count a parsed listing page of the current category and the links it added"""
+        with self._lock:
+            category = self.categories.get(self.current)
+            if category:
+                category["listing_pages"] += 1
+                category["links"] += links
+                if last_page:
+                    category["last_page"] = max(category["last_page"] or 0, last_page)
+
+    def listing_done(self):
+        """Mark the current category's listing stage as finished"""
+        with self._lock:
+            category = self.categories.get(self.current)
+            if category:
+                category["listing_done"] = True
+
+    def company_done(self):
+        with self._lock:
+            category = self.categories.get(self.current)
+            if category:
+                category["done"] += 1
+
+    def page_fetched(self, size):
+        now = time.monotonic()
+        with self._lock:
+            self.pages += 1
+            self.bytes += size
+            self._fetch_times.append(now)
+            while self._fetch_times and self._fetch_times[0] < now - self.window:
+                self._fetch_times.popleft()
+
+    def error(self, kind):
+        """Count an error of a kind, e.g. "listing" or "company", for the run and the current category"""
+        with self._lock:
+            self.errors[kind] = self.errors.get(kind, 0) + 1
+            category = self.categories.get(self.current)
+            if category:
+                category["errors"] += 1
+
+    def _category_snapshot(self, name, category, now):
+        elapsed = (category["finished"] or now) - category["started"]
+        rate = category["done"] / elapsed if elapsed > 0 else 0.0
+        if category["listing_done"]:
+            expected = category["links"]
+            listing_queue = 0
+        else:
+            # Extrapolate from the links per listing page and the pages the paging block announces
+            pages = min(category["max_pages"], max(category["last_page"] or 0, category["listing_pages"]))
+            per_page = category["links"] / category["listing_pages"] if category["listing_pages"] else 0
+            expected = max(category["links"], min(category["max_companies"], round(per_page * pages)))
+            listing_queue = max(0, pages - category["listing_pages"])
+        remaining = max(0, expected - category["done"])
+        if category["finished"]:
+            eta = 0.0
+        else:
+            eta = remaining / rate if rate else None
+        return {
+            "name": name,
+            "companies_done": category["done"],
+            "companies_expected": expected,
+            "companies_per_sec": round(rate, 2),
+            "listing_pages": category["listing_pages"],
+            "listing_queue": listing_queue,
+            "detail_queue": max(0, category["links"] - category["done"]),
+            "errors": category["errors"],
+            "elapsed_sec": round(elapsed, 1),
+            "eta_sec": round(eta, 1) if eta is not None else None,
+            "finished": category["finished"] is not None,
+        }
+
+    def snapshot(self):
+        """Return the current progress as a JSON-serializable dict"""
+        now = time.monotonic()
+        with self._lock:
+            if len(self._fetch_times) > 1:
+                span = max(now - self._fetch_times[0], 1e-9)
+                pages_per_sec = len(self._fetch_times) / span
+            else:
+                pages_per_sec = 0.0
+            categories = [self._category_snapshot(name, category, now) for name, category in self.categories.items()]
+            snapshot = {
+                "elapsed_sec": round(now - self.started, 1),
+                "pages": self.pages,
+                "megabytes": round(self.bytes / 1e6, 2),
+                "pages_per_sec": round(pages_per_sec, 2),
+                "errors": dict(self.errors),
+                "current_category": self.current,
+                "categories": categories,
+                "pending_categories": list(self.pending),
+            }
+        if self.engine is not None:
+            snapshot["delay_sec"] = self.engine.limiter.min_interval
+            snapshot["workers"] = self.engine.tuner.workers if self.engine.tuner is not None else self.engine.workers
+            if self.engine.hedger is not None:
+                snapshot["hedges"] = self.engine.hedger.stats()
+        return snapshot
+
+    def status_line(self):
+        """Return a one-line summary of the current category and the whole run"""
+        snapshot = self.snapshot()
+        parts = [f"{snapshot['pages_per_sec']:.1f} pages/s", f"{snapshot['pages']} pages"]
+        current = next((c for c in snapshot["categories"] if c["name"] == snapshot["current_category"]), None)
+        if current:
+            eta_sec = current["eta_sec"]
+            if eta_sec is None:
+                eta = "?"
+            else:
+                eta = f"{eta_sec:.0f}s" if eta_sec < 120 else f"{eta_sec / 60:.0f} min"
+            parts.append(f"{current['name']} {current['companies_done']}/{current['companies_expected']} "
+                         f"({current['companies_per_sec']:.1f}/s, ETA {eta})")
+            parts.append(f"queues listing {current['listing_queue']} detail {current['detail_queue']}")
+        elif snapshot["categories"]:
+            done = sum(c["companies_done"] for c in snapshot["categories"])
+            parts.append(f"{done} companies in {len(snapshot['categories'])} categories")
+        if "delay_sec" in snapshot:
+            parts.append(f"delay {snapshot['delay_sec']:g}s x{snapshot['workers']}")
+        if snapshot.get("hedges", {}).get("hedged"):
+            parts.append(f"{snapshot['hedges']['hedged']} hedged")
+        errors = sum(snapshot["errors"].values())
+        if errors:
+            parts.append(f"{errors} errors")
+        if snapshot["pending_categories"]:
+            parts.append(f"{len(snapshot['pending_categories'])} categories to go")
+        return "⏳ " + " | ".join(parts)
+
+    def start_status_line(self, interval=1.0, stream=None):
+        """Redraw the status line on stderr every interval seconds until close()"""
+        stream = stream or sys.stderr
+        stop = threading.Event()
+        
+        def report():
+            while not stop.wait(interval):
+                with self._draw_lock:
+                    stream.write("\r" + self.status_line() + "\033[K")
+                    stream.flush()
+        
+        thread = threading.Thread(target=report, name="crawl-progress", daemon=True)
+        thread.start()
+        self._reporter = (stop, thread, stream)
+
+    def message(self, text):
+        """Print a line of crawl output, above the status line while one is drawn"""
+        if not self._reporter:
+            print(text)
+            return
+        stream = self._reporter[2]
+        with self._draw_lock:
+            stream.write("\r\033[K")
+            stream.flush()
+            print(text, flush=True)
+            stream.write("\r" + self.status_line() + "\033[K")
+            stream.flush()
+
+    def serve(self, port=8766, host="127.0.0.1"):
+        """Serve snapshot() as JSON at http://host:port/ until close()"""
+        progress = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+            
+            def do_GET(self):
+                body = json.dumps(progress.snapshot(), ensure_ascii=False).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+        
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="crawl-status", daemon=True).start()
+        print(f"📡 Crawl status at http://{host}:{self._server.server_address[1]}/")
+
+    def close(self):
+        """Stop the status line and the endpoint, leaving the final status on screen"""
+        if self._reporter:
+            stop, thread, stream = self._reporter
+            stop.set()
+            thread.join()
+            with self._draw_lock:
+                stream.write("\r" + self.status_line() + "\033[K\n")
+                stream.flush()
+                self._reporter = None
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
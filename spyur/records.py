@@ -0,0 +1,81 @@
+"""Company records and company page URLs"""
+import re
+
+def empty_company_info(company_url, category=""):
+    """Return a company record with every field empty
+    
+    Args:
+        company_url (str): URL of the company page
+        category (str, optional): Category name
+        
+    Returns:
+        dict: Dictionary containing company information
+    """
+    return {
+        "name": "",
+        "director": "",
+        "address": "",
+        "phones": "",
+        "website": "",
+        "social_media": "",
+        "category": category,
+        "source_url": company_url
+    }
+
+def is_empty_record(record):
+    """Check whether a record carries no company data, as one built from an error page does"""
+    return not record.get("name")
+
+def is_spyur_own_page(company_url):
+    """Check whether a company URL is one of Spyur's own company pages"""
+    return "spyur-information-system" in company_url or "spyur-information-center" in company_url
+
+LANGUAGES = ("am", "en", "ru")
+COMPANY_PATH_PATTERN = re.compile(r'/(am|en|ru)/companies/([^?#]*)')
+
+def company_id(company_url):
+    """Return the language-independent ID of a company page
+    
+    This is the trailing number of the page path when there is one,
+    otherwise the path after ``/companies/``, so the ``/am/``, ``/en/``
+    and ``/ru/`` pages of one company share an ID.
+    """
+    match = COMPANY_PATH_PATTERN.search(company_url)
+    if not match:
+        return company_url
+    path = match.group(2).strip("/")
+    number = re.search(r'(?:^|/)(\d+)$', path)
+    return number.group(1) if number else path
+
+def language_variant_url(company_url, language):
+    """Return the URL of a company page in another language"""
+    return COMPANY_PATH_PATTERN.sub(lambda m: f"/{language}/companies/{m.group(2)}", company_url, count=1)
+
+def merge_language_variants(variants, languages):
+    """Merge the records of one company's language variants into one record
+    
+    The record of the first language that has one is the base. Every
+    language gets name_<lang> and address_<lang> fields, empty for a variant
+    that is missing, and base fields left empty are filled in from the other
+    variants.
+    
+    Args:
+        variants (dict): Language mapped to the record extracted from that variant
+        languages (sequence): Languages in order of preference
+        
+    Returns:
+        dict: Merged company information
+    """
+    merged = dict(next(variants[language] for language in languages if variants.get(language)))
+    for language in languages:
+        record = variants.get(language) or {}
+        merged[f"name_{language}"] = record.get("name", "")
+        merged[f"address_{language}"] = record.get("address", "")
+        for key, value in record.items():
+            if value and not merged.get(key):
+                merged[key] = value
+    return merged
+
+def is_company_url(url):
+    """Check whether a URL is a company page (as opposed to a listing page)"""
+    return "/companies/" in url and not is_spyur_own_page(url)
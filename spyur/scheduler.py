@@ -0,0 +1,143 @@
+"""Freshest-first crawl scheduling from per-URL history"""
+import os
+import time
+import json
+import heapq
+import hashlib
+import threading
+
+HISTORY_ERROR_PENALTY = 0.5
+
+class CrawlHistory:
+    """Per-URL fetch history used to decide what to refresh first
+    
+    For every company URL the history keeps when it was last fetched, how
+    many fetches there have been, how many of them found the record changed,
+    a fingerprint of the last record and the last error. It is stored as one
+    JSON file and written back by save().
+    
+    Args:
+        path (str, optional): JSON file to load from and save to. Defaults to an in-memory history.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.urls = {}
+        self._lock = threading.Lock()
+        if path:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.urls = json.load(f).get("urls", {})
+            except (FileNotFoundError, ValueError):
+                self.urls = {}
+
+    @staticmethod
+    def fingerprint(record):
+        """Hash the extracted fields of a record, ignoring the category it was found in"""
+        fields = {key: value for key, value in record.items() if key != "category"}
+        return hashlib.sha1(json.dumps(fields, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def record_fetch(self, url, record, now=None):
+        """Note a successful fetch and whether the record changed since the previous one"""
+        fingerprint = self.fingerprint(record)
+        with self._lock:
+            entry = self.urls.setdefault(url, {"fetches": 0, "changes": 0})
+            if entry.get("fingerprint") not in (None, fingerprint):
+                entry["changes"] += 1
+            entry["fetches"] += 1
+            entry["fingerprint"] = fingerprint
+            entry["last_fetch"] = now or time.time()
+            entry["last_error"] = None
+
+    def record_error(self, url, error, now=None):
+        """Note a failed fetch"""
+        with self._lock:
+            entry = self.urls.setdefault(url, {"fetches": 0, "changes": 0})
+            entry["last_error"] = str(error)
+            entry["last_error_at"] = now or time.time()
+
+    def priority(self, url, now=None):
+        """Expected value of refetching a URL now
+        
+        Unknown URLs come first. Otherwise the estimated change rate per fetch
+        (changes + 1) / (fetches + 2) is weighted by the age of the last fetch
+        in days, so pages that change often and have not been seen for a while
+        win. URLs whose last fetch failed are weighted down.
+        
+        Returns:
+            float: Priority, higher is refreshed sooner
+        """
+        entry = self.urls.get(url)
+        if entry is None or "last_fetch" not in entry:
+            return float("inf")
+        change_rate = (entry["changes"] + 1) / (entry["fetches"] + 2)
+        age_days = max(0.0, ((now or time.time()) - entry["last_fetch"]) / 86400)
+        value = change_rate * age_days
+        if entry.get("last_error"):
+            value *= HISTORY_ERROR_PENALTY
+        return value
+
+    def save(self):
+        """Write the history to its file, if it has one"""
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            data = {"saved_at": time.time(), "urls": self.urls}
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+
+class CrawlScheduler:
+    """Orders a category's company links by refresh priority within a time budget
+    
+    Args:
+        history (CrawlHistory): Per-URL history supplying the priorities
+        time_budget (float, optional): Seconds the crawl may run for, counted from
+            construction. Defaults to no limit.
+    """
+
+    def __init__(self, history, time_budget=None):
+        self.history = history
+        self.time_budget = time_budget
+        self.deadline = time.monotonic() + time_budget if time_budget else None
+        # Whether the last schedule() stopped before handing out every link of its category
+        self.cut_short = False
+        self._announced = False
+
+    def expired(self):
+        """Return True once the time budget is used up"""
+        if self.deadline is None or time.monotonic() < self.deadline:
+            return False
+        if not self._announced:
+            self._announced = True
+            print(f"⏱️ Time budget of {self.time_budget:.0f}s used up, finishing the pages in flight")
+        return True
+
+    def schedule(self, links):
+        """Yield links highest priority first, stopping when the budget runs out
+        
+        The listing is read in full to build the frontier, so the ordering
+        covers the whole category; only link strings are held in memory.
+        cut_short tells afterwards whether the budget ran out first.
+        
+        Args:
+            links (iterable): Company URLs in listing order
+            
+        Yields:
+            str: Company URL
+        """
+        now = time.time()
+        frontier = []
+        self.cut_short = False
+        for position, link in enumerate(links):
+            heapq.heappush(frontier, (-self.history.priority(link, now), position, link))
+            if self.expired():
+                self.cut_short = True
+                break
+        while frontier:
+            if self.expired():
+                self.cut_short = True
+                break
+            yield heapq.heappop(frontier)[2]
@@ -0,0 +1,245 @@
+"""Category lookup, taxonomy discovery and crawl sharding"""
+import re
+import os
+import time
+import json
+import heapq
+from collections import deque
+from urllib.parse import urljoin, urlparse, parse_qs
+
+from .config import CATEGORIES, TAXONOMY_CACHE_PATH, TAXONOMY_TTL
+from .profiles import first_non_empty
+
+def list_categories():
+    """List available categories for scraping
+    
+    Returns:
+        dict: Dictionary of category names and URLs
+    """
+    print("Available categories for scraping:")
+    for i, (name, url) in enumerate(CATEGORIES.items(), 1):
+        print(f"{i}. {name.replace('_', ' ').title()}")
+    return CATEGORIES
+
+def resolve_category(category):
+    """Resolve a category name or URL to a (list_url, category_name) pair
+    
+    Args:
+        category (str, optional): Category key from CATEGORIES or a full URL
+        
+    Returns:
+        tuple: (list_url, category_name)
+    """
+    if category and category in CATEGORIES:
+        return CATEGORIES[category], category
+    if category and category.startswith('http'):
+        # If a full URL is provided
+        return category, "custom_url"
+    # Default to real estate
+    return CATEGORIES['real_estate'], "real_estate"
+
+YELLOW_PAGES_URL = "https://www.spyur.am/am/yellow_pages/"
+CATEGORY_PATH_TEMPLATE = "/am/yellow_pages/?type=bd&yp_cat1=&yp_cat2={code}&yp_cat3=&search=Search"
+
+def discover_categories(engine, root_url=YELLOW_PAGES_URL, max_depth=2):
+    """Crawl the yellow-pages category tree and collect the crawlable categories
+    
+    Links carrying a ``yp_cat2`` code are categories that list companies
+    (the same kind of URL as in CATEGORIES). Links that only carry a
+    ``yp_cat1`` code are section pages and are followed, up to max_depth.
+    
+    Args:
+        engine (CompanyScraper): Engine used for fetching
+        root_url (str, optional): Yellow-pages start page. Defaults to YELLOW_PAGES_URL.
+        max_depth (int, optional): How many section levels to follow. Defaults to 2.
+        
+    Returns:
+        dict: Category names mapped to category list URLs
+    """
+    categories = {}
+    seen_codes = set()
+    visited = set()
+    queue = deque([(root_url, 0)])
+    
+    while queue:
+        url, depth = queue.popleft()
+        if url in visited:
+            continue
+        visited.add(url)
+        print(f"Discovering categories on: {url}")
+        
+        try:
+            soup = engine.parse(engine.fetch(url))
+        except Exception as e:
+            print(f"Error fetching category page {url}: {e}")
+            continue
+        
+        for link in soup.find_all("a", href=True):
+            href = urljoin(url, link["href"])
+            query = parse_qs(urlparse(href).query)
+            code = (query.get("yp_cat2") or [""])[0]
+            if code:
+                if code in seen_codes:
+                    continue
+                seen_codes.add(code)
+                name = " ".join(link.get_text().split()) or code
+                if name in categories:
+                    name = f"{name} ({code})"
+                categories[name] = urljoin(root_url, CATEGORY_PATH_TEMPLATE.format(code=code))
+            elif (query.get("yp_cat1") or [""])[0] and depth < max_depth:
+                queue.append((href, depth + 1))
+        soup.decompose()
+    
+    print(f"📚 Discovered {len(categories)} categories")
+    return categories
+
+PAGE_NUMBER_RE = re.compile(r'(?:/yellow_pages?-|[?&]page=)(\d+)')
+
+def estimate_category(engine, list_url, profile=None):
+    """Estimate how many pages and companies a category has from its first listing page
+    
+    The page count is the highest page number linked from the paging block,
+    and the company count assumes every page is as full as the first one.
+    
+    Args:
+        engine (CompanyScraper): Engine used for fetching
+        list_url (str): URL of the category list page
+        profile (CompiledProfile, optional): Extraction profile. Defaults to the engine's profile.
+        
+    Returns:
+        dict: pages, companies_per_page and companies
+    """
+    profile = profile or engine.compiled_profile
+    soup = engine.parse(engine.fetch(list_url))
+    try:
+        per_page = len({a.get("href") for a in first_non_empty(profile.listing_links, soup) if "/companies/" in (a.get("href") or "")})
+        pages = 1
+        paging = profile.paging.select_one(soup)
+        if paging:
+            for link in paging.find_all("a", href=True):
+                text = link.get_text().strip()
+                if text.isdigit():
+                    pages = max(pages, int(text))
+                match = PAGE_NUMBER_RE.search(link["href"])
+                if match:
+                    pages = max(pages, int(match.group(1)))
+    finally:
+        soup.decompose()
+    return {"pages": pages, "companies_per_page": per_page, "companies": pages * per_page}
+
+def load_taxonomy(cache_path=TAXONOMY_CACHE_PATH, ttl=TAXONOMY_TTL):
+    """Load the cached taxonomy, or return None if it is missing or older than ttl seconds"""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            taxonomy = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    if time.time() - taxonomy.get("fetched_at", 0) > ttl:
+        return None
+    return taxonomy
+
+def save_taxonomy(taxonomy, cache_path=TAXONOMY_CACHE_PATH):
+    """Write the taxonomy to its cache file"""
+    directory = os.path.dirname(cache_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump(taxonomy, f, ensure_ascii=False, indent=2)
+
+def get_taxonomy(engine, cache_path=TAXONOMY_CACHE_PATH, ttl=TAXONOMY_TTL, refresh=False):
+    """Return the category taxonomy with page and company estimates
+    
+    The taxonomy is read from the cache while it is fresher than ttl seconds;
+    otherwise the category tree is crawled again, every category is
+    estimated, and the result is cached.
+    
+    Args:
+        engine (CompanyScraper or callable): Engine used for fetching, or a function
+            returning one, so no engine is built when the cache is fresh
+        cache_path (str, optional): Cache file. Defaults to TAXONOMY_CACHE_PATH.
+        ttl (float, optional): Cache lifetime in seconds. Defaults to one week.
+        refresh (bool, optional): Ignore the cache. Defaults to False.
+        
+    Returns:
+        dict: {"fetched_at": timestamp, "categories": {name: {"url", "pages", "companies_per_page", "companies"}}}
+    """
+    if not refresh:
+        taxonomy = load_taxonomy(cache_path, ttl)
+        if taxonomy is not None:
+            print(f"Using cached taxonomy from {cache_path} ({len(taxonomy['categories'])} categories)")
+            return taxonomy
+    
+    if callable(engine):
+        engine = engine()
+    categories = {}
+    for name, url in discover_categories(engine).items():
+        try:
+            estimate = estimate_category(engine, url)
+        except Exception as e:
+            print(f"Error estimating category '{name}': {e}")
+            estimate = {"pages": 1, "companies_per_page": 0, "companies": 0}
+        print(f"{name}: ~{estimate['companies']} companies on {estimate['pages']} pages")
+        categories[name] = dict(url=url, **estimate)
+    
+    taxonomy = {"fetched_at": time.time(), "categories": categories}
+    if categories:
+        save_taxonomy(taxonomy, cache_path)
+    else:
+        print("❌ No categories discovered, leaving the taxonomy cache untouched")
+    return taxonomy
+
+def category_cost(estimate):
+    """Estimated number of requests needed to crawl a category"""
+    return estimate.get("pages", 1) + estimate.get("companies", 0)
+
+def plan_shards(categories, shards):
+    """Split categories into shards of roughly equal estimated cost
+    
+    Categories are assigned largest first to the currently cheapest shard
+    (longest-processing-time scheduling), which keeps the most expensive
+    shard within 4/3 of the optimum.
+    
+    Args:
+        categories (dict): Category names mapped to estimates (see get_taxonomy)
+        shards (int): Number of shards, at least 1
+        
+    Returns:
+        list: One dict per shard with its categories and estimated totals
+        
+    Raises:
+        ValueError: If shards is less than 1
+    """
+    if shards < 1:
+        raise ValueError(f"Cannot plan {shards} shards, need at least 1")
+    plan = [{"shard": i + 1, "categories": {}, "estimated_pages": 0, "estimated_companies": 0, "estimated_cost": 0}
+            for i in range(shards)]
+    heap = [(0, i) for i in range(shards)]
+    
+    for name, estimate in sorted(categories.items(), key=lambda item: category_cost(item[1]), reverse=True):
+        cost, i = heapq.heappop(heap)
+        shard = plan[i]
+        shard["categories"][name] = estimate["url"]
+        shard["estimated_pages"] += estimate.get("pages", 1)
+        shard["estimated_companies"] += estimate.get("companies", 0)
+        shard["estimated_cost"] += category_cost(estimate)
+        heapq.heappush(heap, (shard["estimated_cost"], i))
+    return plan
+
+def parse_shard_spec(spec):
+    """Parse a shard spec like "2/8" into (index, count), with a 1-based index"""
+    try:
+        index, count = (int(part) for part in spec.split("/", 1))
+    except ValueError:
+        raise ValueError(f"Invalid shard spec '{spec}', expected INDEX/COUNT such as 2/8")
+    if count < 1:
+        raise ValueError(f"Shard count {count} must be at least 1")
+    if not 1 <= index <= count:
+        raise ValueError(f"Shard index {index} is out of range 1..{count}")
+    return index, count
+
+def print_shard_plan(plan):
+    """Print a shard plan"""
+    print(f"🗂️  Shard plan for {sum(len(shard['categories']) for shard in plan)} categories over {len(plan)} shards:")
+    for shard in plan:
+        print(f"Shard {shard['shard']}: {len(shard['categories'])} categories, "
+              f"~{shard['estimated_companies']} companies, ~{shard['estimated_pages']} listing pages")
@@ -0,0 +1,133 @@
+"""Adaptive concurrency: tune the number of in-flight company fetches from latency and errors"""
+import os
+import time
+import json
+import math
+import threading
+from collections import deque
+
+class ConcurrencyTuner:
+    """Additive-increase, multiplicative-decrease controller for fetch concurrency
+    
+    Every fetch reports its latency and whether it failed (an exception or a
+    429/5xx status). After each window of fetches the tuner compares the p95
+    latency and the error rate with the targets: within both, it allows one
+    more concurrent fetch; outside either, it halves the concurrency. The
+    setting the crawl settled on is the median over the recent evaluations,
+    and save() stores it so the next run starts from there.
+    
+    With a request delay the rate limiter, not the server, usually bounds
+    throughput: latency never rises, and past about mean latency / delay
+    workers extra fetches only queue on the limiter. The tuner stops
+    there instead of ramping to max_workers, and reports that the delay
+    is binding.
+    
+    Args:
+        initial (int, optional): Starting concurrency. Defaults to the saved setting, or 2.
+        min_workers (int, optional): Lowest concurrency. Defaults to 1.
+        max_workers (int, optional): Highest concurrency. Defaults to 16.
+        target_p95 (float, optional): Highest acceptable p95 fetch latency in seconds. Defaults to 3.
+        max_error_rate (float, optional): Highest acceptable share of failed fetches. Defaults to 0.05.
+        window (int, optional): Fetches per evaluation. Defaults to 40.
+        state_path (str, optional): JSON file the converged setting is loaded from and saved to.
+            Defaults to none.
+        verbose (bool, optional): Print every change of the setting. Defaults to True.
+        delay (float, optional): Minimum seconds between requests of the engine's rate
+            limiter. Defaults to 0.
+    """
+
+    def __init__(self, initial=None, min_workers=1, max_workers=16, target_p95=3.0, max_error_rate=0.05, window=40,
+                 state_path=None, verbose=True, delay=0):
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.target_p95 = target_p95
+        self.max_error_rate = max_error_rate
+        self.window = window
+        self.state_path = state_path
+        self.verbose = verbose
+        self.delay = delay
+        self.delay_bound = False
+        self.saved = self._load() if state_path else None
+        if initial is None:
+            initial = self.saved["workers"] if self.saved else 2
+        self.workers = min(max_workers, max(min_workers, initial))
+        self.evaluations = deque(maxlen=10)
+        self.last_p95 = None
+        self.last_error_rate = None
+        self._latencies = []
+        self._errors = 0
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        return state if isinstance(state.get("workers"), int) else None
+
+    def observe(self, latency, ok=True):
+        """Report one fetch; re-evaluates the concurrency once a window is full"""
+        with self._lock:
+            self._latencies.append(latency)
+            if not ok:
+                self._errors += 1
+            if len(self._latencies) < self.window:
+                return
+            latencies = sorted(self._latencies)
+            p95 = latencies[max(0, math.ceil(0.95 * len(latencies)) - 1)]
+            error_rate = self._errors / len(latencies)
+            # Workers the rate limiter can keep busy (Little's law); more only wait on it
+            useful = math.ceil(sum(latencies) / len(latencies) / self.delay) if self.delay > 0 else self.max_workers
+            self._latencies = []
+            self._errors = 0
+            
+            previous = self.workers
+            newly_bound = False
+            if p95 <= self.target_p95 and error_rate <= self.max_error_rate:
+                if self.delay > 0 and self.workers >= useful:
+                    newly_bound = not self.delay_bound
+                    self.delay_bound = True
+                    self.workers = max(self.min_workers, min(self.workers, useful))
+                else:
+                    self.workers = min(self.max_workers, self.workers + 1)
+            else:
+                self.workers = max(self.min_workers, self.workers // 2)
+            self.last_p95 = p95
+            self.last_error_rate = error_rate
+            self.evaluations.append(previous)
+        if self.verbose and self.workers != previous:
+            print(f"🎛️ Concurrency {previous} → {self.workers} (p95 {p95:.2f}s, {error_rate:.0%} errors)")
+        if self.verbose and newly_bound:
+            print(f"🎛️ The {self.delay}s request delay, not latency, limits throughput; holding at {self.workers} workers")
+
+    def limit(self):
+        """Current number of fetches allowed in flight"""
+        return self.workers
+
+    @property
+    def converged(self):
+        """Median concurrency over the recent evaluations (the current setting before any)"""
+        if not self.evaluations:
+            return self.workers
+        settings = sorted(self.evaluations)
+        return settings[len(settings) // 2]
+
+    def save(self):
+        """Write the converged setting to the state file, if there is one"""
+        if not self.state_path:
+            return
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        state = {"workers": self.converged, "p95": self.last_p95, "error_rate": self.last_error_rate, "saved_at": time.time()}
+        with open(self.state_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+
+    def print_summary(self):
+        if self.last_p95 is None:
+            return
+        print(f"🎛️ Concurrency converged on {self.converged} workers "
+              f"(last p95 {self.last_p95:.2f}s, {self.last_error_rate:.0%} errors)")
+        if self.delay_bound:
+            print(f"🎛️ Bound by the {self.delay}s request delay; lower --delay for more throughput")
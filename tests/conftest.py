@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Import the spyur package from this checkout however pytest is started
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,19 @@
+"""AddressNormalizer parsing and the normalized address line"""
+import pytest
+
+from spyur.addresses import AddressNormalizer
+
+@pytest.fixture(scope="module")
+def normalizer():
+    return AddressNormalizer()
+
+@pytest.mark.parametrize("address, floor, normalized", [
+    ("Հայաստան, Երևան, Աբովյան փող. 12, 1-ին հարկ", "1", "Երևան, Աբովյան փողոց 12, 1-ին հարկ"),
+    ("Հայաստան, Երևան, Աբովյան փող. 12, 1 հարկ", "1", "Երևան, Աբովյան փողոց 12, 1-ին հարկ"),
+    ("Հայաստան, Երևան, Աբովյան փող. 12, 3-րդ հարկ", "3", "Երևան, Աբովյան փողոց 12, 3-րդ հարկ"),
+    ("Հայաստան, Երևան, Աբովյան փող. 12, 11-րդ հարկ", "11", "Երևան, Աբովյան փողոց 12, 11-րդ հարկ"),
+])
+def test_floor_ordinal(normalizer, address, floor, normalized):
+    components = normalizer.parse(address)
+    assert components["address_floor"] == floor
+    assert components["address_normalized"] == normalized
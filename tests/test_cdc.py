@@ -0,0 +1,42 @@
+"""RecordDiff against previous CSV snapshots"""
+import json
+
+from spyur.cdc import RecordDiff, load_records_csv
+from spyur.output import StreamingCsvWriter
+from spyur.records import empty_company_info
+
+def company(number, **fields):
+    record = empty_company_info(f"https://www.spyur.am/am/companies/company-{number}/", category="mock_1")
+    record.update(name=f"Company {number}", address="Հայաստան, Երևան, Աբովյան փող. 12", **fields)
+    return record
+
+def write_snapshot(path, records):
+    with StreamingCsvWriter(str(path)) as writer:
+        for record in records:
+            writer.write(record)
+
+def read_delta(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+def test_columns_missing_from_this_run_are_not_changes(tmp_path):
+    # The previous run added parsed address and link columns this run does not produce
+    snapshot_path = tmp_path / "previous.csv"
+    write_snapshot(snapshot_path, [company(number, address_city="Երևան", website_status="ok") for number in (1, 2)])
+    diff = RecordDiff(load_records_csv(str(snapshot_path)), str(tmp_path / "delta.jsonl"))
+    diff.compare(company(1))
+    diff.compare(company(2, phones="+37410123456"))
+    diff.finish()
+
+    assert (diff.unchanged, diff.updated, diff.removed) == (1, 1, 0)
+    updated, = read_delta(tmp_path / "delta.jsonl")
+    assert updated["changes"] == {"phones": {"old": "", "new": "+37410123456"}}
+
+def test_columns_new_in_this_run_are_not_changes(tmp_path):
+    snapshot_path = tmp_path / "previous.csv"
+    write_snapshot(snapshot_path, [company(1)])
+    diff = RecordDiff(load_records_csv(str(snapshot_path)), str(tmp_path / "delta.jsonl"))
+    diff.compare(company(1, address_city="Երևան"))
+    diff.finish()
+
+    assert (diff.unchanged, diff.updated) == (1, 0)
@@ -0,0 +1,147 @@
+"""Crawls against MockSpyurServer with injected faults
+
+429 and 5xx responses and cut-off bodies must be retried, or counted as
+errors when the retries run out. They must never turn into blank records,
+cached pages, blank updates in the company store or removals in a delta.
+"""
+import io
+import os
+import json
+
+import pytest
+
+from spyur.api import scrape_all_categories
+from spyur.cdc import RecordDiff, load_records_csv
+from spyur.engine import CompanyScraper
+from spyur.fetching import PageCache
+from spyur.mockserver import FaultProfile, MockSite, MockSpyurServer
+from spyur.output import CompanyStore, StreamingCsvWriter
+from spyur.progress import CrawlProgress
+from spyur.scheduler import CrawlHistory, CrawlScheduler
+
+COMPANIES = 40
+
+@pytest.fixture
+def server():
+    with MockSpyurServer(MockSite(companies=COMPANIES)) as server:
+        yield server
+
+def crawl(server, faults=None, **options):
+    """Crawl the mock site's only category, returning (records, progress, engine)"""
+    server.faults = faults or FaultProfile()
+    progress = CrawlProgress()
+    options = {"verbose": False, "delay": 0, "retry_backoff": 0, "progress": progress, **options}
+    with CompanyScraper(**options) as engine:
+        list_url, = server.category_urls().values()
+        records = list(engine.iter_companies(list_url, "mock_1"))
+    return records, progress, engine
+
+def assert_no_blank_records(records):
+    assert all(record["name"].startswith("Mock Company") for record in records)
+    assert all(record["address"].startswith("Երևան") for record in records)
+
+@pytest.mark.parametrize("faults", [
+    FaultProfile(rate_429=0.15, rate_5xx=0.15, retry_after=0, seed=1),
+    FaultProfile(truncate=0.3, seed=3),
+], ids=["429-5xx", "truncated"])
+def test_faults_are_retried(server, faults):
+    records, progress, _ = crawl(server, faults)
+    assert_no_blank_records(records)
+    assert len(records) + progress.snapshot()["errors"].get("company", 0) == COMPANIES
+    assert "listing" not in progress.snapshot()["errors"]
+    assert sum(server.counts.get(fault, 0) for fault in ("429", "5xx", "truncated")) > 0
+
+def test_exhausted_retries_are_counted_not_emitted(server):
+    records, progress, engine = crawl(server, FaultProfile(rate_5xx=0.3, seed=2), max_retries=0)
+    errors = progress.snapshot()["errors"]
+    assert_no_blank_records(records)
+    assert errors.get("company", 0) > 0
+    assert errors.get("company", 0) == len(engine.failed_urls)
+    assert {record["source_url"] for record in records}.isdisjoint(engine.failed_urls)
+
+def test_error_pages_are_not_cached(server, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    crawl(server, FaultProfile(rate_429=0.2, rate_5xx=0.2, truncate=0.1, retry_after=0, seed=4), cache_dir=cache_dir, max_retries=1)
+    cache = PageCache(cache_dir)
+    entries = []
+    for entry in os.listdir(cache_dir):
+        with open(os.path.join(cache_dir, entry), "r", encoding="utf-8") as f:
+            entries.append((PageCache.parse_header(f.readline())[1], f.read()))
+    assert entries
+    assert all(status == 200 and "Mock Company" in html for status, html in entries)
+
+    # Entries from before statuses were recorded may hold error pages and are refetched
+    with open(cache.path_for("http://legacy/"), "w", encoding="utf-8") as f:
+        f.write("http://legacy/\n<html><body>Too Many Requests</body></html>")
+    assert cache.get("http://legacy/") is None
+    assert "http://legacy/" not in dict(cache)
+
+def test_failed_fetches_keep_stored_data(server, tmp_path):
+    snapshot_path = str(tmp_path / "previous.csv")
+    records, _, _ = crawl(server)
+    with StreamingCsvWriter(snapshot_path) as writer:
+        for record in records:
+            writer.write(record)
+    with CompanyStore(str(tmp_path / "companies.db")) as store:
+        for record in records:
+            store.write(record)
+
+        diff = RecordDiff(load_records_csv(snapshot_path), str(tmp_path / "delta.jsonl"))
+        records, _, engine = crawl(server, FaultProfile(rate_5xx=0.3, seed=2), max_retries=0)
+        for record in records:
+            diff.compare(record)
+            store.write(record)
+        for source_url in engine.failed_urls:
+            diff.skip(source_url)
+        diff.finish(crawled_categories_only=True)
+
+        assert engine.failed_urls
+        assert (diff.updated, diff.removed, diff.unchanged) == (0, 0, len(records))
+        assert len(store) == COMPANIES
+        assert all(store.get(source_url)["name"] for source_url in engine.failed_urls)
+
+def test_time_budget_reports_no_false_removals(server, tmp_path):
+    snapshot_path = str(tmp_path / "previous.csv")
+    records, _, _ = crawl(server)
+    with StreamingCsvWriter(snapshot_path) as writer:
+        for record in records:
+            writer.write(record)
+
+    server.faults = FaultProfile(latency=0.05)
+    delta_path = str(tmp_path / "delta.jsonl")
+    scheduler = CrawlScheduler(CrawlHistory(), time_budget=0.5)
+    with CompanyScraper(verbose=False, delay=0, scheduler=scheduler) as engine:
+        scrape_all_categories(output_path=str(tmp_path / "next.csv"), engine=engine, categories=server.category_urls(),
+                              previous_path=snapshot_path, delta_path=delta_path)
+    with open(delta_path, "r", encoding="utf-8") as f:
+        ops = [json.loads(line)["op"] for line in f]
+
+    assert scheduler.cut_short
+    assert 0 < len(load_records_csv(str(tmp_path / "next.csv"))) < COMPANIES
+    assert "removed" not in ops
+
+def test_failed_language_variant_keeps_the_others(server):
+    with CompanyScraper(verbose=False, delay=0, retry_backoff=0, languages=("am", "en", "ru")) as engine:
+        # Every /ru/ page fails
+        fetch = engine.fetch
+        engine.fetch = lambda url, hedge=False: fetch(url.replace("/ru/", "/ru-missing/"), hedge=hedge)
+        list_url, = server.category_urls().values()
+        records = list(engine.iter_companies(list_url, "mock_1", max_companies=5))
+
+    assert len(records) == 5
+    assert {record["source_url"] for record in records}.isdisjoint(engine.failed_urls)
+    for record in records:
+        assert "/am/" in record["source_url"]
+        assert record["name_am"].startswith("Mock Company") and record["name_en"].startswith("Mock Company")
+        assert (record["name_ru"], record["missing_languages"]) == ("", "ru")
+
+def test_quiet_crawl_leaves_the_status_line_alone(server, capsys):
+    progress = CrawlProgress()
+    status = io.StringIO()
+    progress.start_status_line(interval=0.01, stream=status)
+    progress.message("🔎 Crawling")
+    crawl(server, FaultProfile(rate_429=0.2, retry_after=0, seed=1), progress=progress)
+    progress.close()
+
+    assert capsys.readouterr().out == "🔎 Crawling\n"
+    assert "\r\033[K" in status.getvalue()
@@ -0,0 +1,186 @@
+"""Golden-file regression tests for company page extraction: output and speed
+
+The pages in golden/pages are hand-written in spyur.am's markup, one per
+extraction path; they are not recorded from the live site. Every page is
+extracted and compared field by field with golden/expected.json. Some of
+the frozen output is known to be wrong; golden/known_bugs.json lists those
+fields with the value they should have, and their tests are strict xfails
+that start failing once the bug is fixed.
+
+The speed checks are opt-in (SPYUR_PERF=1), so a plain pytest run does not
+depend on machine load. Each page is wrapped in site chrome the size of a
+real company page, and extraction and the cleaners are timed many times
+with the memo caches cleared; the fastest run is kept, which filters out
+scheduler noise. Timings are stored in units of a fixed HTML parse, so a
+baseline recorded on one machine holds on another.
+
+After an intended change, rewrite the files and review the diff:
+
+    SPYUR_UPDATE_GOLDEN=1 python -m pytest tests                # expected.json
+    SPYUR_PERF=1 SPYUR_UPDATE_BASELINE=1 python -m pytest tests  # baseline.json
+
+SPYUR_PERF_TOLERANCE (default 1.5) is the allowed ratio to the baseline.
+"""
+import os
+import re
+import json
+import time
+
+import pytest
+from bs4 import BeautifulSoup
+
+from spyur.cleaning import clean_address, clean_director_name
+from spyur.engine import CompanyScraper
+from spyur.memo import clear_memo_caches
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+PAGES_DIR = os.path.join(GOLDEN_DIR, "pages")
+EXPECTED_PATH = os.path.join(GOLDEN_DIR, "expected.json")
+BASELINE_PATH = os.path.join(GOLDEN_DIR, "baseline.json")
+KNOWN_BUGS_PATH = os.path.join(GOLDEN_DIR, "known_bugs.json")
+PAGE_BUDGET = 10  # extraction of one page may cost this many calibration parses of a page its size
+REPEAT = 15
+PERF = bool(os.environ.get("SPYUR_PERF"))
+TOLERANCE = float(os.environ.get("SPYUR_PERF_TOLERANCE", "1.5"))
+
+# Header navigation, footer and scripts bring a page to the ~80 KB of a spyur.am company page
+SITE_HEADER = "<header><ul>" + "".join(
+    f'<li><a href="/am/yellow_pages/?type=bd&amp;yp_cat2=l2.{i // 25}.{i % 25}">Բաժին {i}</a></li>' for i in range(500)) + "</ul></header>"
+SITE_FOOTER = ("<footer>" + "<p>Սփյուռ տեղեկատվական համակարգ, բոլոր իրավունքները պաշտպանված են</p>" * 100 + "</footer>"
+               + "<script>" + "window.dataLayer.push({event: 'view'});" * 400 + "</script>")
+
+def page_url(name):
+    return f"https://www.spyur.am/{'en' if name.endswith('_en') else 'am'}/companies/{name.replace('_', '-')}/"
+
+def load_pages():
+    pages = {}
+    for filename in sorted(os.listdir(PAGES_DIR)):
+        if filename.endswith(".html"):
+            with open(os.path.join(PAGES_DIR, filename), "r", encoding="utf-8") as f:
+                pages[filename[:-5]] = f.read()
+    return pages
+
+def load_json(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def write_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+
+def realistic_page(html):
+    """Wrap a hand-written page in site chrome the size of a real company page"""
+    html = re.sub(r'<body[^>]*>', lambda match: match.group(0) + SITE_HEADER, html, count=1)
+    return html.replace("</body>", SITE_FOOTER + "</body>", 1)
+
+def fastest(func, repeat=REPEAT):
+    """Run func repeat times and return the fastest run in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def calibration_seconds():
+    """Time a fixed HTML parse and selection, the unit all timings are stored in"""
+    html = realistic_page("<html><body><div class='company-info'>" + "<div class='info-line'><span>Ղեկավար</span></div>" * 50
+                          + "</div></body></html>")
+    return fastest(lambda: BeautifulSoup(html, "html.parser").select("div.info-line span"))
+
+PAGES = load_pages()
+KNOWN_BUGS = load_json(KNOWN_BUGS_PATH) or {}
+
+@pytest.fixture(scope="module")
+def engine():
+    with CompanyScraper(verbose=False) as engine:
+        yield engine
+
+@pytest.fixture(scope="module")
+def expected(engine):
+    if os.environ.get("SPYUR_UPDATE_GOLDEN"):
+        write_json(EXPECTED_PATH, {name: engine.extract_from_html(html, page_url(name)) for name, html in PAGES.items()})
+    expected = load_json(EXPECTED_PATH)
+    assert expected is not None, "golden/expected.json is missing; run with SPYUR_UPDATE_GOLDEN=1"
+    return expected
+
+@pytest.fixture(scope="module")
+def timings(engine):
+    """Fastest extraction time per page, its sum over all pages and the fastest cleaner pass, in calibration units"""
+    if not PERF:
+        pytest.skip("speed checks are opt-in; run with SPYUR_PERF=1")
+    per_page = {}
+    for name, html in PAGES.items():
+        html = realistic_page(html)
+
+        def extract():
+            clear_memo_caches()
+            engine.extract_from_html(html, page_url(name))
+
+        per_page[name] = fastest(extract)
+
+    # The raw cleaners, fed the director and address text of every page
+    inputs = []
+    for name, html in PAGES.items():
+        for label in re.findall(r'<span class="info-value">(.*?)</span>', html):
+            inputs.append((clean_director_name.__wrapped__, label))
+        for block in re.findall(r'<div class="(?:address_block|contacts_info)">(.*?)</div>', html, re.S):
+            inputs.append((clean_address.__wrapped__, re.sub(r'<[^>]+>', ' ', block)))
+
+    def clean():
+        for cleaner, text in inputs:
+            cleaner(text)
+
+    cleaners = fastest(clean, REPEAT * 4)
+
+    unit = calibration_seconds()
+    return {
+        "pages": {name: seconds / unit for name, seconds in per_page.items()},
+        "extract": sum(per_page.values()) / unit,
+        "cleaners": cleaners / unit,
+    }
+
+@pytest.fixture(scope="module")
+def baseline(timings):
+    measured = {"extract": timings["extract"], "cleaners": timings["cleaners"]}
+    if os.environ.get("SPYUR_UPDATE_BASELINE"):
+        write_json(BASELINE_PATH, measured)
+    stored = load_json(BASELINE_PATH)
+    if stored is None:
+        pytest.skip("golden/baseline.json is missing; run with SPYUR_UPDATE_BASELINE=1")
+    return stored, measured
+
+def test_golden_pages_are_all_recorded(expected):
+    assert sorted(expected) == sorted(PAGES)
+
+@pytest.mark.parametrize("name", sorted(PAGES))
+def test_extracted_record_matches_golden(engine, expected, name):
+    record = engine.extract_from_html(PAGES[name], page_url(name))
+    golden = expected[name]
+    for field in sorted(set(record) | set(golden)):
+        assert record.get(field) == golden.get(field), f"{name}: field {field!r} changed"
+
+KNOWN_BUG_FIELDS = sorted((name, field) for name, fields in KNOWN_BUGS.items() for field in fields)
+
+@pytest.mark.parametrize("name, field", KNOWN_BUG_FIELDS)
+def test_known_bug_is_frozen_in_golden(expected, name, field):
+    assert expected[name][field] == KNOWN_BUGS[name][field]["frozen"], f"{name}: update known_bugs.json for {field!r}"
+
+@pytest.mark.parametrize("name, field", KNOWN_BUG_FIELDS)
+@pytest.mark.xfail(strict=True, reason="known extraction bug frozen in expected.json")
+def test_known_bug_is_fixed(engine, name, field):
+    assert engine.extract_from_html(PAGES[name], page_url(name))[field] == KNOWN_BUGS[name][field]["correct"]
+
+@pytest.mark.parametrize("name", sorted(PAGES))
+def test_page_within_parse_budget(timings, name):
+    assert timings["pages"][name] < PAGE_BUDGET, f"{name}: {timings['pages'][name]:.1f}x the calibration parse"
+
+@pytest.mark.parametrize("key", ["extract", "cleaners"])
+def test_speed_within_baseline(baseline, key):
+    stored, measured = baseline
+    assert measured[key] <= stored[key] * TOLERANCE, (
+        f"{key} is {measured[key] / stored[key]:.2f}x the baseline (tolerance {TOLERANCE}x)")
@@ -0,0 +1,43 @@
+"""LinkValidator result caching, malformed links and background checking"""
+import json
+import socket
+import time
+
+from spyur.links import LinkValidator
+
+def closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def test_malformed_url_is_recorded_not_raised():
+    validator = LinkValidator()
+    assert validator.check("http://[abc/x")["status"] == "invalid_url"
+    record = validator.validate({"website": "http://[abc/x", "social_media": "https://[::1"})
+    assert record["website_status"] == "invalid_url"
+
+def test_connection_errors_are_rechecked_and_not_saved(tmp_path):
+    cache_path = str(tmp_path / "links.json")
+    url = f"http://127.0.0.1:{closed_port()}/"
+    validator = LinkValidator(timeout=1, cache_path=cache_path, failure_ttl=0)
+    first = validator.check(url)
+    assert first["status"] == "connection_error"
+    assert validator.check(url) is not first
+    validator.close()
+    with open(cache_path, "r", encoding="utf-8") as f:
+        assert url not in json.load(f)
+
+def test_slow_checks_do_not_hold_back_the_crawl():
+    validator = LinkValidator(workers=2)
+    validator.validate = lambda record: time.sleep(0.2) or record
+    produced = []
+
+    def crawl():
+        for number in range(20):
+            produced.append(time.monotonic())
+            yield {"number": number}
+
+    started = time.monotonic()
+    records = list(validator.iter_validated(crawl()))
+    assert [record["number"] for record in records] == list(range(20))
+    assert produced[-1] - started < 0.5
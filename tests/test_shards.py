@@ -0,0 +1,29 @@
+"""Shard planning and the --shard and --plan-shards options"""
+import pytest
+
+from spyur.cli import build_parser
+from spyur.taxonomy import plan_shards
+
+CATEGORIES = {f"category_{i}": {"url": f"http://mock/{i}", "pages": i, "companies": 10 * i} for i in range(1, 8)}
+
+def test_every_category_lands_in_one_shard():
+    plan = plan_shards(CATEGORIES, 3)
+    assert [shard["shard"] for shard in plan] == [1, 2, 3]
+    assert sorted(name for shard in plan for name in shard["categories"]) == sorted(CATEGORIES)
+
+def test_zero_shards_is_rejected():
+    with pytest.raises(ValueError):
+        plan_shards(CATEGORIES, 0)
+
+def test_valid_shard_spec_is_parsed():
+    assert build_parser().parse_args(["--shard", "2/8"]).shard == (2, 8)
+
+@pytest.mark.parametrize("argv", [
+    ["--shard", "3/2"], ["--shard", "a/b"], ["--shard", "0/0"], ["--shard", "0/4"], ["--shard", "2"],
+    ["--plan-shards", "0"], ["--plan-shards", "-1"],
+])
+def test_bad_shard_options_are_usage_errors(argv, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        build_parser().parse_args(argv)
+    assert exit_info.value.code == 2
+    assert "usage:" in capsys.readouterr().err
@@ -0,0 +1,30 @@
+"""ConcurrencyTuner ramping, backing off and stopping where the request delay binds"""
+from spyur.tuning import ConcurrencyTuner
+
+def run_windows(tuner, windows, latency, ok=True):
+    for _ in range(windows * tuner.window):
+        tuner.observe(latency, ok=ok)
+
+def test_ramps_up_without_delay():
+    tuner = ConcurrencyTuner(initial=2, max_workers=8, window=10, verbose=False)
+    run_windows(tuner, 10, 0.2)
+    assert tuner.workers == 8
+    assert not tuner.delay_bound
+
+def test_backs_off_on_errors():
+    tuner = ConcurrencyTuner(initial=8, window=10, verbose=False)
+    run_windows(tuner, 1, 0.2, ok=False)
+    assert tuner.workers == 4
+
+def test_stops_where_the_delay_binds(capsys):
+    # 0.5s fetches one second apart: one worker keeps the rate limiter busy
+    tuner = ConcurrencyTuner(initial=2, max_workers=16, window=10, delay=1.0)
+    run_windows(tuner, 10, 0.5)
+    assert tuner.workers == 1
+    assert tuner.delay_bound
+    assert capsys.readouterr().out.count("limits throughput") == 1
+
+def test_delay_allows_latency_over_delay_workers():
+    tuner = ConcurrencyTuner(initial=1, max_workers=16, window=10, verbose=False, delay=0.5)
+    run_windows(tuner, 10, 2.0)
+    assert tuner.workers == 4